@@ -1,9 +1,11 @@
 """Main application module for the Speaking Meeting Bot API."""
 
 import argparse
+import asyncio
 import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Tuple
 
 from fastapi import FastAPI, Request, HTTPException, status
@@ -58,6 +60,34 @@ async def api_key_middleware(request: Request, call_next):
     return await call_next(request)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure the serving loop, prewarm Pipecat and release shared clients."""
+    # Run tasks eagerly so coroutines that finish without suspending (cached
+    # registry lookups, already-buffered frames) skip a trip through the
+    # scheduler. eager_task_factory only exists on Python 3.12+.
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
+    from core.connection import reap_pipecat_processes
+    from core.process import pipecat_pool
+
+    # Prewarm Pipecat workers off the loop so startup isn't held up
+    warm_task = asyncio.create_task(asyncio.to_thread(pipecat_pool.warm))
+    reaper_task = asyncio.create_task(reap_pipecat_processes())
+    yield
+    from app.services.summary_service import summary_service
+
+    from app.services.image_service import image_service
+
+    reaper_task.cancel()
+    await summary_service.aclose()
+    await image_service.uploader.close()
+    await warm_task
+    pipecat_pool.shutdown()
+
+
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -76,6 +106,7 @@ def create_app() -> FastAPI:
         openapi_url="/openapi.json",  # Explicitly set the OpenAPI schema URL
         docs_url="/docs",  # Swagger UI path
         # redoc_url="/redoc",  # Explicitly set the ReDoc URL
+        lifespan=lifespan,
     )
 
     # Add API key middleware
@@ -291,6 +322,29 @@ def create_app() -> FastAPI:
     return app
 
 
+# Largest WebSocket message accepted; audio frames and event payloads are small.
+# The uvicorn commands in the Dockerfile, README and CLAUDE.md pass the same
+# --ws-max-size and --ws-per-message-deflate settings; keep them in sync.
+WS_MAX_MESSAGE_BYTES = 1024 * 1024
+
+
+def _select_event_loop() -> str:
+    """Pick the uvicorn event loop implementation.
+
+    uvloop is used when it is installed and the platform supports it; it
+    cuts per-message overhead on the WebSocket audio relay. Windows (and
+    environments without uvloop) fall back to the stock asyncio loop.
+    """
+    if sys.platform == "win32":
+        return "asyncio"
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        logger.info("uvloop not installed, using the default asyncio event loop")
+        return "asyncio"
+    return "uvloop"
+
+
 def start_server(host: str = "0.0.0.0", port: int = 7014, local_dev: bool = False):
     """Start the Uvicorn server for the FastAPI application."""
     # Validate port
@@ -429,6 +483,11 @@ def start_server(host: str = "0.0.0.0", port: int = 7014, local_dev: bool = Fals
         host=host,
         port=server_port,
         reload=local_dev,
+        loop=_select_event_loop(),
+        # Audio is raw PCM in small frames: per-message deflate only
+        # costs CPU, and the default 16 MiB message cap is far above need
+        ws_per_message_deflate=False,
+        ws_max_size=WS_MAX_MESSAGE_BYTES,
     )
 
 
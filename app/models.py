@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # =============================================================================
@@ -127,6 +127,9 @@ class Session(BaseModel):
     participants: List[Participant] = Field(
         default_factory=list, description="Session participants"
     )
+    consented_count: int = Field(
+        default=0, description="Number of participants who have consented"
+    )
     facilitator: FacilitatorConfig = Field(
         default_factory=FacilitatorConfig, description="Facilitator configuration"
     )
@@ -303,6 +306,32 @@ class SessionEventPayload(BaseModel):
     )
 
 
+class FacilitatorSettingsUpdate(BaseModel):
+    """Mid-session facilitator settings sent over the session events socket.
+
+    Only the fields present in the message are changed. Fields are accepted
+    under the frontend's camelCase names as well as their snake_case names.
+    """
+
+    model_config = ConfigDict(extra="forbid", strict=True, populate_by_name=True)
+
+    interrupt_authority: Optional[bool] = Field(
+        None,
+        alias="interruptAuthority",
+        description="Facilitator may pause speakers to clarify",
+    )
+    direct_inquiry: Optional[bool] = Field(
+        None,
+        alias="directInquiry",
+        description="Asks challenging, data-driven questions",
+    )
+    silence_detection: Optional[bool] = Field(
+        None,
+        alias="silenceDetection",
+        description="Nudges room if silence > 20s",
+    )
+
+
 class PauseResumeResponse(BaseModel):
     """Response model for pause/resume actions."""
 
@@ -324,8 +353,13 @@ class SessionListResponse(BaseModel):
     """Response for listing sessions."""
 
     sessions: List[Session] = Field(..., description="List of sessions")
-    total: int = Field(..., description="Total number of sessions")
+    total: Optional[int] = Field(
+        None, description="Total number of sessions (offset pagination only)"
+    )
     hasMore: bool = Field(..., description="Whether there are more sessions")
+    nextCursor: Optional[str] = Field(
+        None, description="Cursor for the next page, or null on the last page"
+    )
 
 
 # =============================================================================
@@ -1,6 +1,7 @@
 """API routes for the Speaking Meeting Bot application."""
 
 import asyncio
+import sys
 import uuid
 from datetime import datetime
 from io import BytesIO
@@ -31,8 +32,21 @@ from app.models import (
 )
 from app.services.image_service import image_service
 from config.persona_utils import persona_manager
-from core.connection import MEETING_DETAILS, PIPECAT_PROCESSES, registry
-from core.process import start_pipecat_process, terminate_process_gracefully
+from core.connection import (
+    MEETING_DETAILS,
+    MeetingDetail,
+    find_client_id_by_meetingbaas_bot_id,
+    pop_pipecat_process,
+    register_pipecat_process,
+    registry,
+    remove_meeting_details,
+    set_meeting_bot_id,
+)
+from core.process import (
+    PIPECAT_WS_TEMPLATE,
+    async_terminate,
+    start_pipecat_process,
+)
 from core.router import router as message_router
 
 # Import from the app module (will be defined in __init__.py)
@@ -114,7 +128,7 @@ async def join_meeting(request: BotRequest, client_request: Request):
     )
 
     # Generate a unique client ID for this bot
-    bot_client_id = str(uuid.uuid4())
+    bot_client_id = sys.intern(str(uuid.uuid4()))
 
     # If we're in local dev mode and we have a temp client ID, update the mapping
     if LOCAL_DEV_MODE and temp_client_id:
@@ -278,16 +292,14 @@ async def join_meeting(request: BotRequest, client_request: Request):
     logger.info(f"  Is Temporary: {resolved_persona_data.get('is_temporary')}")
 
     # Store all relevant details in MEETING_DETAILS dictionary
-    # Note: Index 5 stores the full resolved_persona_data for use by websocket handler
-    MEETING_DETAILS[bot_client_id] = (
-        request.meeting_url,
-        resolved_persona_data.get(
-            "name", persona_name_for_logging
-        ),  # Use display name from resolved data
-        None,  # meetingbaas_bot_id, will be set after creation
-        request.enable_tools,
-        streaming_audio_frequency,
-        resolved_persona_data,  # Full persona data for Pipecat subprocess
+    MEETING_DETAILS[bot_client_id] = MeetingDetail(
+        meeting_url=request.meeting_url,
+        # Use display name from resolved data
+        persona_name=resolved_persona_data.get("name", persona_name_for_logging),
+        meetingbaas_bot_id=None,  # Set after creation
+        enable_tools=request.enable_tools,
+        streaming_audio_frequency=streaming_audio_frequency,
+        persona_data=resolved_persona_data,  # Full persona data for Pipecat subprocess
     )
 
     # Get image URL: Prioritize request.bot_image > persona_data.image > generate_image (if custom prompt and details derived)
@@ -376,7 +388,9 @@ async def join_meeting(request: BotRequest, client_request: Request):
     # Use persona display name from resolved_persona_data for MeetingBaas API call
     # Use the websocket_url as the webhook_url (same base URL, different endpoint)
     webhook_url = f"{websocket_url}/webhook"
-    meetingbaas_bot_id = create_meeting_bot(
+    # The MeetingBaas client is blocking, so keep it off the event loop
+    meetingbaas_bot_id = await asyncio.to_thread(
+        create_meeting_bot,
         meeting_url=request.meeting_url,
         websocket_url=websocket_url,
         bot_id=bot_client_id,
@@ -393,10 +407,7 @@ async def join_meeting(request: BotRequest, client_request: Request):
 
     if meetingbaas_bot_id:
         # Update the meetingbaas_bot_id in MEETING_DETAILS
-        # Convert tuple to list to allow assignment
-        details = list(MEETING_DETAILS[bot_client_id])
-        details[2] = meetingbaas_bot_id
-        MEETING_DETAILS[bot_client_id] = tuple(details)
+        set_meeting_bot_id(bot_client_id, meetingbaas_bot_id)
 
         # Log the client_id for internal reference
         logger.info(f"Bot created with MeetingBaas bot_id: {meetingbaas_bot_id}")
@@ -404,7 +415,7 @@ async def join_meeting(request: BotRequest, client_request: Request):
 
         # Start the Pipecat process as a subprocess
         # The Pipecat process should connect to our LOCAL WebSocket server, not the external one
-        pipecat_websocket_url = f"ws://localhost:7014/pipecat/{bot_client_id}"
+        pipecat_websocket_url = PIPECAT_WS_TEMPLATE.format(bot_client_id)
         process = start_pipecat_process(
             client_id=bot_client_id,
             websocket_url=pipecat_websocket_url,  # Use internal URL, not external
@@ -417,14 +428,13 @@ async def join_meeting(request: BotRequest, client_request: Request):
         )
 
         # Store the process for later termination
-        PIPECAT_PROCESSES[bot_client_id] = process
+        register_pipecat_process(bot_client_id, process)
 
         # Return bot_id and client_id in the response
         return JoinResponse(bot_id=meetingbaas_bot_id, client_id=bot_client_id)
     else:
         # Clean up MEETING_DETAILS if bot creation failed
-        if bot_client_id in MEETING_DETAILS:
-            MEETING_DETAILS.pop(bot_client_id)
+        remove_meeting_details(bot_client_id)
 
         return JSONResponse(
             content={
@@ -477,17 +487,11 @@ async def leave_bot(
 
     # Use the path parameter bot_id if provided, otherwise use request.bot_id
     meetingbaas_bot_id = bot_id or request.bot_id
-    client_id = None
+    client_id = find_client_id_by_meetingbaas_bot_id(meetingbaas_bot_id)
 
-    # Look through MEETING_DETAILS to find the client ID for this bot ID
-    for cid, details in MEETING_DETAILS.items():
-        # Check if the stored meetingbaas_bot_id matches
-        if details[2] == meetingbaas_bot_id:  # Accessing tuple element by index
-            client_id = cid
-            logger.info(f"Found client ID {client_id} for bot ID {meetingbaas_bot_id}")
-            break
-
-    if not client_id:
+    if client_id:
+        logger.info(f"Found client ID {client_id} for bot ID {meetingbaas_bot_id}")
+    else:
         logger.warning(f"No client ID found for bot ID {meetingbaas_bot_id}")
 
     success = True
@@ -495,7 +499,8 @@ async def leave_bot(
     # 1. Call MeetingBaas API to make the bot leave
     if meetingbaas_bot_id:
         logger.info(f"Removing bot with ID: {meetingbaas_bot_id} from MeetingBaas API")
-        result = leave_meeting_bot(
+        result = await asyncio.to_thread(
+            leave_meeting_bot,
             bot_id=meetingbaas_bot_id,
             api_key=api_key,
         )
@@ -513,7 +518,7 @@ async def leave_bot(
         message_router.mark_closing(client_id)
 
         # Close Pipecat WebSocket first
-        if client_id in registry.pipecat_connections:
+        if registry.get_pipecat(client_id) is not None:
             try:
                 await registry.disconnect(client_id, is_pipecat=True)
                 logger.info(f"Closed Pipecat WebSocket for client {client_id}")
@@ -542,11 +547,11 @@ async def leave_bot(
         await asyncio.sleep(0.5)
 
     # 3. Terminate the Pipecat process after WebSockets are closed
-    if client_id and client_id in PIPECAT_PROCESSES:
-        process = PIPECAT_PROCESSES[client_id]
-        if process and process.poll() is None:  # If process is still running
+    process = pop_pipecat_process(client_id) if client_id else None
+    if process is not None:
+        if process.poll() is None:  # If process is still running
             try:
-                if terminate_process_gracefully(process, timeout=3.0):
+                if await async_terminate(process, timeout=3.0):
                     logger.info(
                         f"Gracefully terminated Pipecat process for client {client_id}"
                     )
@@ -558,12 +563,8 @@ async def leave_bot(
                 success = False
                 logger.error(f"Error terminating Pipecat process: {e}")
 
-        # Remove from our storage
-        PIPECAT_PROCESSES.pop(client_id, None)
-
         # Clean up meeting details
-        if client_id in MEETING_DETAILS:
-            MEETING_DETAILS.pop(client_id, None)
+        remove_meeting_details(client_id)
 
         # Release ngrok URL if in local dev mode
         if LOCAL_DEV_MODE and client_id:
@@ -728,30 +729,50 @@ async def create_session(
 async def list_sessions(
     status_filter: Optional[str] = None,
     limit: int = 50,
-    offset: int = 0,
+    cursor: Optional[str] = None,
+    offset: Optional[int] = None,
 ):
     """
-    List all sessions, optionally filtered by status.
+    List sessions newest first, optionally filtered by status.
+
+    Pagination is cursor-based: pass the returned nextCursor as cursor to
+    fetch the next page. The offset parameter is deprecated and only kept
+    for jump-to-page admin views; it is the only mode that returns total.
 
     Args:
         status_filter: Optional status to filter by (e.g., "draft", "in_progress").
         limit: Maximum number of sessions to return (default 50).
-        offset: Number of sessions to skip for pagination (default 0).
+        cursor: Opaque cursor from a previous response's nextCursor.
+        offset: Deprecated. Number of sessions to skip for pagination.
 
     Returns:
-        Object with sessions array, total count, and hasMore flag.
+        Object with sessions array, hasMore flag, nextCursor, and total
+        (offset mode only).
     """
-    sessions = session_service.list_sessions(status=status_filter)
+    if offset is not None:
+        page = session_service.list_sessions_by_offset(
+            status=status_filter, limit=limit, offset=offset
+        )
+        return SessionListResponse(
+            sessions=page["sessions"],
+            total=page["total"],
+            hasMore=page["has_more"],
+        )
 
-    # Apply pagination
-    total = len(sessions)
-    paginated_sessions = sessions[offset : offset + limit]
-    has_more = (offset + limit) < total
+    try:
+        page = session_service.list_sessions(
+            status=status_filter, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
     return SessionListResponse(
-        sessions=paginated_sessions,
-        total=total,
-        hasMore=has_more,
+        sessions=page["sessions"],
+        hasMore=page["has_more"],
+        nextCursor=page["next_cursor"],
     )
 
 
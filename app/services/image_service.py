@@ -3,7 +3,6 @@
 from typing import Optional
 from loguru import logger
 from PIL import Image
-import requests
 from io import BytesIO
 import os
 import replicate
@@ -72,22 +71,14 @@ class ImageService:
             else:
                 raise ValueError(f"Unexpected output format from Replicate: {output}")
 
-            # Download the image
-            response = requests.get(image_url)
-            if response.status_code != 200:
-                raise ValueError(
-                    f"Failed to download image. Status code: {response.status_code}"
-                )
-
-            # Save to temporary file
+            # Stream the image straight to a temporary file
             temp_path = f"{name}.png"
-            with open(temp_path, "wb") as f:
-                f.write(response.content)
+            status = await self.uploader.download_file(image_url, Path(temp_path))
+            if status != 200:
+                raise ValueError(f"Failed to download image. Status code: {status}")
 
             # Upload to UTFS
-            file_url = await asyncio.to_thread(
-                self.uploader.upload_file, Path(temp_path)
-            )
+            file_url = await self.uploader.upload_file(Path(temp_path))
 
             # Clean up temporary file
             try:
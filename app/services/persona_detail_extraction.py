@@ -4,6 +4,9 @@ import os
 from typing import Any, Dict, Optional
 from loguru import logger
 
+# OpenAI API key from environment
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
 
 async def extract_persona_details_from_prompt(
     prompt_text: str,
@@ -26,7 +29,7 @@ Extract the information in the following JSON format. If a field cannot be deter
 
 JSON Output:"""
 
-    api_key = os.getenv("OPENAI_API_KEY")
+    api_key = OPENAI_API_KEY
     if not api_key:
         logger.error("OPENAI_API_KEY environment variable not set.")
         return None
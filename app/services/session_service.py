@@ -3,11 +3,15 @@
 Handles session lifecycle, state transitions, and business logic.
 """
 
+import asyncio
+import base64
+import binascii
 import json
 import secrets
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -23,6 +27,8 @@ from core.session_store import (
     get_session as store_get_session,
     get_session_by_invite_token as store_get_session_by_token,
     list_sessions as store_list_sessions,
+    count_sessions as store_count_sessions,
+    list_sessions_page as store_list_sessions_page,
     get_balance_snapshot,
     get_intervention_history,
     pause_session_timer,
@@ -41,9 +47,27 @@ ALLOWED_DURATIONS = {15, 30, 45, 60}
 MEET_URL_PATTERN = re.compile(r"^https://meet\.google\.com/[a-z0-9-]+(?:\?.*)?$", re.IGNORECASE)
 
 
+def _urlsafe(raw: bytes) -> str:
+    """Encode random bytes like secrets.token_urlsafe does."""
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
 class SessionService:
     """Manages session lifecycle and state transitions."""
 
+    def __init__(self) -> None:
+        # VoiceUtils loads every persona from disk on construction, so build it
+        # once on first use instead of on every session start
+        self._voice_utils = None
+
+    def _get_voice_utils(self):
+        if self._voice_utils is None:
+            # Import here to avoid circular imports
+            from config.voice_utils import VoiceUtils
+
+            self._voice_utils = VoiceUtils()
+        return self._voice_utils
+
     def _normalize_meeting_url(self, meeting_url: Optional[str]) -> Optional[str]:
         if meeting_url is None:
             return None
@@ -147,9 +171,11 @@ class SessionService:
         self._validate_duration(duration_minutes)
         meeting_url = self._validate_meeting_url(platform, meeting_url)
 
-        session_id = secrets.token_urlsafe(16)
-        invite_token = secrets.token_urlsafe(32)
-        creator_id = secrets.token_urlsafe(8)
+        # One urandom read covers every identifier minted for this session
+        entropy = secrets.token_bytes(64)
+        session_id = _urlsafe(entropy[:16])
+        invite_token = _urlsafe(entropy[16:48])
+        creator_id = _urlsafe(entropy[48:56])
 
         if facilitator_config is None:
             facilitator_config = FacilitatorConfig()
@@ -166,7 +192,7 @@ class SessionService:
 
         # If skip_consent, add a test partner and set status to READY
         if skip_consent:
-            partner_id = secrets.token_urlsafe(8)
+            partner_id = _urlsafe(entropy[56:64])
             participants.append(
                 Participant(
                     id=partner_id,
@@ -192,11 +218,13 @@ class SessionService:
             scheduled_at=scheduled_at,
             status=initial_status,
             participants=participants,
+            consented_count=len(participants),  # Everyone added here has consented
             facilitator=facilitator_config,
-            created_at=datetime.utcnow().isoformat(),
+            created_at=datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
             invite_token=invite_token,
         )
 
+        # Status is final before the first write, so creation costs one store write
         store_create_session(session)
         logger.info(f"Created session {session_id} for {creator_name}")
 
@@ -224,16 +252,70 @@ class SessionService:
         """
         return store_get_session_by_token(invite_token)
 
-    def list_sessions(self, status: Optional[str] = None) -> List[Session]:
-        """List all sessions, optionally filtered by status.
+    def list_sessions(
+        self,
+        status: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """List one page of sessions, newest first, using cursor pagination.
+
+        Args:
+            status: Optional status filter (e.g., "draft", "in_progress").
+            limit: Maximum number of sessions to return.
+            cursor: Opaque cursor returned as next_cursor by a previous call.
+
+        Returns:
+            Dict with sessions, has_more, and next_cursor (None on last page).
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        before = self._decode_cursor(cursor) if cursor else None
+        sessions, has_more = store_list_sessions_page(status, limit, before)
+
+        next_cursor = None
+        if has_more and sessions:
+            next_cursor = self._encode_cursor(sessions[-1])
+
+        return {
+            "sessions": sessions,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        }
+
+    def list_sessions_by_offset(
+        self, status: Optional[str] = None, limit: int = 50, offset: int = 0
+    ) -> Dict[str, Any]:
+        """List sessions by offset (deprecated, kept for jump-to-page UIs).
+
+        Prefer list_sessions; deep offsets still walk the skipped index keys.
 
         Args:
             status: Optional status filter (e.g., "draft", "in_progress").
+            limit: Maximum number of sessions to return.
+            offset: Number of sessions to skip.
 
         Returns:
-            List of Session objects matching the filter.
+            Dict with sessions, total, and has_more.
         """
-        return store_list_sessions(status)
+        total = store_count_sessions(status)
+        return {
+            "sessions": store_list_sessions(status, limit=limit, offset=offset),
+            "total": total,
+            "has_more": (offset + limit) < total,
+        }
+
+    def _encode_cursor(self, session: Session) -> str:
+        raw = json.dumps([session.created_at, session.id]).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    def _decode_cursor(self, cursor: str) -> Tuple[str, str]:
+        try:
+            created_at, session_id = json.loads(base64.urlsafe_b64decode(cursor))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            raise ValueError("Invalid pagination cursor")
+        return (str(created_at), str(session_id))
 
     async def record_consent(
         self,
@@ -272,8 +354,9 @@ class SessionService:
                     consented=True,
                 )
             )
+            session.consented_count += 1
             # Check if both consented
-            if all(p.consented for p in session.participants):
+            if session.consented_count >= 2:
                 session.status = SessionStatus.READY
                 logger.info(f"Session {session_id} is ready - both parties consented")
         else:
@@ -321,13 +404,18 @@ class SessionService:
 
         # Import dependencies here to avoid circular imports
         from config.persona_utils import persona_manager
-        from config.voice_utils import VoiceUtils
-        from core.connection import MEETING_DETAILS, PIPECAT_PROCESSES
-        from core.process import start_pipecat_process
+        from core.connection import (
+            MEETING_DETAILS,
+            MeetingDetail,
+            register_pipecat_process,
+            remove_meeting_details,
+            set_meeting_bot_id,
+        )
+        from core.process import PIPECAT_WS_TEMPLATE, start_pipecat_process
         from scripts.meetingbaas_api import create_meeting_bot
 
         # Generate unique client ID for this session
-        client_id = secrets.token_urlsafe(16)
+        client_id = sys.intern(secrets.token_urlsafe(16))
 
         # Load persona based on facilitator configuration
         persona_name = session.facilitator.persona.value
@@ -350,8 +438,7 @@ class SessionService:
 
         # Resolve voice ID if not present
         if not persona_data.get("cartesia_voice_id"):
-            voice_utils = VoiceUtils()
-            cartesia_voice_id = await voice_utils.match_voice_to_persona(
+            cartesia_voice_id = await self._get_voice_utils().match_voice_to_persona(
                 persona_details=persona_data
             )
             persona_data["cartesia_voice_id"] = cartesia_voice_id
@@ -370,18 +457,20 @@ class SessionService:
         streaming_audio_frequency = "16khz"
 
         # Store meeting details for WebSocket handler
-        MEETING_DETAILS[client_id] = (
-            meeting_url,
-            persona_data.get("name", persona_name),
-            None,  # meetingbaas_bot_id, will be set after creation
-            False,  # enable_tools - disabled for Diadi facilitation
-            streaming_audio_frequency,
-            persona_data,  # Full persona data for Pipecat subprocess
+        MEETING_DETAILS[client_id] = MeetingDetail(
+            meeting_url=meeting_url,
+            persona_name=persona_data.get("name", persona_name),
+            meetingbaas_bot_id=None,  # Set after creation
+            enable_tools=False,  # Disabled for Diadi facilitation
+            streaming_audio_frequency=streaming_audio_frequency,
+            persona_data=persona_data,  # Full persona data for Pipecat subprocess
         )
 
         # Create MeetingBaas bot
         webhook_url = f"{websocket_base_url}/webhook"
-        meetingbaas_bot_id = create_meeting_bot(
+        # The MeetingBaas client is blocking, so keep it off the event loop
+        meetingbaas_bot_id = await asyncio.to_thread(
+            create_meeting_bot,
             meeting_url=meeting_url,
             websocket_url=websocket_base_url,
             bot_id=client_id,
@@ -400,19 +489,17 @@ class SessionService:
 
         if not meetingbaas_bot_id:
             # Clean up meeting details on failure
-            MEETING_DETAILS.pop(client_id, None)
+            remove_meeting_details(client_id)
             raise RuntimeError("Failed to create MeetingBaas bot")
 
         # Update MEETING_DETAILS with the bot ID
-        details = list(MEETING_DETAILS[client_id])
-        details[2] = meetingbaas_bot_id
-        MEETING_DETAILS[client_id] = tuple(details)
+        set_meeting_bot_id(client_id, meetingbaas_bot_id)
 
         logger.info(f"Created MeetingBaas bot with ID: {meetingbaas_bot_id}")
 
         # Start Pipecat process
         # Pipecat connects to the local WebSocket server, not external URL
-        pipecat_websocket_url = f"ws://localhost:7014/pipecat/{client_id}"
+        pipecat_websocket_url = PIPECAT_WS_TEMPLATE.format(client_id)
         process = start_pipecat_process(
             client_id=client_id,
             websocket_url=pipecat_websocket_url,
@@ -425,7 +512,7 @@ class SessionService:
         )
 
         # Store the process for later cleanup
-        PIPECAT_PROCESSES[client_id] = process
+        register_pipecat_process(client_id, process)
         logger.info(f"Started Pipecat process with PID {process.pid}")
 
         # Update session state
@@ -464,11 +551,11 @@ class SessionService:
 
         This method handles the full session end lifecycle:
         1. Validates session exists and can be ended
-        2. Terminates the Pipecat process
-        3. Calls MeetingBaas API to make the bot leave
+        2. Starts summary generation in the background
+        3. Terminates the Pipecat process and makes the bot leave, concurrently
         4. Cleans up in-memory state
         5. Broadcasts session_state event
-        6. Triggers summary generation (async)
+        6. Awaits the summary result
 
         Args:
             session_id: The session identifier.
@@ -491,75 +578,13 @@ class SessionService:
             )
 
         # Import dependencies here to avoid circular imports
-        from core.connection import MEETING_DETAILS, PIPECAT_PROCESSES, registry
-        from core.process import terminate_process_gracefully
-        from core.router import router as message_router
+        from core.connection import MEETING_DETAILS, registry, remove_meeting_details
         from core.session_store import broadcast_session_event
-        from scripts.meetingbaas_api import leave_meeting_bot
 
         client_id = session.client_id
         bot_id = session.bot_id
 
-        # 1. Terminate the Pipecat process
-        if client_id and client_id in PIPECAT_PROCESSES:
-            process = PIPECAT_PROCESSES[client_id]
-            if process and process.poll() is None:  # Process is still running
-                try:
-                    # Mark client as closing to prevent further messages
-                    message_router.mark_closing(client_id)
-
-                    if terminate_process_gracefully(process, timeout=3.0):
-                        logger.info(
-                            f"Gracefully terminated Pipecat process for session {session_id}"
-                        )
-                    else:
-                        logger.warning(
-                            f"Had to forcefully kill Pipecat process for session {session_id}"
-                        )
-                except Exception as e:
-                    logger.error(f"Error terminating Pipecat process: {e}")
-
-            # Remove from process tracking
-            PIPECAT_PROCESSES.pop(client_id, None)
-
-        # 2. Call MeetingBaas API to make the bot leave
-        if bot_id:
-            try:
-                result = leave_meeting_bot(bot_id=bot_id, api_key=api_key)
-                if result:
-                    logger.info(f"Bot {bot_id} successfully left the meeting")
-                else:
-                    logger.warning(f"Failed to remove bot {bot_id} from meeting")
-            except Exception as e:
-                logger.error(f"Error calling leave_meeting_bot: {e}")
-
-        # 3. Close WebSocket connections
-        if client_id:
-            try:
-                # Close Pipecat WebSocket
-                if client_id in registry.pipecat_connections:
-                    await registry.disconnect(client_id, is_pipecat=True)
-                    logger.info(f"Closed Pipecat WebSocket for session {session_id}")
-
-                # Close client WebSockets
-                if registry.get_client_output(client_id):
-                    await registry.disconnect(client_id, client_direction="output")
-                if registry.get_client_input(client_id):
-                    await registry.disconnect(client_id, client_direction="input")
-            except Exception as e:
-                logger.error(f"Error closing WebSocket connections: {e}")
-
-        # 4. Clean up in-memory state
-        if client_id and client_id in MEETING_DETAILS:
-            MEETING_DETAILS.pop(client_id, None)
-            logger.info(f"Cleaned up meeting details for session {session_id}")
-
-        # 5. Update session status
-        session.status = SessionStatus.ENDED
-        store_update_session(session_id, session)
-        logger.info(f"Session {session_id} ended successfully")
-
-        # Capture intervention history before cleanup
+        # 1. Capture intervention history and balance before the engines stop
         intervention_history = get_intervention_history(session_id)
 
         balance_metrics = None
@@ -585,7 +610,52 @@ class SessionService:
         stop_intervention_engine(session_id)
         stop_balance_tracker(session_id)
 
-        # 6. Broadcast session_state event to any connected clients
+        # 2. Start summary generation so the LLM round-trip overlaps teardown
+        summary_task = asyncio.create_task(
+            self._generate_summary(
+                session_id,
+                balance_metrics=balance_metrics,
+                intervention_history=intervention_history,
+            )
+        )
+
+        # 3. Terminate the Pipecat process and remove the bot concurrently
+        results = await asyncio.gather(
+            self._terminate_pipecat_process(session_id, client_id),
+            self._remove_meeting_bot(bot_id, api_key),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error during cleanup of session {session_id}: {result}")
+
+        # 4. Close WebSocket connections
+        if client_id:
+            try:
+                # Close Pipecat WebSocket
+                if registry.get_pipecat(client_id) is not None:
+                    await registry.disconnect(client_id, is_pipecat=True)
+                    logger.info(f"Closed Pipecat WebSocket for session {session_id}")
+
+                # Close client WebSockets
+                if registry.get_client_output(client_id):
+                    await registry.disconnect(client_id, client_direction="output")
+                if registry.get_client_input(client_id):
+                    await registry.disconnect(client_id, client_direction="input")
+            except Exception as e:
+                logger.error(f"Error closing WebSocket connections: {e}")
+
+        # 5. Clean up in-memory state
+        if client_id and client_id in MEETING_DETAILS:
+            remove_meeting_details(client_id)
+            logger.info(f"Cleaned up meeting details for session {session_id}")
+
+        # 6. Update session status
+        session.status = SessionStatus.ENDED
+        store_update_session(session_id, session)
+        logger.info(f"Session {session_id} ended successfully")
+
+        # 7. Broadcast session_state event to any connected clients
         try:
             await broadcast_session_event(
                 session_id,
@@ -599,18 +669,63 @@ class SessionService:
         except Exception as e:
             logger.warning(f"Error broadcasting session end event: {e}")
 
-        # 7. Trigger summary generation (async - does not block return)
-        summary_available = await self._generate_summary(
-            session_id,
-            balance_metrics=balance_metrics,
-            intervention_history=intervention_history,
-        )
+        summary_available = await summary_task
 
         return {
             "status": session.status,
             "summary_available": summary_available,
         }
 
+    async def _terminate_pipecat_process(
+        self, session_id: str, client_id: Optional[str]
+    ) -> None:
+        """Terminate the session's Pipecat process without blocking the event loop.
+
+        Args:
+            session_id: The session identifier (for logging).
+            client_id: The client ID the Pipecat process is tracked under.
+        """
+        from core.connection import pop_pipecat_process
+        from core.process import async_terminate
+        from core.router import router as message_router
+
+        if not client_id:
+            return
+
+        process = pop_pipecat_process(client_id)
+        if not process or process.poll() is not None:
+            return
+
+        # Mark client as closing to prevent further messages
+        message_router.mark_closing(client_id)
+
+        if await async_terminate(process, 3.0):
+            logger.info(f"Gracefully terminated Pipecat process for session {session_id}")
+        else:
+            logger.warning(
+                f"Had to forcefully kill Pipecat process for session {session_id}"
+            )
+
+    async def _remove_meeting_bot(self, bot_id: Optional[str], api_key: str) -> None:
+        """Ask MeetingBaas to remove the bot without blocking the event loop.
+
+        Args:
+            bot_id: The MeetingBaas bot ID, if one was created.
+            api_key: The MeetingBaas API key for bot removal.
+        """
+        from scripts.meetingbaas_api import leave_meeting_bot
+
+        if not bot_id:
+            return
+
+        result = await asyncio.to_thread(
+            leave_meeting_bot, bot_id=bot_id, api_key=api_key
+        )
+        if result:
+            logger.info(f"Bot {bot_id} successfully left the meeting")
+        else:
+            logger.warning(f"Failed to remove bot {bot_id} from meeting")
+
     async def pause_facilitation(self, session_id: str) -> Session:
         """Pause AI facilitation (kill switch).
 
@@ -725,7 +840,16 @@ class SessionService:
 
         # Import summary service here to avoid circular imports
         from app.services.summary_service import summary_service
-        from core.session_store import store_summary
+        from core.session_store import broadcast_session_event, store_summary
+
+        async def publish_partial(field: str, value: Any) -> None:
+            # Push each summary field to the session's event clients as it lands
+            try:
+                await broadcast_session_event(
+                    session_id, "summary_partial", {"field": field, "value": value}
+                )
+            except Exception as e:
+                logger.warning(f"Failed to broadcast partial summary: {e}")
 
         try:
             # Prepare participants data
@@ -746,6 +870,8 @@ class SessionService:
                 balance_metrics=balance_metrics,
                 intervention_history=intervention_history,
                 transcript=transcript,
+                on_partial=publish_partial,
+                on_late_summary=lambda late: store_summary(session_id, late),
             )
 
             if summary:
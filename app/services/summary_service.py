@@ -3,30 +3,205 @@
 Generates post-session summaries using OpenAI GPT-4.
 """
 
+import asyncio
 import json
 import os
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
+import httpx
 import openai
 from loguru import logger
 
+try:
+    import tiktoken
+except ImportError:  # Fall back to a character budget without tiktoken
+    tiktoken = None
+
 from app.models import SessionSummary, TalkBalanceMetrics
 
 
 # OpenAI API key from environment
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# Seconds to wait for the LLM before answering with the fallback summary
+SUMMARY_FALLBACK_TIMEOUT = 10.0
+
+# Summary fields surfaced to listeners as soon as they finish streaming
+STREAMED_SUMMARY_FIELDS = ("consensus_summary", "action_items", "key_agreements")
+
+_SYSTEM_PROMPT = """You are an AI facilitator summary generator for Diadi, a dyadic conversation platform.
+
+Your task is to analyze conversation data and generate a helpful, constructive summary.
+
+Generate a JSON response with the following structure:
+{
+    "consensus_summary": "A 2-3 sentence summary of what was discussed and any consensus reached. Focus on progress made and positive outcomes.",
+    "action_items": ["List of specific action items that emerged from the conversation", "Each item should be actionable and assigned to one or both participants"],
+    "key_agreements": [
+        {"title": "Brief title of agreement", "description": "More detailed description of what was agreed upon"}
+    ]
+}
+
+Guidelines:
+- Be constructive and focus on progress made
+- Highlight areas of agreement rather than conflict
+- Keep action items specific and actionable
+- If there was no clear consensus, acknowledge progress toward understanding
+- Keep the tone warm and encouraging
+- Do not make up details not present in the input
+- If information is limited, provide a graceful summary acknowledging the conversation occurred"""
+
+# Transcript budget, leaving headroom in the context for metadata and the reply
+MAX_TRANSCRIPT_TOKENS = 6000
+# Rough chars-per-token ratio used when tiktoken is unavailable
+_FALLBACK_CHARS_PER_TOKEN = 4
+
+_transcript_encoding = None
+_transcript_encoding_failed = False
+
+_NO_TRANSCRIPT_NOTE = "\n(No transcript available - generate summary based on session metadata)"
+
+
+def _get_transcript_encoding():
+    """Load the gpt-4o tokenizer once; None if tiktoken is unusable."""
+    global _transcript_encoding, _transcript_encoding_failed
+
+    if _transcript_encoding is None and not _transcript_encoding_failed:
+        if tiktoken is None:
+            _transcript_encoding_failed = True
+        else:
+            try:
+                _transcript_encoding = tiktoken.encoding_for_model("gpt-4o")
+            except Exception as e:
+                logger.warning(f"tiktoken unavailable, truncating by characters: {e}")
+                _transcript_encoding_failed = True
+    return _transcript_encoding
+
+
+class _TopLevelFieldScanner:
+    """Pick completed top-level fields out of a JSON object as it streams in.
+
+    Each character is scanned once, tracking nesting and string state, so a
+    key only matches at object level of the outer object (a string right
+    after its ``{`` or a ``,``), never inside a string or a nested value.
+    """
+
+    def __init__(self, fields: Tuple[str, ...]):
+        self._fields: Set[str] = set(fields)
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._key_start: Optional[int] = None
+        self._key: Optional[str] = None
+        self._value_start: Optional[int] = None
+
+    def scan(self, buffer: str) -> List[Tuple[str, Any]]:
+        """Scan text appended to buffer since the last call.
+
+        Args:
+            buffer: Everything streamed so far.
+
+        Returns:
+            (field, value) pairs for wanted fields whose values completed in
+            the new text, each reported once.
+        """
+        completed: List[Tuple[str, Any]] = []
+        for i in range(self._pos, len(buffer)):
+            c = buffer[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        if self._key_start is not None:
+                            self._key = json.loads(buffer[self._key_start : i + 1])
+                            self._key_start = None
+                        elif self._value_start is not None:
+                            self._finish_value(buffer, i + 1, completed)
+            elif c == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    if self._expect_key:
+                        self._expect_key = False
+                        self._key_start = i
+                    elif self._key is not None and self._value_start is None:
+                        self._value_start = i
+            elif c in "{[":
+                if self._depth == 1 and self._key is not None:
+                    self._value_start = i
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_key = c == "{"
+            elif c in "}]":
+                self._depth -= 1
+                if self._value_start is not None and self._depth <= 1:
+                    # A nested value closed, or the outer object ended a scalar
+                    self._finish_value(buffer, i + 1 if self._depth else i, completed)
+            elif self._depth == 1:
+                if c == ",":
+                    if self._value_start is not None:
+                        self._finish_value(buffer, i, completed)
+                    self._expect_key = True
+                elif (
+                    c != ":"
+                    and not c.isspace()
+                    and self._key is not None
+                    and self._value_start is None
+                ):
+                    self._value_start = i
+        self._pos = len(buffer)
+        return completed
+
+    def _finish_value(
+        self, buffer: str, end: int, completed: List[Tuple[str, Any]]
+    ) -> None:
+        """Decode the current field's value if it is one that was asked for."""
+        key, start = self._key, self._value_start
+        self._key = self._value_start = None
+        if key not in self._fields:
+            return
+        try:
+            value = json.loads(buffer[start:end])
+        except json.JSONDecodeError:
+            return
+        self._fields.discard(key)
+        completed.append((key, value))
+
 
 class SummaryService:
     """Generates post-session summaries using OpenAI GPT-4."""
 
     def __init__(self):
         """Initialize the summary service with OpenAI client."""
+        self.http_client: Optional[httpx.AsyncClient] = None
+        # Holds LLM calls that outlived the fallback timeout until they finish
+        self._background_tasks: Set[asyncio.Task] = set()
         if not OPENAI_API_KEY:
             logger.warning("OPENAI_API_KEY not set - summary generation will fail")
             self.client = None
         else:
-            self.client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
+            # Shared keep-alive pool so concurrent session ends reuse connections
+            self.http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            )
+            self.client = openai.AsyncOpenAI(
+                api_key=OPENAI_API_KEY, http_client=self.http_client
+            )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client used for OpenAI requests."""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+            self.client = None
 
     async def generate_summary(
         self,
@@ -37,9 +212,17 @@ class SummaryService:
         balance_metrics: Optional[Dict[str, Any]] = None,
         intervention_history: Optional[List[Dict[str, Any]]] = None,
         transcript: Optional[str] = None,
+        on_partial: Optional[Callable[[str, Any], Awaitable[None]]] = None,
+        on_late_summary: Optional[Callable[[SessionSummary], None]] = None,
     ) -> Optional[SessionSummary]:
         """Generate a post-session summary using OpenAI.
 
+        The completion is streamed; each top-level summary field is passed to
+        on_partial as soon as its JSON value is complete, before the rest of
+        the response arrives. If the LLM has not finished within
+        SUMMARY_FALLBACK_TIMEOUT seconds, the fallback summary is returned and
+        the real one is passed to on_late_summary once it completes.
+
         Args:
             session_id: The session identifier.
             goal: The original session goal.
@@ -48,6 +231,9 @@ class SummaryService:
             balance_metrics: Optional talk balance metrics dict.
             intervention_history: Optional list of interventions that occurred.
             transcript: Optional session transcript (if available).
+            on_partial: Optional async callback receiving (field, value) pairs.
+            on_late_summary: Optional callback receiving a summary that
+                completed after the fallback was returned.
 
         Returns:
             SessionSummary object if successful, None otherwise.
@@ -58,6 +244,109 @@ class SummaryService:
                 session_id, goal, duration_minutes, participants, balance_metrics
             )
 
+        llm_task = asyncio.create_task(
+            self._generate_openai_summary(
+                session_id=session_id,
+                goal=goal,
+                duration_minutes=duration_minutes,
+                participants=participants,
+                balance_metrics=balance_metrics,
+                intervention_history=intervention_history,
+                transcript=transcript,
+                on_partial=on_partial,
+            )
+        )
+        self._background_tasks.add(llm_task)
+        llm_task.add_done_callback(self._background_tasks.discard)
+
+        # asyncio.wait never cancels the task, so a slow call keeps running
+        done, _ = await asyncio.wait({llm_task}, timeout=SUMMARY_FALLBACK_TIMEOUT)
+        if llm_task in done:
+            return llm_task.result()
+
+        logger.warning(
+            f"Summary for session {session_id} took over {SUMMARY_FALLBACK_TIMEOUT}s, "
+            "returning fallback while the LLM call finishes"
+        )
+        if on_late_summary:
+            llm_task.add_done_callback(
+                lambda task: self._deliver_late_summary(task, on_late_summary)
+            )
+
+        return self._create_fallback_summary(
+            session_id, goal, duration_minutes, participants, balance_metrics
+        )
+
+    def _deliver_late_summary(
+        self,
+        task: "asyncio.Task[SessionSummary]",
+        on_late_summary: Callable[[SessionSummary], None],
+    ) -> None:
+        """Hand a summary that finished after the fallback timeout to the caller."""
+        if task.cancelled() or task.exception() is not None:
+            return
+        try:
+            on_late_summary(task.result())
+        except Exception as e:
+            logger.error(f"Error delivering late summary: {e}")
+
+    async def _generate_openai_summary(
+        self,
+        session_id: str,
+        goal: str,
+        duration_minutes: int,
+        participants: List[Dict[str, Any]],
+        balance_metrics: Optional[Dict[str, Any]],
+        intervention_history: Optional[List[Dict[str, Any]]],
+        transcript: Optional[str],
+        on_partial: Optional[Callable[[str, Any], Awaitable[None]]],
+    ) -> SessionSummary:
+        """Run the streamed OpenAI completion, falling back on any error."""
+        summary_data = await self._try_openai_summary(
+            goal=goal,
+            duration_minutes=duration_minutes,
+            participants=participants,
+            balance_metrics=balance_metrics,
+            intervention_history=intervention_history,
+            transcript=transcript,
+            on_partial=on_partial,
+        )
+        if summary_data is None:
+            return self._create_fallback_summary(
+                session_id, goal, duration_minutes, participants, balance_metrics
+            )
+
+        summary = SessionSummary(
+            session_id=session_id,
+            duration_minutes=duration_minutes,
+            consensus_summary=summary_data.get(
+                "consensus_summary",
+                "Session completed. Key points were discussed.",
+            ),
+            action_items=summary_data.get("action_items", []),
+            balance=self._build_balance_metrics(balance_metrics, participants),
+            intervention_count=len(intervention_history) if intervention_history else 0,
+            key_agreements=summary_data.get("key_agreements", []),
+        )
+
+        logger.info(f"Generated summary for session {session_id}")
+        return summary
+
+    async def _try_openai_summary(
+        self,
+        goal: str,
+        duration_minutes: int,
+        participants: List[Dict[str, Any]],
+        balance_metrics: Optional[Dict[str, Any]],
+        intervention_history: Optional[List[Dict[str, Any]]],
+        transcript: Optional[str],
+        on_partial: Optional[Callable[[str, Any], Awaitable[None]]],
+    ) -> Optional[Dict[str, Any]]:
+        """Stream the summary JSON from OpenAI.
+
+        Returns:
+            The parsed summary dict, or None on any failure (already logged).
+        """
         try:
             # Build context for the summary generation
             context = self._build_summary_context(
@@ -70,7 +359,7 @@ class SummaryService:
             )
 
             # Generate summary using OpenAI
-            response = await self.client.chat.completions.create(
+            stream = await self.client.chat.completions.create(
                 model="gpt-4o",
                 response_format={"type": "json_object"},
                 messages=[
@@ -85,84 +374,44 @@ class SummaryService:
                 ],
                 max_tokens=2000,
                 temperature=0.7,
+                stream=True,
+            )
+
+            content = ""
+            scanner = (
+                _TopLevelFieldScanner(STREAMED_SUMMARY_FIELDS) if on_partial else None
             )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                content += delta
+
+                if scanner is not None:
+                    for field, value in scanner.scan(content):
+                        await on_partial(field, value)
 
-            content = response.choices[0].message.content
             if not content:
                 logger.warning("OpenAI returned empty content for summary generation")
-                return self._create_fallback_summary(
-                    session_id, goal, duration_minutes, participants, balance_metrics
-                )
-
-            # Parse the response
-            summary_data = json.loads(content)
+                return None
 
-            # Build balance metrics
-            balance = self._build_balance_metrics(balance_metrics, participants)
-
-            # Build SessionSummary
-            summary = SessionSummary(
-                session_id=session_id,
-                duration_minutes=duration_minutes,
-                consensus_summary=summary_data.get(
-                    "consensus_summary",
-                    "Session completed. Key points were discussed.",
-                ),
-                action_items=summary_data.get("action_items", []),
-                balance=balance,
-                intervention_count=len(intervention_history)
-                if intervention_history
-                else 0,
-                key_agreements=summary_data.get("key_agreements", []),
-            )
-
-            logger.info(f"Generated summary for session {session_id}")
-            return summary
+            return json.loads(content)
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse summary JSON: {e}")
-            return self._create_fallback_summary(
-                session_id, goal, duration_minutes, participants, balance_metrics
-            )
         except openai.AuthenticationError as e:
             logger.error(f"OpenAI authentication error: {e}")
-            return self._create_fallback_summary(
-                session_id, goal, duration_minutes, participants, balance_metrics
-            )
         except openai.RateLimitError as e:
             logger.error(f"OpenAI rate limit exceeded: {e}")
-            return self._create_fallback_summary(
-                session_id, goal, duration_minutes, participants, balance_metrics
-            )
         except Exception as e:
             logger.error(f"Error generating summary: {e}")
-            return self._create_fallback_summary(
-                session_id, goal, duration_minutes, participants, balance_metrics
-            )
+        return None
 
     def _get_system_prompt(self) -> str:
         """Get the system prompt for summary generation."""
-        return """You are an AI facilitator summary generator for Diadi, a dyadic conversation platform.
-
-Your task is to analyze conversation data and generate a helpful, constructive summary.
-
-Generate a JSON response with the following structure:
-{
-    "consensus_summary": "A 2-3 sentence summary of what was discussed and any consensus reached. Focus on progress made and positive outcomes.",
-    "action_items": ["List of specific action items that emerged from the conversation", "Each item should be actionable and assigned to one or both participants"],
-    "key_agreements": [
-        {"title": "Brief title of agreement", "description": "More detailed description of what was agreed upon"}
-    ]
-}
-
-Guidelines:
-- Be constructive and focus on progress made
-- Highlight areas of agreement rather than conflict
-- Keep action items specific and actionable
-- If there was no clear consensus, acknowledge progress toward understanding
-- Keep the tone warm and encouraging
-- Do not make up details not present in the input
-- If information is limited, provide a graceful summary acknowledging the conversation occurred"""
+        return _SYSTEM_PROMPT
 
     def _build_summary_context(
         self,
@@ -194,10 +443,10 @@ Guidelines:
 
         # Add intervention summary if available
         if intervention_history:
-            intervention_types = {}
-            for intervention in intervention_history:
-                int_type = intervention.get("type", "unknown")
-                intervention_types[int_type] = intervention_types.get(int_type, 0) + 1
+            intervention_types = Counter(
+                intervention.get("type", "unknown")
+                for intervention in intervention_history
+            )
 
             intervention_summary = ", ".join(
                 f"{count} {int_type}" for int_type, count in intervention_types.items()
@@ -206,17 +455,31 @@ Guidelines:
 
         # Add transcript if available (truncated for context limit)
         if transcript:
-            max_transcript_chars = 8000  # Keep within context limits
-            if len(transcript) > max_transcript_chars:
-                transcript = transcript[:max_transcript_chars] + "\n...[truncated]"
+            transcript = self._truncate_transcript(transcript)
             context_parts.append(f"\nConversation Transcript:\n{transcript}")
         else:
-            context_parts.append(
-                "\n(No transcript available - generate summary based on session metadata)"
-            )
+            context_parts.append(_NO_TRANSCRIPT_NOTE)
 
         return "\n".join(context_parts)
 
+    def _truncate_transcript(self, transcript: str) -> str:
+        """Trim a transcript to MAX_TRANSCRIPT_TOKENS, copying only when needed."""
+        # No tokenizer needed when even one char per token would fit
+        if len(transcript) <= MAX_TRANSCRIPT_TOKENS:
+            return transcript
+
+        encoding = _get_transcript_encoding()
+        if encoding is None:
+            max_chars = MAX_TRANSCRIPT_TOKENS * _FALLBACK_CHARS_PER_TOKEN
+            if len(transcript) <= max_chars:
+                return transcript
+            return transcript[:max_chars] + "\n...[truncated]"
+
+        tokens = encoding.encode(transcript)
+        if len(tokens) <= MAX_TRANSCRIPT_TOKENS:
+            return transcript
+        return encoding.decode(tokens[:MAX_TRANSCRIPT_TOKENS]) + "\n...[truncated]"
+
     def _build_balance_metrics(
         self,
         balance_metrics: Optional[Dict[str, Any]],
@@ -1,62 +1,181 @@
 """WebSocket routes for the Speaking Meeting Bot API."""
 
+import asyncio
 import json
 from datetime import datetime
+from typing import Callable, Dict, Optional
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
 
 from protobufs import frames_pb2
 
-from core.connection import MEETING_DETAILS, PIPECAT_PROCESSES, registry
-from core.process import start_pipecat_process, terminate_process_gracefully
+from core.connection import (
+    MEETING_DETAILS,
+    MeetingDetail,
+    registry,
+    remove_meeting_details,
+)
+from core.process import PipecatSession, stop_pipecat_process
 from core.router import router as message_router
 from core.session_store import (
     SESSION_EVENTS,
     broadcast_session_event,
+    encode_event,
     get_session,
     get_session_by_client_id,
+    queue_event,
     record_speaker_activity,
     record_speaker_durations,
     record_speech_activity,
     register_event_connection,
+    session_state_event,
     unregister_event_connection,
 )
-from app.models import SessionStatus
+from app.models import FacilitatorSettingsUpdate
 from meetingbaas_pipecat.utils.logger import logger
 from utils.ngrok import LOCAL_DEV_MODE, log_ngrok_status, release_ngrok_url
 
 websocket_router = APIRouter()
 
+# Caps on how much queued audio is coalesced into one frame
+AUDIO_BATCH_MAX_FRAMES = 128
+AUDIO_BATCH_MAX_BYTES = 64 * 1024
+
+# Audio frames buffered in either direction before the oldest are dropped
+CLIENT_AUDIO_QUEUE_MAX_FRAMES = 256
+
+# How long Pipecat audio waits for stragglers before going out as one frame
+PIPECAT_AUDIO_COALESCE_SECONDS = 0.001
+
 
-async def _load_meeting_details(client_id: str):
-    if client_id not in MEETING_DETAILS:
+def _load_meeting_details(client_id: str) -> Optional[MeetingDetail]:
+    details = MEETING_DETAILS.get(client_id)
+    if details is None:
         logger.error(f"No meeting details found for client {client_id}")
         return None
 
-    meeting_details = MEETING_DETAILS[client_id]
-    meeting_url = meeting_details[0] if len(meeting_details) > 0 else None
-    persona_name = meeting_details[1] if len(meeting_details) > 1 else None
-    meetingbaas_bot_id = meeting_details[2] if len(meeting_details) > 2 else None
-    enable_tools = meeting_details[3] if len(meeting_details) > 3 else False
-    streaming_audio_frequency = (
-        meeting_details[4] if len(meeting_details) > 4 else "16khz"
-    )
-    resolved_persona_data = (
-        meeting_details[5] if len(meeting_details) > 5 else {"name": persona_name}
-    )
-
     logger.info(
-        f"Retrieved meeting details for {client_id}: {meeting_url}, {persona_name}, {meetingbaas_bot_id}, {enable_tools}, {streaming_audio_frequency}"
+        f"Retrieved meeting details for {client_id}: {details.meeting_url}, {details.persona_name}, {details.meetingbaas_bot_id}, {details.enable_tools}, {details.streaming_audio_frequency}"
     )
+    return details
+
+
+async def _cleanup_client(client_id: str) -> None:
+    """Tear down everything held for a client once its meeting audio ends.
+
+    Terminates the Pipecat process, drops the meeting details, stops further
+    sends, disconnects both client sockets and releases the ngrok URL.
+    """
+    stop_pipecat_process(client_id)
+
+    remove_meeting_details(client_id)
+
+    # Mark client as closing to prevent further message sending
+    message_router.mark_closing(client_id)
+
+    # Disconnect both client sockets if present, closing them concurrently
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(registry.disconnect(client_id, client_direction="output"))
+            tg.create_task(registry.disconnect(client_id, client_direction="input"))
+        logger.info(f"Client {client_id} disconnected")
+    except Exception as e:
+        logger.debug(f"Error disconnecting client {client_id}: {e}")
+
+    # Release ngrok URL
+    if LOCAL_DEV_MODE:
+        release_ngrok_url(client_id)
+        log_ngrok_status()
+
+
+async def _forward_client_audio(
+    websocket: WebSocket, client_id: str, source: str
+) -> None:
+    """Receive meeting audio and queue it for Pipecat.
+
+    Uses ``receive_bytes`` since meeting audio is binary; text frames are
+    logged and skipped. Frames go through a bounded queue to a sender task so
+    a slow Pipecat socket never stalls reads from the client; when the queue
+    is full the oldest frame is dropped. Returns only by raising when the
+    socket closes.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_AUDIO_QUEUE_MAX_FRAMES)
+    sender = asyncio.create_task(_send_client_audio(queue, client_id))
+    try:
+        while True:
+            try:
+                chunk = await websocket.receive_bytes()
+            except KeyError:
+                # Text frame on an audio socket; nothing to forward
+                logger.info(
+                    f"Ignoring text message from client {source.upper()} {client_id}"
+                )
+                continue
+
+            message_router.set_audio_source(client_id, source)
+            _queue_audio_frame(queue, chunk, client_id)
+    finally:
+        sender.cancel()
 
-    return (
-        meeting_url,
-        persona_name,
-        meetingbaas_bot_id,
-        enable_tools,
-        streaming_audio_frequency,
-        resolved_persona_data,
-    )
+
+def _queue_audio_frame(queue: asyncio.Queue, chunk: bytes, client_id: str) -> None:
+    """Queue an audio frame, dropping the oldest one if the queue is full."""
+    if queue.full():
+        queue.get_nowait()
+        logger.debug("Dropped oldest queued audio frame for client {}", client_id)
+    queue.put_nowait(chunk)
+
+
+async def _send_client_audio(queue: asyncio.Queue, client_id: str) -> None:
+    """Send queued client audio to Pipecat, one frame per burst.
+
+    Everything that queued up while the previous send was in flight goes
+    out together, up to AUDIO_BATCH_MAX_FRAMES / AUDIO_BATCH_MAX_BYTES.
+    """
+    while True:
+        chunks = [await queue.get()]
+        size = len(chunks[0])
+        while (
+            not queue.empty()
+            and len(chunks) < AUDIO_BATCH_MAX_FRAMES
+            and size < AUDIO_BATCH_MAX_BYTES
+        ):
+            chunk = queue.get_nowait()
+            chunks.append(chunk)
+            size += len(chunk)
+
+        logger.debug(
+            "Sending {} audio frames ({} bytes) from client {} to Pipecat",
+            len(chunks),
+            size,
+            client_id,
+        )
+        # Not bridged socket-to-socket: Pipecat expects protobuf-wrapped
+        # audio, so each burst still goes through the router's converter
+        await message_router.send_to_pipecat_batch(chunks, client_id)
+
+
+async def _relay_pipecat_audio(queue: asyncio.Queue, client_id: str) -> None:
+    """Send Pipecat audio to the client, coalescing chunks that arrive together.
+
+    After the first chunk of a burst, waits PIPECAT_AUDIO_COALESCE_SECONDS
+    and sends everything queued by then as a single WebSocket frame. Reads
+    from Pipecat never wait on this; if the client falls behind, the oldest
+    queued frames are dropped.
+    """
+    while True:
+        chunks = [await queue.get()]
+        await asyncio.sleep(PIPECAT_AUDIO_COALESCE_SECONDS)
+        size = len(chunks[0])
+        while not queue.empty() and size < AUDIO_BATCH_MAX_BYTES:
+            chunk = queue.get_nowait()
+            chunks.append(chunk)
+            size += len(chunk)
+
+        audio_data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        await message_router.send_audio_from_pipecat(audio_data, client_id)
 
 
 async def _handle_pipecat_event_payload(payload_text: str, client_id: str) -> bool:
@@ -109,176 +228,42 @@ async def _handle_pipecat_event_payload(payload_text: str, client_id: str) -> bo
 @websocket_router.websocket("/ws/{client_id}/output")
 async def websocket_output_endpoint(websocket: WebSocket, client_id: str):
     """Handle meeting -> server audio stream (output from meeting)."""
-    await registry.connect(websocket, client_id, client_direction="output")
+    client_id = await registry.connect(websocket, client_id, client_direction="output")
 
     try:
-        meeting_details = await _load_meeting_details(client_id)
-        if not meeting_details:
+        details = _load_meeting_details(client_id)
+        if details is None:
             await websocket.close(code=1008, reason="Missing meeting details")
             return
 
-        (
-            meeting_url,
-            _persona_name,
-            meetingbaas_bot_id,
-            enable_tools,
-            streaming_audio_frequency,
-            resolved_persona_data,
-        ) = meeting_details
-
-        # Check if a Pipecat process is already running for this client
-        if (
-            client_id in PIPECAT_PROCESSES
-            and PIPECAT_PROCESSES[client_id].poll() is None
-        ):
-            logger.info(f"Pipecat process already running for client {client_id}")
-        else:
-            # Start Pipecat process if not already running
-            pipecat_websocket_url = f"ws://localhost:7014/pipecat/{client_id}"
-            logger.info(
-                f"Starting new Pipecat process for client {client_id} (previous process not running)"
-            )
-            process = start_pipecat_process(
-                client_id=client_id,
-                websocket_url=pipecat_websocket_url,
-                meeting_url=meeting_url,
-                persona_data=resolved_persona_data,  # Use full persona data
-                streaming_audio_frequency=streaming_audio_frequency,
-                enable_tools=enable_tools,
-                api_key="",
-                meetingbaas_bot_id=meetingbaas_bot_id or "",
-            )
-
-            # Store the process for cleanup
-            PIPECAT_PROCESSES[client_id] = process
-
         # Process messages from meeting audio stream
-        while True:
-            try:
-                message = await websocket.receive()
-            except RuntimeError as e:
-                if (
-                    'Cannot call "receive" once a disconnect message has been received'
-                    in str(e)
-                ):
-                    logger.info(f"WebSocket for client {client_id} closed by client.")
-                    break
-                raise
-
-            # logger.info(f"Received message type: {type(message)}, keys: {list(message.keys())}")
-            if "bytes" in message:
-                audio_data = message["bytes"]
-                logger.debug(
-                    f"Received audio data ({len(audio_data)} bytes) from client {client_id}"
-                )
-                message_router.set_audio_source(client_id, "output")
-                await message_router.send_to_pipecat(audio_data, client_id)
-            elif "text" in message:
-                text_data = message["text"]
-                logger.info(
-                    f"Received text message from client {client_id}: {text_data[:100]}..."
-                )
+        async with PipecatSession(client_id, details):
+            await _forward_client_audio(websocket, client_id, "output")
     except WebSocketDisconnect:
         logger.info(f"Output WebSocket disconnected for client {client_id}")
     except Exception as e:
         logger.error(f"Error in WebSocket connection: {e} (repr: {repr(e)})")
     finally:
         # Clean up when output stream closes (authoritative)
-        if client_id in PIPECAT_PROCESSES:
-            process = PIPECAT_PROCESSES[client_id]
-            if process and process.poll() is None:  # If process is still running
-                try:
-                    if terminate_process_gracefully(process, timeout=3.0):
-                        logger.info(
-                            f"Gracefully terminated Pipecat process for client {client_id}"
-                        )
-                    else:
-                        logger.warning(
-                            f"Had to forcefully kill Pipecat process for client {client_id}"
-                        )
-                except Exception as e:
-                    logger.error(f"Error terminating process: {e}")
-            # Remove from our storage
-            PIPECAT_PROCESSES.pop(client_id, None)
-
-        if client_id in MEETING_DETAILS:
-            MEETING_DETAILS.pop(client_id, None)
-
-        # Mark client as closing to prevent further message sending
-        message_router.mark_closing(client_id)
-
-        # Disconnect both client sockets if present
-        try:
-            await registry.disconnect(client_id, client_direction="output")
-            await registry.disconnect(client_id, client_direction="input")
-            logger.info(f"Client {client_id} disconnected")
-        except Exception as e:
-            logger.debug(f"Error disconnecting client {client_id}: {e}")
-
-        # Release ngrok URL
-        if LOCAL_DEV_MODE:
-            release_ngrok_url(client_id)
-            log_ngrok_status()
+        await _cleanup_client(client_id)
 
 
 @websocket_router.websocket("/ws/{client_id}/input")
 async def websocket_input_endpoint(websocket: WebSocket, client_id: str):
     """Handle server -> meeting audio stream (input to meeting)."""
-    await registry.connect(websocket, client_id, client_direction="input")
+    client_id = await registry.connect(websocket, client_id, client_direction="input")
     logger.info(f"Client {client_id} INPUT connected")
 
     try:
-        meeting_details = await _load_meeting_details(client_id)
-        if not meeting_details:
+        details = _load_meeting_details(client_id)
+        if details is None:
             await websocket.close(code=1008, reason="Missing meeting details")
             return
 
-        (
-            meeting_url,
-            _persona_name,
-            meetingbaas_bot_id,
-            enable_tools,
-            streaming_audio_frequency,
-            resolved_persona_data,
-        ) = meeting_details
-
-        # Ensure Pipecat is running even if INPUT connects first
-        if (
-            client_id in PIPECAT_PROCESSES
-            and PIPECAT_PROCESSES[client_id].poll() is None
-        ):
-            logger.info(f"Pipecat process already running for client {client_id}")
-        else:
-            pipecat_websocket_url = f"ws://localhost:7014/pipecat/{client_id}"
-            logger.info(
-                f"Starting new Pipecat process for client {client_id} (previous process not running)"
-            )
-            process = start_pipecat_process(
-                client_id=client_id,
-                websocket_url=pipecat_websocket_url,
-                meeting_url=meeting_url,
-                persona_data=resolved_persona_data,  # Use full persona data
-                streaming_audio_frequency=streaming_audio_frequency,
-                enable_tools=enable_tools,
-                api_key="",
-                meetingbaas_bot_id=meetingbaas_bot_id or "",
-            )
-            PIPECAT_PROCESSES[client_id] = process
-
-        while True:
-            message = await websocket.receive()
-            if "text" in message:
-                text_data = message["text"]
-                logger.info(
-                    f"Received text message from client INPUT {client_id}: {text_data[:100]}..."
-                )
-            elif "bytes" in message:
-                audio_data = message["bytes"]
-                logger.debug(
-                    f"Received audio data ({len(audio_data)} bytes) from client INPUT {client_id}"
-                )
-                message_router.set_audio_source(client_id, "input")
-                await message_router.send_to_pipecat(audio_data, client_id)
+        # Ensure Pipecat is running even if INPUT connects first; the OUTPUT
+        # stream owns the process, so leaving here doesn't terminate it
+        async with PipecatSession(client_id, details, terminate_on_exit=False):
+            await _forward_client_audio(websocket, client_id, "input")
     except WebSocketDisconnect:
         logger.info(f"Input WebSocket disconnected for client {client_id}")
     except Exception as e:
@@ -303,14 +288,21 @@ async def websocket_legacy_endpoint(websocket: WebSocket, client_id: str):
 @websocket_router.websocket("/pipecat/{client_id}")
 async def pipecat_websocket(websocket: WebSocket, client_id: str):
     """Handle WebSocket connections from Pipecat."""
-    await registry.connect(websocket, client_id, is_pipecat=True)
+    client_id = await registry.connect(websocket, client_id, is_pipecat=True)
+    # Bounded so a slow meeting socket can't grow memory without limit
+    audio_queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_AUDIO_QUEUE_MAX_FRAMES)
+    audio_relay = asyncio.create_task(_relay_pipecat_audio(audio_queue, client_id))
     try:
         while True:
             message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
             if "bytes" in message:
                 data = message["bytes"]
                 logger.debug(
-                    f"Received binary data ({len(data)} bytes) from Pipecat client {client_id}"
+                    "Received binary data ({} bytes) from Pipecat client {}",
+                    len(data),
+                    client_id,
                 )
                 try:
                     frame = frames_pb2.Frame()
@@ -319,7 +311,10 @@ async def pipecat_websocket(websocket: WebSocket, client_id: str):
                     logger.debug(
                         f"Failed to parse Pipecat frame for {client_id}: {e}"
                     )
-                    await message_router.send_from_pipecat(data, client_id)
+                    # Through the relay queue, so it can't overtake queued audio
+                    audio = message_router.converter.protobuf_to_raw(data)
+                    if audio:
+                        _queue_audio_frame(audio_queue, audio, client_id)
                     continue
 
                 if frame.HasField("text"):
@@ -334,13 +329,13 @@ async def pipecat_websocket(websocket: WebSocket, client_id: str):
                     continue
 
                 if frame.HasField("audio"):
-                    # Forward Pipecat audio to meeting clients with conversion
-                    await message_router.send_from_pipecat(data, client_id)
+                    # Hand the already-parsed audio to the coalescing relay
+                    _queue_audio_frame(audio_queue, frame.audio.audio, client_id)
                     continue
 
                 if frame.HasField("transcription"):
                     logger.debug(
-                        f"Received transcription frame from Pipecat client {client_id}"
+                        "Received transcription frame from Pipecat client {}", client_id
                     )
                     continue
 
@@ -361,6 +356,8 @@ async def pipecat_websocket(websocket: WebSocket, client_id: str):
             f"Error in Pipecat WebSocket handler for client {client_id}: {str(e)}"
         )
     finally:
+        audio_relay.cancel()
+
         # Mark client as closing before disconnecting
         message_router.mark_closing(client_id)
 
@@ -382,6 +379,88 @@ async def pipecat_websocket(websocket: WebSocket, client_id: str):
 # =============================================================================
 
 
+def _queue_error(websocket: WebSocket, reason: str) -> None:
+    """Queue an error event describing a rejected client message."""
+    queue_event(
+        websocket,
+        {
+            "type": "error",
+            "data": {"message": reason},
+            "timestamp": datetime.utcnow(),
+        },
+    )
+
+
+# Session-events clients ping every 30s; close sockets silent for longer
+EVENTS_IDLE_TIMEOUT_SECONDS = 75
+
+# Pong is the hottest client reply; only its timestamp varies
+_PONG_PREFIX = b'{"type":"pong","timestamp":'
+
+
+def _handle_ping(websocket: WebSocket, session_id: str, message: dict) -> None:
+    """Answer a heartbeat ping with a pong."""
+    queue_event(websocket, _PONG_PREFIX + encode_event(datetime.utcnow()) + b"}")
+
+
+def _handle_update_settings(
+    websocket: WebSocket, session_id: str, message: dict
+) -> None:
+    """Validate and acknowledge a mid-session facilitator settings update."""
+    try:
+        update = FacilitatorSettingsUpdate.model_validate(
+            message.get("data") or message.get("settings", {})
+        )
+    except ValidationError as e:
+        logger.warning(f"Session {session_id}: Invalid settings update: {e}")
+        _queue_error(websocket, "Invalid settings")
+        return
+
+    # Echoed under the camelCase names the frontend uses
+    settings = update.model_dump(exclude_unset=True, by_alias=True)
+    logger.info(f"Session {session_id}: Received settings update: {settings}")
+    # TODO: Forward settings to Pipecat process
+    # await update_pipecat_settings(session.client_id, settings)
+
+    queue_event(
+        websocket,
+        {
+            "type": "settings_updated",
+            "data": settings,
+            "timestamp": datetime.utcnow(),
+        },
+    )
+
+
+def _handle_intervention_ack(
+    websocket: WebSocket, session_id: str, message: dict
+) -> None:
+    """Log that an intervention was seen or dismissed."""
+    data = message.get("data")
+    intervention_id = (
+        data.get("intervention_id") if isinstance(data, dict) else None
+    ) or message.get("intervention_id")
+    logger.info(f"Session {session_id}: Intervention {intervention_id} acknowledged")
+    # Could track this for analytics
+
+
+def _handle_unknown_message(
+    websocket: WebSocket, session_id: str, message: dict
+) -> None:
+    """Ignore client messages with an unrecognized type."""
+    logger.debug(
+        "Session {}: Unknown message type: {}", session_id, message.get("type")
+    )
+
+
+# Client message type -> handler for the session events WebSocket
+SESSION_EVENT_HANDLERS: Dict[str, Callable[[WebSocket, str, dict], None]] = {
+    "ping": _handle_ping,
+    "update_settings": _handle_update_settings,
+    "intervention_ack": _handle_intervention_ack,
+}
+
+
 @websocket_router.websocket("/sessions/{session_id}/events")
 async def session_events_websocket(websocket: WebSocket, session_id: str):
     """WebSocket endpoint for real-time session events.
@@ -421,104 +500,40 @@ async def session_events_websocket(websocket: WebSocket, session_id: str):
 
     try:
         # Send initial session state
-        facilitator_paused = session.status == SessionStatus.PAUSED
-        if facilitator_paused:
-            ai_status = "paused"
-        elif session.status == SessionStatus.IN_PROGRESS:
-            ai_status = "listening"
-        else:
-            ai_status = "idle"
-
-        await websocket.send_json(
-            {
-                "type": "session_state",
-                "data": {
-                    "status": session.status.value,
-                    "goal": session.goal,
-                    "durationMinutes": session.duration_minutes,
-                    "participants": [
-                        {
-                            "id": p.id,
-                            "name": p.name,
-                            "role": p.role,
-                            "consented": p.consented,
-                        }
-                        for p in session.participants
-                    ],
-                    "facilitatorConfig": {
-                        "persona": session.facilitator.persona.value,
-                        "interruptAuthority": session.facilitator.interrupt_authority,
-                        "directInquiry": session.facilitator.direct_inquiry,
-                        "silenceDetection": session.facilitator.silence_detection,
-                    },
-                    "botId": session.bot_id,
-                    "clientId": session.client_id,
-                    "facilitatorPaused": facilitator_paused,
-                    "aiStatus": ai_status,
-                },
-                "timestamp": datetime.utcnow().isoformat(),
-            }
-        )
+        queue_event(websocket, session_state_event(session))
 
         # Listen for client messages
         while True:
             try:
-                data = await websocket.receive_text()
-                message = json.loads(data)
-                message_type = message.get("type")
-
-                if message_type == "ping":
-                    # Heartbeat response
-                    await websocket.send_json(
-                        {
-                            "type": "pong",
-                            "timestamp": datetime.utcnow().isoformat(),
-                        }
-                    )
-
-                elif message_type == "update_settings":
-                    # Update facilitator settings mid-session
-                    settings = message.get("data") or message.get("settings", {})
-                    logger.info(
-                        f"Session {session_id}: Received settings update: {settings}"
-                    )
-                    # TODO: Forward settings to Pipecat process
-                    # await update_pipecat_settings(session.client_id, settings)
-
-                    # Acknowledge the update
-                    await websocket.send_json(
-                        {
-                            "type": "settings_updated",
-                            "data": settings,
-                            "timestamp": datetime.utcnow().isoformat(),
-                        }
-                    )
-
-                elif message_type == "intervention_ack":
-                    # Log that intervention was acknowledged
-                    intervention_id = (
-                        message.get("data", {}).get("intervention_id")
-                        or message.get("intervention_id")
-                    )
-                    logger.info(
-                        f"Session {session_id}: Intervention {intervention_id} acknowledged"
-                    )
-                    # Could track this for analytics
-
-                else:
-                    logger.debug(
-                        f"Session {session_id}: Unknown message type: {message_type}"
-                    )
+                data = await asyncio.wait_for(
+                    websocket.receive_text(), EVENTS_IDLE_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                # No heartbeat for a while: the peer is gone without a close
+                logger.info(f"Session events WebSocket idle for session {session_id}")
+                await websocket.close(code=1001, reason="Idle timeout")
+                break
 
-            except json.JSONDecodeError as e:
+            try:
+                message = orjson.loads(data)
+            except orjson.JSONDecodeError as e:
                 logger.warning(f"Session {session_id}: Invalid JSON received: {e}")
-                await websocket.send_json(
-                    {
-                        "type": "error",
-                        "data": {"message": "Invalid JSON format"},
-                        "timestamp": datetime.utcnow().isoformat(),
-                    }
-                )
+                _queue_error(websocket, "Invalid JSON format")
+                continue
+
+            if not isinstance(message, dict):
+                logger.warning(f"Session {session_id}: Non-object message received")
+                _queue_error(websocket, "Message must be a JSON object")
+                continue
+
+            # A non-string type (e.g. a list) would be unhashable as a key
+            msg_type = message.get("type")
+            handler = (
+                SESSION_EVENT_HANDLERS.get(msg_type, _handle_unknown_message)
+                if isinstance(msg_type, str)
+                else _handle_unknown_message
+            )
+            handler(websocket, session_id, message)
 
     except WebSocketDisconnect:
         logger.info(f"Session events WebSocket disconnected for session {session_id}")
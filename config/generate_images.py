@@ -1,3 +1,4 @@
+import asyncio
 import json
 import multiprocessing as mp
 import os
@@ -115,6 +116,46 @@ def get_available_models(api_key: str) -> list:
         return []
 
 
+async def upload_generated_images(
+    results, images_dir: Path, utfs_api_key: str, app_id: str
+) -> int:
+    """Upload generated images to UTFS and record their URLs on the personas."""
+    uploader = UTFSUploader(api_key=utfs_api_key, app_id=app_id)
+
+    try:
+        # Verify UTFS credentials before proceeding
+        if not await uploader.verify_credentials():
+            logger.error("Invalid UTFS credentials")
+            return 1
+
+        for persona_name, result in results:
+            try:
+                success = result.get()
+                if success:
+                    key = next(
+                        k
+                        for k, v in persona_manager.personas.items()
+                        if v["name"] == persona_name
+                    )
+
+                    # upload_file records the URL and image hash on the persona
+                    local_image_path = images_dir / f"{key}.png"
+                    file_url = await uploader.upload_file(local_image_path)
+
+                    if file_url:
+                        logger.success(
+                            f"✓ Successfully generated and uploaded image for {persona_name}"
+                        )
+                    else:
+                        logger.error(f"Failed to upload image for {persona_name}")
+            except Exception as e:
+                logger.error(f"✗ Failed to process image for {persona_name}: {str(e)}")
+
+        return 0
+    finally:
+        await uploader.close()
+
+
 def main():
     # Check for command line arguments only if environment variables are not set
     if not all([REPLICATE_KEY, UTFS_KEY, APP_ID]):
@@ -211,49 +252,11 @@ def main():
         persona_manager.save_personas()
 
     # After successful image generation, upload to UTFS
-    uploader = UTFSUploader(api_key=utfs_api_key, app_id=app_id)
-
-    # Verify UTFS credentials before proceeding
-    if not uploader.verify_credentials():
-        logger.error("Invalid UTFS credentials")
+    if asyncio.run(
+        upload_generated_images(results, images_dir, utfs_api_key, app_id)
+    ):
         return 1
 
-    for persona_name, result in results:
-        try:
-            success = result.get()
-            if success:
-                key = next(
-                    k
-                    for k, v in persona_manager.personas.items()
-                    if v["name"] == persona_name
-                )
-
-                # Get the complete current persona data
-                current_persona = persona_manager.personas[key]
-
-                # Upload to UTFS
-                local_image_path = images_dir / f"{key}.png"
-                file_url = uploader.upload_file(local_image_path)
-
-                if file_url:
-                    # Update only the image URL while preserving all other fields
-                    updated_persona = {
-                        **current_persona,  # Preserve all existing fields
-                        "image": file_url,  # Update only the image URL
-                    }
-
-                    # Save the updated persona
-                    if persona_manager.save_persona(key, updated_persona):
-                        logger.success(
-                            f"✓ Successfully generated and uploaded image for {persona_name}"
-                        )
-                    else:
-                        logger.error(
-                            f"Failed to save updated persona data for {persona_name}"
-                        )
-        except Exception as e:
-            logger.error(f"✗ Failed to process image for {persona_name}: {str(e)}")
-
     logger.success("Image generation and upload complete!")
 
 
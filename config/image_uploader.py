@@ -1,19 +1,35 @@
 import argparse
+import asyncio
 import hashlib
 import hmac
-import json
 import mimetypes
-import os
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
-import requests
+import aiohttp
+import orjson
 from loguru import logger
 
 from config.persona_utils import persona_manager
 
+# Load the system MIME tables once, up front, not on the first guess_type
+mimetypes.init()
+
+# Concurrent uploads in a --batch run
+BATCH_UPLOAD_CONCURRENCY = 8
+
+# Read size when streaming a download to disk
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# Existing-image HEAD checks fail fast; a slow URL is treated as missing
+URL_CHECK_TIMEOUT = aiohttp.ClientTimeout(sock_connect=1, sock_read=1)
+
+# Keep-alive connection pool: two requests per upload (prepare + storage POST)
+HTTP_POOL_SIZE = 2 * BATCH_UPLOAD_CONCURRENCY
+HTTP_KEEPALIVE_SECONDS = 30
+
 
 def safe_print(msg: str) -> None:
     """Print message safely handling Unicode encoding issues."""
@@ -24,6 +40,17 @@ def safe_print(msg: str) -> None:
         print(msg.encode("ascii", errors="replace").decode("ascii"), file=sys.stdout)
 
 
+def _orjson_dumps(obj) -> str:
+    """JSON request-body encoder for the uploader's HTTP session."""
+    return orjson.dumps(obj).decode()
+
+
+def _sha256_file(file_path: Path) -> str:
+    """Hex SHA-256 of a file's contents, streamed from disk."""
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 class UTFSUploader:
     def __init__(self, api_key: str, app_id: str):
         self.api_key = api_key
@@ -31,50 +58,113 @@ class UTFSUploader:
         self.base_url = "https://api.uploadthing.com"  # Updated base URL
         self.persona_manager = persona_manager
         self.uploaded_urls = self._load_existing_urls()
+        self._session: Optional[aiohttp.ClientSession] = None
+        # HEAD check results by URL, so each URL is probed at most once
+        self._url_validity: Dict[str, bool] = {}
 
         # Configure logger levels
         logger.remove()
         logger.add(safe_print, level="INFO")
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_POOL_SIZE, keepalive_timeout=HTTP_KEEPALIVE_SECONDS
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, json_serialize=_orjson_dumps
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     def _load_existing_urls(self) -> dict:
         """Load existing image URLs from personas"""
         return self.persona_manager.get_image_urls()
 
-    def _is_valid_url(self, url: str) -> bool:
+    async def _is_valid_url(self, url: str) -> bool:
         """Check if URL is valid and accessible"""
         if not url or not url.startswith("http"):
             return False
 
+        cached = self._url_validity.get(url)
+        if cached is not None:
+            return cached
+
         try:
-            response = requests.head(url, timeout=5)
-            return response.status_code == 200
+            session = await self._get_session()
+            async with session.head(url, timeout=URL_CHECK_TIMEOUT) as response:
+                valid = response.status == 200
         except Exception:
-            return False
+            valid = False
+
+        self._url_validity[url] = valid
+        return valid
 
-    def _image_needs_upload(self, persona_key: str) -> bool:
+    async def prefetch_url_validity(self) -> None:
+        """HEAD-check every existing uploadthing.com image URL concurrently"""
+        urls = {
+            url
+            for url in self.uploaded_urls.values()
+            if url and "uploadthing.com" in url and url not in self._url_validity
+        }
+        await asyncio.gather(*(self._is_valid_url(url) for url in urls))
+
+    async def _image_needs_upload(self, persona_key: str) -> bool:
         """Check if image needs to be uploaded"""
         # Check if URL exists and is from uploadthing.com
         current_url = self.uploaded_urls.get(persona_key, "")
         return not (
             current_url
             and "uploadthing.com" in current_url
-            and self._is_valid_url(current_url)
+            and await self._is_valid_url(current_url)
         )
 
-    def upload_file(
+    async def download_file(self, url: str, file_path: Path) -> int:
+        """Stream a URL to disk in fixed-size chunks, returning the HTTP status
+
+        The file is only written when the response status is 200.
+        """
+        session = await self._get_session()
+        async with session.get(url) as response:
+            if response.status != 200:
+                return response.status
+            with open(file_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_BYTES):
+                    f.write(chunk)
+            return response.status
+
+    async def upload_file(
         self, file_path: Path, custom_id: Optional[str] = None
     ) -> Optional[str]:
         """Upload a file using the UploadThing API"""
         # Extract persona key from filename
         persona_key = Path(file_path).stem
 
-        # Check if file exists locally
-        if not os.path.exists(file_path):
+        # One stat covers both the existence check and the size we send
+        try:
+            file_stat = Path(file_path).stat()
+        except FileNotFoundError:
             logger.error(f"File not found: {file_path}")
             return None
 
+        # Skip unchanged files whose upload we already recorded
+        file_digest = await asyncio.to_thread(_sha256_file, file_path)
+        persona = self.persona_manager.personas.get(persona_key, {})
+        recorded_url = persona.get("image", "")
+        if persona.get("image_sha256") == file_digest and recorded_url.startswith(
+            "https://"
+        ):
+            logger.info(f"Image unchanged since last upload for {persona_key}")
+            return recorded_url
+
         # Check if we need to upload
-        if not self._image_needs_upload(persona_key):
+        if not await self._image_needs_upload(persona_key):
             logger.info(f"Image already uploaded for {persona_key}")
             return self.uploaded_urls[persona_key]
 
@@ -83,7 +173,7 @@ class UTFSUploader:
         try:
             # Get file info
             file_name = file_path.name
-            file_size = file_path.stat().st_size
+            file_size = file_stat.st_size
             file_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
 
             # Step 1: Prepare the upload
@@ -103,39 +193,52 @@ class UTFSUploader:
             logger.info(f"Uploading file: {file_name} (size: {file_size} bytes)")
             logger.info(f"Headers: {headers}")
 
+            session = await self._get_session()
+
             # Get presigned URL
             logger.info("Making request to get presigned URL...")
-            response = requests.post(prepare_url, headers=headers, json=prepare_data)
-            logger.info(f"Presigned URL response status: {response.status_code}")
-            logger.debug(f"Presigned URL raw response: {response.text}")
-
-            if response.status_code != 200:
-                raise Exception(f"Failed to get presigned URL: {response.text}")
+            async with session.post(
+                prepare_url, headers=headers, json=prepare_data
+            ) as response:
+                body = await response.read()
+                logger.info(f"Presigned URL response status: {response.status}")
+                logger.debug("Presigned URL raw response: {}", body)
+
+                if response.status != 200:
+                    raise Exception(
+                        f"Failed to get presigned URL: {body.decode(errors='replace')}"
+                    )
 
-            presigned_data = response.json()
-            logger.debug(f"Parsed presigned data: {presigned_data}")
+            presigned_data = orjson.loads(body)
+            logger.debug("Parsed presigned data: {}", presigned_data)
 
             if not presigned_data.get("data"):
                 raise Exception("No presigned URL received")
 
             file_data = presigned_data["data"][0]
             logger.info(f"Got presigned URL: {file_data['url']}")
-            logger.debug(f"Upload fields: {file_data['fields']}")
+            logger.debug("Upload fields: {}", file_data["fields"])
 
-            # Step 2: Upload to presigned URL
+            # Step 2: Upload to presigned URL, streaming the file from disk
             logger.info("Starting file upload to presigned URL...")
             with open(file_path, "rb") as f:
-                upload_response = requests.post(
-                    file_data["url"],
-                    data=file_data["fields"],
-                    files={"file": (file_name, f, file_type)},
-                    timeout=30,
+                form = aiohttp.FormData()
+                for field_name, field_value in file_data["fields"].items():
+                    form.add_field(field_name, field_value)
+                form.add_field(
+                    "file", f, filename=file_name, content_type=file_type
                 )
-                logger.info(f"Upload response status: {upload_response.status_code}")
-                logger.debug(f"Upload response: {upload_response.text}")
+                async with session.post(
+                    file_data["url"],
+                    data=form,
+                    timeout=aiohttp.ClientTimeout(total=30),
+                ) as upload_response:
+                    upload_text = await upload_response.text()
+                    logger.info(f"Upload response status: {upload_response.status}")
+                    logger.debug("Upload response: {}", upload_text)
 
-                if upload_response.status_code != 204:
-                    raise Exception(f"Upload failed: {upload_response.text}")
+                    if upload_response.status != 204:
+                        raise Exception(f"Upload failed: {upload_text}")
 
             # Update personas.json with the new URL while preserving other fields
             try:
@@ -146,10 +249,11 @@ class UTFSUploader:
                     # Get the complete current persona data
                     current_persona = self.persona_manager.personas[base_filename]
 
-                    # Only update the image URL, preserving all other fields
+                    # Only update the image URL and hash, preserving all other fields
                     updated_persona = {
                         **current_persona,  # Preserve all existing fields
-                        "image": file_data["fileUrl"],  # Update only the image URL
+                        "image": file_data["fileUrl"],  # Update the image URL
+                        "image_sha256": file_digest,  # Hash of the uploaded file
                     }
 
                     # Save using PersonaManager
@@ -178,7 +282,7 @@ class UTFSUploader:
             logger.error(f"Error during upload: {str(e)}")
             return None
 
-    def check_api_health(self) -> bool:
+    async def check_api_health(self) -> bool:
         """Check if the API is responding"""
         try:
             logger.info("Checking API health...")
@@ -195,43 +299,46 @@ class UTFSUploader:
                 "contentDisposition": "inline",
             }
 
-            logger.debug(f"Making health check request with data: {test_data}")
-            response = requests.post(
-                test_url, headers=headers, json=test_data, timeout=10
-            )
-
-            logger.info(f"API health check response: {response.status_code}")
-            if response.status_code != 200:
-                logger.error(f"API response: {response.text}")
-
-            return response.status_code == 200
+            logger.debug("Making health check request with data: {}", test_data)
+            session = await self._get_session()
+            async with session.post(
+                test_url,
+                headers=headers,
+                json=test_data,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                logger.info(f"API health check response: {response.status}")
+                if response.status != 200:
+                    logger.error(f"API response: {await response.text()}")
+
+                return response.status == 200
         except Exception as e:
             logger.error(f"Error checking API health: {str(e)}")
             return False
 
-    def verify_credentials(self) -> bool:
+    async def verify_credentials(self) -> bool:
         """Verify API key and app ID are valid"""
         try:
             logger.info("Verifying credentials...")
-            response = requests.post(
+            session = await self._get_session()
+            async with session.post(
                 f"{self.base_url}/v7/getAppInfo",
                 headers={
                     "x-uploadthing-api-key": self.api_key,
                     "x-uploadthing-version": "7.0.0",
                     "Content-Type": "application/json",
                 },
-                timeout=5,
-            )
-
-            logger.info(f"Credentials check response: {response.status_code}")
-            if response.status_code != 200:
-                logger.error(
-                    f"API returned status {response.status_code}: {response.text}"
-                )
-                return False
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as response:
+                logger.info(f"Credentials check response: {response.status}")
+                if response.status != 200:
+                    logger.error(
+                        f"API returned status {response.status}: {await response.text()}"
+                    )
+                    return False
 
-            app_info = response.json()
-            logger.debug(f"App info: {app_info}")
+                app_info = orjson.loads(await response.read())
+            logger.debug("App info: {}", app_info)
 
             # Verify app ID matches
             if app_info.get("appId") != self.app_id:
@@ -246,7 +353,7 @@ class UTFSUploader:
 
 
 def create_parser() -> argparse.ArgumentParser:
-    def verify_upload_endpoint(self) -> bool:
+    async def verify_upload_endpoint(self) -> bool:
         """Verify if we can prepare an upload"""
         try:
             logger.info("Testing upload preparation...")
@@ -260,14 +367,17 @@ def create_parser() -> argparse.ArgumentParser:
                 "files": [{"name": "test.png", "size": 1024, "type": "image/png"}]
             }
 
-            response = requests.post(
-                prepare_url, headers=prepare_headers, json=prepare_data, timeout=10
-            )
-
-            logger.info(f"Upload preparation response: {response.status_code}")
-            if response.status_code != 200:
-                logger.error(f"Upload preparation failed: {response.text}")
-            return response.status_code == 200
+            session = await self._get_session()
+            async with session.post(
+                prepare_url,
+                headers=prepare_headers,
+                json=prepare_data,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as response:
+                logger.info(f"Upload preparation response: {response.status}")
+                if response.status != 200:
+                    logger.error(f"Upload preparation failed: {await response.text()}")
+                return response.status == 200
         except Exception as e:
             logger.error(f"Error testing upload endpoint: {str(e)}")
             return False
@@ -292,24 +402,35 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main():
-    """Main entry point for the image uploader"""
-    parser = create_parser()
-    args = parser.parse_args()
+async def _upload_batch(uploader: UTFSUploader, image_files: List[Path]) -> None:
+    """Upload image files concurrently, logging each outcome."""
+    semaphore = asyncio.Semaphore(BATCH_UPLOAD_CONCURRENCY)
 
-    if not args.batch and not args.file_path:
-        parser.error("Either --file-path or --batch must be specified")
+    async def upload_one(image_file: Path) -> None:
+        async with semaphore:
+            logger.info(f"Processing file: {image_file}")
+            file_url = await uploader.upload_file(file_path=image_file)
 
-    try:
-        uploader = UTFSUploader(api_key=args.api_key, app_id=args.app_id)
+        if not file_url:
+            logger.error(f"Failed to upload {image_file}")
+            return
+
+        logger.success(f"Successfully uploaded: {image_file} -> {file_url}")
 
+    await asyncio.gather(*(upload_one(image_file) for image_file in image_files))
+
+
+async def _run(args: argparse.Namespace) -> int:
+    """Run the uploader for parsed command line arguments"""
+    uploader = UTFSUploader(api_key=args.api_key, app_id=args.app_id)
+    try:
         # Check API health first
-        if not uploader.check_api_health():
+        if not await uploader.check_api_health():
             logger.error("UploadThing API is not responding")
             return 1
 
         # Verify credentials
-        if not uploader.verify_credentials():
+        if not await uploader.verify_credentials():
             logger.error("Invalid API key or app ID")
             return 1
 
@@ -320,29 +441,28 @@ def main():
                 logger.error(f"local_images directory not found at {local_images_dir}")
                 return 1
 
-            # Process each image file in the directory
+            # Collect each image file in the directory
+            image_files = []
             for image_file in local_images_dir.glob("*"):
                 if not image_file.is_file():
                     continue
 
-                if not mimetypes.guess_type(image_file)[0] or not mimetypes.guess_type(
-                    image_file
-                )[0].startswith("image/"):
+                file_type = mimetypes.guess_type(image_file)[0]
+                if not file_type or not file_type.startswith("image/"):
                     logger.warning(f"Skipping non-image file: {image_file}")
                     continue
 
-                logger.info(f"Processing file: {image_file}")
-                file_url = uploader.upload_file(file_path=image_file)
+                image_files.append(image_file)
 
-                if not file_url:
-                    logger.error(f"Failed to upload {image_file}")
-                    continue  # Changed from return 1 to continue to process other files
+            # Check existing URLs up front so skip decisions are lookups
+            await uploader.prefetch_url_validity()
 
-                logger.success(f"Successfully uploaded: {image_file} -> {file_url}")
+            # Failed files are logged and skipped so the rest still upload
+            await _upload_batch(uploader, image_files)
 
         else:
             # Single file upload
-            file_url = uploader.upload_file(
+            file_url = await uploader.upload_file(
                 file_path=args.file_path, custom_id=args.custom_id
             )
             if not file_url:
@@ -351,7 +471,20 @@ def main():
             logger.success(f"Successfully uploaded: {args.file_path} -> {file_url}")
 
         return 0
+    finally:
+        await uploader.close()
+
 
+def main():
+    """Main entry point for the image uploader"""
+    parser = create_parser()
+    args = parser.parse_args()
+
+    if not args.batch and not args.file_path:
+        parser.error("Either --file-path or --batch must be specified")
+
+    try:
+        return asyncio.run(_run(args))
     except Exception as e:
         logger.error(f"Error during upload: {str(e)}")
         return 1
@@ -25,6 +25,8 @@ class PersonaManager:
         self.personas_dir = personas_dir or Path(__file__).parent / "personas"
         self.md = markdown.Markdown(extensions=["meta"])
         self.personas = self.load_personas()
+        # Resolved get_persona results by requested name; cleared on save
+        self._resolved_personas: Dict[str, Dict] = {}
 
     def parse_readme(self, content: str) -> Dict:
         """Parse README.md content to extract persona information"""
@@ -48,6 +50,7 @@ class PersonaManager:
             "cartesia_voice_id": "",
             "gender": "",
             "relevant_links": [],
+            "image_sha256": "",
         }  # Default values
         for section in sections:
             if section.startswith("Metadata"):
@@ -76,6 +79,7 @@ class PersonaManager:
             "cartesia_voice_id": metadata.get("cartesia_voice_id", ""),
             "gender": metadata.get("gender", ""),
             "relevant_links": metadata.get("relevant_links", []),
+            "image_sha256": metadata.get("image_sha256", ""),
         }
 
     def load_additional_content(self, persona_dir: Path) -> str:
@@ -132,6 +136,7 @@ class PersonaManager:
 
     def save_persona(self, key: str, persona: Dict) -> bool:
         """Save a single persona's data"""
+        self._resolved_personas.clear()
         try:
             persona_dir = self.personas_dir / key
             persona_dir.mkdir(exist_ok=True)
@@ -153,6 +158,7 @@ class PersonaManager:
                         ),
                         "gender": existing_persona.get("gender", ""),
                         "relevant_links": existing_persona.get("relevant_links", []),
+                        "image_sha256": existing_persona.get("image_sha256", ""),
                     }
 
             # Merge existing metadata with new data, preferring new data when available
@@ -172,8 +178,18 @@ class PersonaManager:
                 "relevant_links": persona.get(
                     "relevant_links", existing_metadata.get("relevant_links", [])
                 ),
+                "image_sha256": persona.get(
+                    "image_sha256", existing_metadata.get("image_sha256", "")
+                ),
             }
 
+            # Only personas with an uploaded image carry a content hash
+            image_hash_line = (
+                f"\n- image_sha256: {metadata['image_sha256']}"
+                if metadata["image_sha256"]
+                else ""
+            )
+
             # Format characteristics and voice characteristics
             characteristics = "\n".join(f"- {char}" for char in DEFAULT_CHARACTERISTICS)
             voice_chars = "\n".join(
@@ -196,7 +212,7 @@ class PersonaManager:
 - entry_message: {metadata['entry_message']}
 - cartesia_voice_id: {metadata['cartesia_voice_id']}
 - gender: {metadata['gender']}
-- relevant_links: {' '.join(metadata['relevant_links'])}
+- relevant_links: {' '.join(metadata['relevant_links'])}{image_hash_line}
 """
 
             with open(readme_file, "w", encoding="utf-8") as f:
@@ -222,6 +238,17 @@ class PersonaManager:
 
     def get_persona(self, name: Optional[str] = None) -> Dict:
         """Get a persona by name or return a random one"""
+        if name:
+            cached = self._resolved_personas.get(name)
+            if cached is not None:
+                return cached.copy()
+            persona = self._resolve_persona(name)
+            self._resolved_personas[name] = persona
+            return persona.copy()
+        return self._resolve_persona(None)
+
+    def _resolve_persona(self, name: Optional[str]) -> Dict:
+        """Look up a persona and derive its prompt and path fields"""
         if name:
             # Convert to folder name format
             folder_name = name.lower().replace(" ", "_")
@@ -1,18 +1,25 @@
 import asyncio
 import os
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
 from loguru import logger
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from config.persona_utils import PersonaManager
 
 # Environment variables loaded centrally in app/__init__.py
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# How long a fetched Cartesia voice catalog is reused before refetching
+VOICE_CATALOG_TTL_SECONDS = 300
+
+# Concurrent GPT voice-matching requests when matching every persona
+VOICE_MATCH_CONCURRENCY = 8
 SUPPORTED_LANGUAGES = [
     "English (en)",
     "French (fr)",
@@ -39,12 +46,43 @@ class CartesiaVoiceManager:
         if not self.api_key:
             logger.warning("Cartesia API key not found in environment variables")
 
+        # Cached voice catalog, also bucketed by language code
+        self._voices: List[Dict] = []
+        self._voices_by_language: Dict[str, List[Dict]] = {}
+        self._voices_fetched_at = 0.0
+        self._fetch_lock = asyncio.Lock()
+
     async def list_voices(self) -> List[Dict]:
-        """List all available Cartesia voices"""
+        """List all available Cartesia voices, cached for a few minutes"""
         if not self.api_key:
             logger.warning("Cannot list voices: No API key provided")
             return []
 
+        async with self._fetch_lock:
+            if (
+                self._voices
+                and time.monotonic() - self._voices_fetched_at
+                < VOICE_CATALOG_TTL_SECONDS
+            ):
+                return self._voices
+
+            voices = await self._fetch_voices()
+            if voices:
+                by_language: Dict[str, List[Dict]] = {}
+                for voice in voices:
+                    by_language.setdefault(voice.get("language"), []).append(voice)
+                self._voices = voices
+                self._voices_by_language = by_language
+                self._voices_fetched_at = time.monotonic()
+            return voices
+
+    async def voices_for(self, language_code: str) -> List[Dict]:
+        """List the available Cartesia voices for one language"""
+        await self.list_voices()
+        return self._voices_by_language.get(language_code, [])
+
+    async def _fetch_voices(self) -> List[Dict]:
+        """Fetch the full voice catalog from the Cartesia API"""
         url = "https://api.cartesia.ai/voices/"
         headers = {"X-API-Key": self.api_key, "Cartesia-Version": "2024-06-10"}
 
@@ -66,10 +104,28 @@ class CartesiaVoiceManager:
 # Create global instance
 cartesia_voice_manager = CartesiaVoiceManager()
 
+# Numbered voice list for the matching prompt, per language
+# Maps language_code -> (voice list it was built from, text)
+_VOICES_TEXT_CACHE: Dict[str, Tuple[List[Dict], str]] = {}
+
+
+def _voices_text(language_code: str, voices: List[Dict]) -> str:
+    """Render the numbered voice list, reusing it while the catalog is unchanged"""
+    cached = _VOICES_TEXT_CACHE.get(language_code)
+    if cached is not None and cached[0] is voices:
+        return cached[1]
+
+    text = "\n".join(
+        f"Voice {i+1}: {v['name']} - {v.get('description', 'No description')}"
+        for i, v in enumerate(voices)
+    )
+    _VOICES_TEXT_CACHE[language_code] = (voices, text)
+    return text
+
 
 class VoiceUtils:
     def __init__(self):
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
+        self.client = AsyncOpenAI(api_key=OPENAI_API_KEY)
         self.persona_manager = PersonaManager()
 
     async def save_voices_to_md(self) -> Optional[Path]:
@@ -121,20 +177,14 @@ class VoiceUtils:
                 return None
 
             # Get available voices
-            voices = await cartesia_voice_manager.list_voices()
-            voices = [v for v in voices if v.get("language") == language_code]
+            voices = await cartesia_voice_manager.voices_for(language_code)
 
             if not voices:
                 logger.error(f"No voices available for language {language_code}")
                 return None
 
             # Prepare prompt for GPT-4
-            voices_text = "\n".join(
-                [
-                    f"Voice {i+1}: {v['name']} - {v.get('description', 'No description')}"
-                    for i, v in enumerate(voices)
-                ]
-            )
+            voices_text = _voices_text(language_code, voices)
 
             # Truncate the persona prompt to avoid context length errors
             # Voice matching only needs the core description, not additional content
@@ -156,7 +206,7 @@ Which voice number (1-{len(voices)}) would be the most appropriate match?
 Respond with ONLY the number."""
 
             # Get GPT-4o-mini's recommendation (128k context, faster and cheaper)
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=10,
@@ -225,12 +275,24 @@ async def main():
     voice_utils = VoiceUtils()
     await voice_utils.save_voices_to_md()
 
-    # Example of matching voices to all personas
-    for persona_key in voice_utils.persona_manager.personas:
-        voice_id = await voice_utils.match_voice_to_persona(persona_key)
+    # Example of matching voices to all personas, concurrently
+    persona_keys = list(voice_utils.persona_manager.personas)
+    semaphore = asyncio.Semaphore(VOICE_MATCH_CONCURRENCY)
+
+    async def match(persona_key: str) -> Optional[str]:
+        async with semaphore:
+            return await voice_utils.match_voice_to_persona(persona_key)
+
+    voice_ids = await asyncio.gather(*(match(key) for key in persona_keys))
+    for persona_key, voice_id in zip(persona_keys, voice_ids):
         if voice_id:
             await voice_utils.update_persona_voice(persona_key, voice_id)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
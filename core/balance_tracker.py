@@ -5,27 +5,17 @@ percentages. Used to trigger balance interventions when one participant
 dominates the conversation.
 """
 
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
-class SpeakerMetrics:
-    """Metrics for a single speaker's participation.
+def _now_ms() -> int:
+    """Current monotonic clock reading in integer milliseconds."""
+    return time.monotonic_ns() // 1_000_000
 
-    Attributes:
-        total_speaking_time_ms: Cumulative speaking time in milliseconds.
-        last_spoke_at: Timestamp when the speaker started their current turn.
-        is_speaking: Whether the speaker is currently speaking.
-    """
-
-    total_speaking_time_ms: int = 0
-    last_spoke_at: Optional[datetime] = None
-    is_speaking: bool = False
 
-
-@dataclass
+@dataclass(slots=True)
 class BalanceResult:
     """Result of a balance calculation.
 
@@ -48,7 +38,7 @@ class BalanceResult:
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization."""
         if self.waiting_for_speakers:
-            return {"status": "waiting_for_speakers"}
+            return _WAITING_DICT
 
         return {
             "participantA": {
@@ -63,6 +53,12 @@ class BalanceResult:
         }
 
 
+# Shared result for trackers that have not yet heard two speakers; treat
+# both as read-only
+_WAITING_DICT: Dict = {"status": "waiting_for_speakers"}
+_WAITING = BalanceResult(waiting_for_speakers=True)
+
+
 class BalanceTracker:
     """Tracks talk balance between two participants.
 
@@ -79,12 +75,16 @@ class BalanceTracker:
         - Mild imbalance for 3+ minutes: Visual balance prompt
         - Severe imbalance for 5+ minutes: Voice balance prompt
 
+    Speaker state is held struct-of-arrays style in two fixed slots, one
+    per participant, indexed through a speaker_id -> slot map. Speakers
+    beyond the first two are ignored.
+
     Attributes:
         session_id: The session being tracked.
-        speakers: Dictionary of speaker_id to SpeakerMetrics.
-        session_start: When the session started.
-        imbalance_start: When mild imbalance began (for intervention timing).
-        severe_imbalance_start: When severe imbalance began.
+        session_start: Monotonic ms when the session started.
+        imbalance_start: Monotonic ms when mild imbalance began (for
+            intervention timing).
+        severe_imbalance_start: Monotonic ms when severe imbalance began.
     """
 
     # Thresholds for balance status determination
@@ -92,8 +92,16 @@ class BalanceTracker:
     SEVERE_IMBALANCE_THRESHOLD = 40  # >40% difference = severe imbalance (70/30)
 
     # Duration thresholds for intervention triggers
-    MILD_IMBALANCE_DURATION = timedelta(minutes=3)
-    SEVERE_IMBALANCE_DURATION = timedelta(minutes=5)
+    MILD_IMBALANCE_DURATION_MS = 3 * 60 * 1000
+    SEVERE_IMBALANCE_DURATION_MS = 5 * 60 * 1000
+
+    # How long a computed balance is reused while speaker state is unchanged
+    BALANCE_CACHE_TICK_MS = 100
+
+    # How long a trigger decision is reused while speaker state is unchanged,
+    # unless an imbalance timer is within the margin of its threshold
+    TRIGGER_CHECK_TICK_MS = 1000
+    TRIGGER_BOUNDARY_MARGIN_MS = 2000
 
     def __init__(self, session_id: str):
         """Initialize the balance tracker.
@@ -102,12 +110,23 @@ class BalanceTracker:
             session_id: The unique session identifier.
         """
         self.session_id = session_id
-        self.speakers: Dict[str, SpeakerMetrics] = {}
-        self.session_start: datetime = datetime.utcnow()
+
+        # Two-slot speaker state: id, banked ms, turn start (ms), speaking
+        self._slot: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = [None, None]
+        self._totals: List[int] = [0, 0]
+        self._last: List[Optional[int]] = [None, None]
+        self._speaking: List[bool] = [False, False]
+        self.session_start: int = _now_ms()
 
         # Imbalance tracking for intervention triggers
-        self.imbalance_start: Optional[datetime] = None
-        self.severe_imbalance_start: Optional[datetime] = None
+        self.imbalance_start: Optional[int] = None
+        self.severe_imbalance_start: Optional[int] = None
+
+        # Bumped on every speaker state change; keys the cached balance
+        self._dirty = 0
+        self._cached_balance: Optional[Tuple[Tuple[int, int], BalanceResult]] = None
+        self._last_check: Optional[Tuple[Tuple[int, int], Optional[str]]] = None
 
     def update_speaker(self, speaker_id: str, is_speaking: bool) -> None:
         """Update speaker state from diarization.
@@ -120,22 +139,22 @@ class BalanceTracker:
             speaker_id: Unique identifier for the speaker.
             is_speaking: Whether the speaker is currently speaking.
         """
-        if speaker_id not in self.speakers:
-            self.speakers[speaker_id] = SpeakerMetrics()
-
-        metrics = self.speakers[speaker_id]
-        now = datetime.utcnow()
+        idx = self._slot_for(speaker_id)
+        if idx is None:
+            return
 
-        if is_speaking and not metrics.is_speaking:
+        if is_speaking and not self._speaking[idx]:
             # Speaker started speaking
-            metrics.is_speaking = True
-            metrics.last_spoke_at = now
-        elif not is_speaking and metrics.is_speaking:
+            self._speaking[idx] = True
+            self._last[idx] = _now_ms()
+            self._dirty += 1
+        elif not is_speaking and self._speaking[idx]:
             # Speaker stopped speaking - accumulate time
-            if metrics.last_spoke_at:
-                duration = (now - metrics.last_spoke_at).total_seconds() * 1000
-                metrics.total_speaking_time_ms += int(duration)
-            metrics.is_speaking = False
+            last = self._last[idx]
+            if last is not None:
+                self._totals[idx] += _now_ms() - last
+            self._speaking[idx] = False
+            self._dirty += 1
 
     def add_speaking_duration(self, speaker_id: str, duration_ms: int) -> None:
         """Add speaking time directly (used when diarization provides durations).
@@ -147,10 +166,59 @@ class BalanceTracker:
         if duration_ms <= 0:
             return
 
-        if speaker_id not in self.speakers:
-            self.speakers[speaker_id] = SpeakerMetrics()
+        idx = self._slot_for(speaker_id)
+        if idx is None:
+            return
+
+        self._totals[idx] += int(duration_ms)
+        self._dirty += 1
+
+    def add_speaking_durations(self, durations_ms: Dict[str, int]) -> None:
+        """Add a batch of diarized durations with a single cache invalidation.
+
+        Args:
+            durations_ms: Mapping of speaker ID to duration in milliseconds.
+        """
+        totals = self._totals
+        changed = False
+        for speaker_id, duration_ms in durations_ms.items():
+            if duration_ms <= 0:
+                continue
+            idx = self._slot_for(speaker_id)
+            if idx is None:
+                continue
+            totals[idx] += int(duration_ms)
+            changed = True
+
+        if changed:
+            self._dirty += 1
+
+    def _slot_for(self, speaker_id: str) -> Optional[int]:
+        """Return the speaker's slot, claiming a free one on first sight.
 
-        self.speakers[speaker_id].total_speaking_time_ms += int(duration_ms)
+        Returns:
+            0 or 1, or None once both slots belong to other speakers.
+        """
+        idx = self._slot.get(speaker_id)
+        if idx is None:
+            idx = len(self._slot)
+            if idx == 2:
+                return None
+            self._slot[speaker_id] = idx
+            self._ids[idx] = speaker_id
+            self._dirty += 1
+        return idx
+
+    def _slot_time(self, idx: int, now_ms: int) -> int:
+        """Speaking time for a slot, including any turn still in progress."""
+        last = self._last[idx]
+        if self._speaking[idx] and last is not None:
+            return self._totals[idx] + now_ms - last
+        return self._totals[idx]
+
+    def is_anyone_speaking(self) -> bool:
+        """Return True if either tracked speaker is mid-turn."""
+        return self._speaking[0] or self._speaking[1]
 
     def get_current_speaking_time(self, speaker_id: str) -> int:
         """Get total speaking time including current turn.
@@ -161,47 +229,47 @@ class BalanceTracker:
         Returns:
             Total speaking time in milliseconds.
         """
-        if speaker_id not in self.speakers:
+        idx = self._slot.get(speaker_id)
+        if idx is None:
             return 0
-
-        metrics = self.speakers[speaker_id]
-        total = metrics.total_speaking_time_ms
-
-        # Add current speaking duration if actively speaking
-        if metrics.is_speaking and metrics.last_spoke_at:
-            current_duration = (
-                datetime.utcnow() - metrics.last_spoke_at
-            ).total_seconds() * 1000
-            total += int(current_duration)
-
-        return total
+        return self._slot_time(idx, _now_ms())
 
     def get_balance(self) -> BalanceResult:
         """Calculate current talk balance percentages.
 
+        The result is reused until speaker state changes or the clock moves
+        into the next BALANCE_CACHE_TICK_MS window, so several callers
+        in one update pay for a single computation.
+
         Returns:
             BalanceResult with participant percentages and status.
         """
-        if len(self.speakers) < 2:
-            return BalanceResult(waiting_for_speakers=True)
+        key = (self._dirty, _now_ms() // self.BALANCE_CACHE_TICK_MS)
+        cached = self._cached_balance
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
-        speaker_ids = list(self.speakers.keys())
+        balance = self._compute_balance()
+        self._cached_balance = (key, balance)
+        return balance
 
-        # Get current speaking times (including active speakers)
-        times = [self.get_current_speaking_time(sid) for sid in speaker_ids]
-        total = sum(times)
+    def _compute_balance(self) -> BalanceResult:
+        """Calculate talk balance percentages from current speaker state."""
+        if len(self._slot) < 2:
+            return _WAITING
 
-        if total == 0:
-            percentages = [50, 50]
-        else:
-            percentages = [int((t / total) * 100) for t in times]
+        # Get current speaking times (including active speakers)
+        now_ms = _now_ms()
+        time_a = self._slot_time(0, now_ms)
+        time_b = self._slot_time(1, now_ms)
+        total = time_a + time_b
 
-        # Ensure percentages sum to 100 (handle rounding)
-        if percentages[0] + percentages[1] != 100:
-            percentages[1] = 100 - percentages[0]
+        # Integer split, rounded half up; the pair always sums to 100
+        percentage_a = 50 if total == 0 else (time_a * 100 + (total >> 1)) // total
+        percentage_b = 100 - percentage_a
 
         # Determine status based on difference
-        diff = abs(percentages[0] - percentages[1])
+        diff = abs(percentage_a - percentage_b)
 
         if diff <= self.MILD_IMBALANCE_THRESHOLD:
             status = "balanced"
@@ -211,59 +279,108 @@ class BalanceTracker:
             status = "severe_imbalance"
 
         return BalanceResult(
-            participant_a_id=speaker_ids[0],
-            participant_a_percentage=percentages[0],
-            participant_b_id=speaker_ids[1],
-            participant_b_percentage=percentages[1],
+            participant_a_id=self._ids[0],
+            participant_a_percentage=percentage_a,
+            participant_b_id=self._ids[1],
+            participant_b_percentage=percentage_b,
             status=status,
             waiting_for_speakers=False,
         )
 
-    def check_intervention_trigger(self) -> Optional[str]:
+    def check_intervention_trigger(
+        self, balance: Optional[BalanceResult] = None
+    ) -> Optional[str]:
         """Check if balance warrants intervention.
 
         Evaluates current balance state and duration to determine
         if an intervention should be triggered.
 
+        Args:
+            balance: A balance already computed by the caller, if any.
+
         Returns:
             "severe_balance" for voice intervention (5+ min at 70/30+)
             "balance" for visual intervention (3+ min at 65/35+)
             None if no intervention needed
         """
-        balance = self.get_balance()
+        now_ms = _now_ms()
+        key = (self._dirty, now_ms // self.TRIGGER_CHECK_TICK_MS)
+        last = self._last_check
+        if (
+            balance is None
+            and last is not None
+            and last[0] == key
+            and not self._near_trigger_boundary(now_ms)
+        ):
+            return last[1]
+
+        trigger = self._evaluate_trigger(balance, now_ms)
+        self._last_check = (key, trigger)
+        return trigger
+
+    def _near_trigger_boundary(self, now_ms: int) -> bool:
+        """Return True if an imbalance timer is about to reach its threshold.
+
+        A threshold crossed within the last tick also counts, so a decision
+        cached just before the crossing isn't reused after it.
+        """
+        margin = self.TRIGGER_BOUNDARY_MARGIN_MS
+        tick = self.TRIGGER_CHECK_TICK_MS
+        for start, duration in (
+            (self.imbalance_start, self.MILD_IMBALANCE_DURATION_MS),
+            (self.severe_imbalance_start, self.SEVERE_IMBALANCE_DURATION_MS),
+        ):
+            if start is not None and -tick <= start + duration - now_ms < margin:
+                return True
+        return False
+
+    def _evaluate_trigger(
+        self, balance: Optional[BalanceResult], now_ms: int
+    ) -> Optional[str]:
+        """Advance the imbalance timers and return the trigger, if any."""
+        if balance is None:
+            balance = self.get_balance()
         if balance.waiting_for_speakers:
             return None
 
-        now = datetime.utcnow()
         status = balance.status
 
         # Check for severe imbalance (voice intervention)
         if status == "severe_imbalance":
-            if not self.severe_imbalance_start:
-                self.severe_imbalance_start = now
-            elif (now - self.severe_imbalance_start) > self.SEVERE_IMBALANCE_DURATION:
+            if self.severe_imbalance_start is None:
+                self.severe_imbalance_start = now_ms
+            elif (
+                now_ms - self.severe_imbalance_start
+                > self.SEVERE_IMBALANCE_DURATION_MS
+            ):
                 return "severe_balance"  # Voice intervention
         else:
             self.severe_imbalance_start = None
 
         # Check for mild imbalance (visual intervention)
         if status in ("mild_imbalance", "severe_imbalance"):
-            if not self.imbalance_start:
-                self.imbalance_start = now
-            elif (now - self.imbalance_start) > self.MILD_IMBALANCE_DURATION:
+            if self.imbalance_start is None:
+                self.imbalance_start = now_ms
+            elif now_ms - self.imbalance_start > self.MILD_IMBALANCE_DURATION_MS:
                 return "balance"  # Visual intervention
         else:
             self.imbalance_start = None
 
         return None
 
-    def get_dominant_speaker(self) -> Optional[str]:
+    def get_dominant_speaker(
+        self, balance: Optional[BalanceResult] = None
+    ) -> Optional[str]:
         """Get the ID of the speaker with more talk time.
 
+        Args:
+            balance: A balance already computed by the caller, if any.
+
         Returns:
             Speaker ID with higher percentage, or None if balanced/waiting.
         """
-        balance = self.get_balance()
+        if balance is None:
+            balance = self.get_balance()
         if balance.waiting_for_speakers or balance.status == "balanced":
             return None
 
@@ -271,15 +388,21 @@ class BalanceTracker:
             return balance.participant_a_id
         return balance.participant_b_id
 
-    def get_quiet_speaker(self) -> Optional[str]:
+    def get_quiet_speaker(
+        self, balance: Optional[BalanceResult] = None
+    ) -> Optional[str]:
         """Get the ID of the speaker with less talk time.
 
         Useful for intervention targeting.
 
+        Args:
+            balance: A balance already computed by the caller, if any.
+
         Returns:
             Speaker ID with lower percentage, or None if balanced/waiting.
         """
-        balance = self.get_balance()
+        if balance is None:
+            balance = self.get_balance()
         if balance.waiting_for_speakers or balance.status == "balanced":
             return None
 
@@ -295,6 +418,7 @@ class BalanceTracker:
         """
         self.imbalance_start = None
         self.severe_imbalance_start = None
+        self._last_check = None
 
     def get_session_duration_seconds(self) -> float:
         """Get total session duration in seconds.
@@ -302,7 +426,7 @@ class BalanceTracker:
         Returns:
             Duration since session start in seconds.
         """
-        return (datetime.utcnow() - self.session_start).total_seconds()
+        return (_now_ms() - self.session_start) / 1000
 
     def to_metrics_dict(self) -> Dict:
         """Export metrics for API response.
@@ -311,18 +435,29 @@ class BalanceTracker:
             Dictionary with speaker metrics and balance state.
         """
         balance = self.get_balance()
+        now_ms = _now_ms()
+
+        # Same rules as get_dominant_speaker/get_quiet_speaker, derived once
+        dominant_speaker = quiet_speaker = None
+        if not balance.waiting_for_speakers and balance.status != "balanced":
+            if balance.participant_a_percentage > balance.participant_b_percentage:
+                dominant_speaker = balance.participant_a_id
+                quiet_speaker = balance.participant_b_id
+            else:
+                dominant_speaker = balance.participant_b_id
+                quiet_speaker = balance.participant_a_id
 
         return {
             "session_id": self.session_id,
-            "session_duration_seconds": self.get_session_duration_seconds(),
+            "session_duration_seconds": (now_ms - self.session_start) / 1000,
             "balance": balance.to_dict(),
-            "dominant_speaker": self.get_dominant_speaker(),
-            "quiet_speaker": self.get_quiet_speaker(),
+            "dominant_speaker": dominant_speaker,
+            "quiet_speaker": quiet_speaker,
             "speakers": {
-                sid: {
-                    "total_speaking_time_ms": self.get_current_speaking_time(sid),
-                    "is_speaking": metrics.is_speaking,
+                self._ids[idx]: {
+                    "total_speaking_time_ms": self._slot_time(idx, now_ms),
+                    "is_speaking": self._speaking[idx],
                 }
-                for sid, metrics in self.speakers.items()
+                for idx in range(len(self._slot))
             },
         }
@@ -1,28 +1,121 @@
 """Connection management for WebSocket clients and Pipecat processes."""
 
+import asyncio
 import subprocess
-from typing import Dict, List, Optional, Tuple
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from fastapi import WebSocket
 
 from meetingbaas_pipecat.utils.logger import logger
 
+
+@dataclass(slots=True)
+class MeetingDetail:
+    """Meeting configuration for a client, read by the WebSocket handlers."""
+
+    meeting_url: Optional[str]
+    persona_name: str
+    meetingbaas_bot_id: Optional[str]
+    enable_tools: bool
+    streaming_audio_frequency: str
+    persona_data: Dict[str, Any]
+
+
 # Global dictionary to store meeting details for each client
-MEETING_DETAILS: Dict[
-    str, Tuple[str, str, Optional[str], bool, str]
-] = {}  # client_id -> (meeting_url, persona_name, meetingbaas_bot_id, enable_tools, streaming_audio_frequency)
+MEETING_DETAILS: Dict[str, MeetingDetail] = {}  # client_id -> MeetingDetail
+
+# MeetingBaas bot IDs kept as their own column for scans over active bots
+BOT_IDS: Dict[str, str] = {}  # client_id -> meetingbaas_bot_id
+
+# Reverse index so bot-ID lookups don't scan every active client
+BOT_ID_TO_CLIENT: Dict[str, str] = {}  # meetingbaas_bot_id -> client_id
 
 # Global dictionary to store Pipecat processes
 PIPECAT_PROCESSES: Dict[str, subprocess.Popen] = {}  # client_id -> process
 
+# Clients whose Pipecat process was running at the last liveness check, so
+# connect-time checks are a set lookup rather than a waitpid syscall
+PIPECAT_ALIVE: Set[str] = set()
+
+# Seconds between liveness checks of running Pipecat processes
+PIPECAT_REAP_INTERVAL = 0.5
+
+# Seconds a background WebSocket close may take before it is abandoned
+WEBSOCKET_CLOSE_TIMEOUT = 1.0
+
+# Background closes, referenced so they aren't garbage collected mid-run
+_CLOSE_TASKS: Set[asyncio.Task] = set()
+
+
+def set_meeting_bot_id(client_id: str, meetingbaas_bot_id: str) -> None:
+    """Record the MeetingBaas bot ID once the bot has been created."""
+    MEETING_DETAILS[client_id].meetingbaas_bot_id = meetingbaas_bot_id
+    previous = BOT_IDS.get(client_id)
+    if previous is not None and BOT_ID_TO_CLIENT.get(previous) == client_id:
+        del BOT_ID_TO_CLIENT[previous]
+    BOT_IDS[client_id] = meetingbaas_bot_id
+    BOT_ID_TO_CLIENT[meetingbaas_bot_id] = client_id
+
+
+def remove_meeting_details(client_id: str) -> Optional[MeetingDetail]:
+    """Drop a client's meeting details and bot ID, if present."""
+    bot_id = BOT_IDS.pop(client_id, None)
+    if bot_id is not None and BOT_ID_TO_CLIENT.get(bot_id) == client_id:
+        del BOT_ID_TO_CLIENT[bot_id]
+    return MEETING_DETAILS.pop(client_id, None)
+
+
+def register_pipecat_process(client_id: str, process: subprocess.Popen) -> None:
+    """Track a freshly started Pipecat process as running."""
+    PIPECAT_PROCESSES[client_id] = process
+    PIPECAT_ALIVE.add(client_id)
+
+
+def pop_pipecat_process(client_id: str) -> Optional[subprocess.Popen]:
+    """Stop tracking a client's Pipecat process and return it, if any."""
+    PIPECAT_ALIVE.discard(client_id)
+    return PIPECAT_PROCESSES.pop(client_id, None)
+
+
+def refresh_pipecat_liveness() -> None:
+    """Drop clients whose Pipecat process has exited from PIPECAT_ALIVE."""
+    for client_id in list(PIPECAT_ALIVE):
+        process = PIPECAT_PROCESSES.get(client_id)
+        if process is None or process.poll() is not None:
+            PIPECAT_ALIVE.discard(client_id)
+
+
+async def reap_pipecat_processes(interval: float = PIPECAT_REAP_INTERVAL) -> None:
+    """Keep PIPECAT_ALIVE current until cancelled."""
+    while True:
+        refresh_pipecat_liveness()
+        await asyncio.sleep(interval)
+
+
+def find_client_id_by_meetingbaas_bot_id(meetingbaas_bot_id: str) -> Optional[str]:
+    """Return the client ID that owns a MeetingBaas bot, if any."""
+    return BOT_ID_TO_CLIENT.get(meetingbaas_bot_id)
+
+
+class _ClientConns:
+    """The input, output and Pipecat sockets of one client, in one record."""
+
+    __slots__ = ("input", "output", "pipecat")
+
+    def __init__(self):
+        self.input: Optional[WebSocket] = None
+        self.output: Optional[WebSocket] = None
+        self.pipecat: Optional[WebSocket] = None
+
 
 class ConnectionRegistry:
     """Manages WebSocket connections for clients and Pipecat."""
 
     def __init__(self, logger=logger):
-        self.client_input_connections: Dict[str, WebSocket] = {}
-        self.client_output_connections: Dict[str, WebSocket] = {}
-        self.pipecat_connections: Dict[str, WebSocket] = {}
+        # One record per client so every lookup is a single dict hit
+        self._clients: Dict[str, _ClientConns] = {}
         self.logger = logger
 
     async def connect(
@@ -31,26 +124,35 @@ class ConnectionRegistry:
         client_id: str,
         is_pipecat: bool = False,
         client_direction: Optional[str] = None,
-    ):
-        """Register a new connection."""
+    ) -> str:
+        """Register a new connection.
+
+        Returns:
+            The interned client ID. Handlers should use it for the rest of the
+            connection so per-frame dict lookups match keys by identity.
+        """
+        client_id = sys.intern(client_id)
         await websocket.accept()
+        record = self._clients.get(client_id)
+        if record is None:
+            record = self._clients[client_id] = _ClientConns()
         if is_pipecat:
-            already_exists = client_id in self.pipecat_connections
-            self.pipecat_connections[client_id] = websocket
+            already_exists = record.pipecat is not None
+            record.pipecat = websocket
             self.logger.info(
                 f"Pipecat client {client_id} connected (replaced existing: {already_exists})"
             )
         else:
             direction = client_direction or "output"
             if direction == "input":
-                already_exists = client_id in self.client_input_connections
-                self.client_input_connections[client_id] = websocket
+                already_exists = record.input is not None
+                record.input = websocket
                 self.logger.info(
                     f"Client {client_id} INPUT connected (replaced existing: {already_exists})"
                 )
             else:
-                already_exists = client_id in self.client_output_connections
-                self.client_output_connections[client_id] = websocket
+                already_exists = record.output is not None
+                record.output = websocket
                 if client_direction is None:
                     self.logger.warning(
                         f"Client {client_id} connected without direction; treating as OUTPUT"
@@ -58,6 +160,7 @@ class ConnectionRegistry:
                 self.logger.info(
                     f"Client {client_id} OUTPUT connected (replaced existing: {already_exists})"
                 )
+        return client_id
 
     async def disconnect(
         self,
@@ -65,74 +168,95 @@ class ConnectionRegistry:
         is_pipecat: bool = False,
         client_direction: Optional[str] = None,
     ):
-        """Remove a connection and close the websocket."""
+        """Remove a connection and close the websocket in the background.
+
+        Registry state is updated before this returns; the close handshake
+        runs as a task so a slow or vanished peer can't stall the caller.
+        """
         try:
-            # First, remove the connection from our dictionaries before attempting to close it
+            record = self._clients.get(client_id)
+            if record is None:
+                return
+
+            # First, detach the sockets from the record before attempting to close them
             if is_pipecat:
-                if client_id in self.pipecat_connections:
-                    websocket = self.pipecat_connections.pop(client_id)
-                    # Try to close it if possible
-                    try:
-                        await websocket.close(code=1000, reason="Bot disconnected")
-                    except Exception as e:
-                        # It's normal for this to fail if the connection is already closed
-                        self.logger.debug(
-                            f"Could not close Pipecat WebSocket for {client_id}: {e}"
-                        )
-                    self.logger.info(f"Pipecat client {client_id} disconnected")
+                targets = [("pipecat", "Pipecat")]
+            elif client_direction in ["input", "output"]:
+                targets = [(client_direction, "client")]
             else:
-                directions = (
-                    [client_direction]
-                    if client_direction in ["input", "output"]
-                    else ["input", "output"]
+                targets = [("input", "client"), ("output", "client")]
+
+            closing: List[Tuple[str, str, WebSocket]] = []
+            for slot, kind in targets:
+                websocket = getattr(record, slot)
+                if websocket is not None:
+                    setattr(record, slot, None)
+                    closing.append((slot, kind, websocket))
+
+            if (
+                record.input is None
+                and record.output is None
+                and record.pipecat is None
+            ):
+                del self._clients[client_id]
+
+            for slot, kind, websocket in closing:
+                label = "" if slot == "pipecat" else f" {slot.upper()}"
+                task = asyncio.create_task(
+                    self._close_websocket(websocket, client_id, f"{kind}{label}")
                 )
-                for direction in directions:
-                    if (
-                        direction == "input"
-                        and client_id in self.client_input_connections
-                    ):
-                        websocket = self.client_input_connections.pop(client_id)
-                        try:
-                            await websocket.close(code=1000, reason="Bot disconnected")
-                        except Exception as e:
-                            self.logger.debug(
-                                f"Could not close client INPUT WebSocket for {client_id}: {e}"
-                            )
-                        self.logger.info(f"Client {client_id} INPUT disconnected")
-                    if (
-                        direction == "output"
-                        and client_id in self.client_output_connections
-                    ):
-                        websocket = self.client_output_connections.pop(client_id)
-                        try:
-                            await websocket.close(code=1000, reason="Bot disconnected")
-                        except Exception as e:
-                            self.logger.debug(
-                                f"Could not close client OUTPUT WebSocket for {client_id}: {e}"
-                            )
-                        self.logger.info(f"Client {client_id} OUTPUT disconnected")
+                _CLOSE_TASKS.add(task)
+                task.add_done_callback(_CLOSE_TASKS.discard)
+                if slot == "pipecat":
+                    self.logger.info(f"Pipecat client {client_id} disconnected")
+                else:
+                    self.logger.info(f"Client {client_id}{label} disconnected")
         except Exception as e:
             # This should rarely happen now, but just in case
             self.logger.debug(f"Error during disconnect for {client_id}: {e}")
 
+    async def _close_websocket(
+        self, websocket: WebSocket, client_id: str, label: str
+    ) -> None:
+        """Close a detached websocket, giving up after WEBSOCKET_CLOSE_TIMEOUT."""
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=1000, reason="Bot disconnected"),
+                timeout=WEBSOCKET_CLOSE_TIMEOUT,
+            )
+        except Exception as e:
+            # It's normal for this to fail if the connection is already closed
+            self.logger.debug(f"Could not close {label} WebSocket for {client_id}: {e}")
+
     def get_client_input(self, client_id: str) -> Optional[WebSocket]:
         """Get the client INPUT connection (server -> meeting)."""
-        return self.client_input_connections.get(client_id)
+        record = self._clients.get(client_id)
+        return record.input if record else None
 
     def get_client_output(self, client_id: str) -> Optional[WebSocket]:
         """Get the client OUTPUT connection (meeting -> server)."""
-        return self.client_output_connections.get(client_id)
+        record = self._clients.get(client_id)
+        return record.output if record else None
 
     def get_client(self, client_id: str) -> Optional[WebSocket]:
         """Backward-compatible: return INPUT, else OUTPUT if present."""
-        client = self.get_client_input(client_id)
-        if client:
-            return client
-        return self.get_client_output(client_id)
+        record = self._clients.get(client_id)
+        if record is None:
+            return None
+        return record.input or record.output
 
     def get_pipecat(self, client_id: str) -> Optional[WebSocket]:
         """Get a Pipecat connection by ID."""
-        return self.pipecat_connections.get(client_id)
+        record = self._clients.get(client_id)
+        return record.pipecat if record else None
+
+    def client_ids(self) -> List[str]:
+        """Return the IDs of clients with an input or output connection."""
+        return [
+            client_id
+            for client_id, record in self._clients.items()
+            if record.input is not None or record.output is not None
+        ]
 
 
 # Create a singleton instance
@@ -19,14 +19,19 @@ Intervention Priority Order:
 6. Goal Drift (off-goal >2 min) - Visual
 """
 
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from enum import Enum
-from typing import Any, Dict, List, Optional
+from enum import StrEnum
+from functools import lru_cache
+from itertools import count
+from string import Formatter
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional
 import uuid
 
 
-class InterventionType(str, Enum):
+class InterventionType(StrEnum):
     """Types of AI interventions."""
 
     BALANCE = "balance"
@@ -37,14 +42,14 @@ class InterventionType(str, Enum):
     ICEBREAKER = "icebreaker"
 
 
-class InterventionModality(str, Enum):
+class InterventionModality(StrEnum):
     """How the intervention is delivered."""
 
     VISUAL = "visual"  # Visual prompt in the UI
     VOICE = "voice"  # Spoken by the AI facilitator
 
 
-class InterventionPriority(str, Enum):
+class InterventionPriority(StrEnum):
     """Priority levels for intervention queuing."""
 
     CRITICAL = "critical"  # Escalation detection
@@ -53,7 +58,18 @@ class InterventionPriority(str, Enum):
     LOW = "low"  # Silence, goal drift
 
 
-@dataclass
+# Intervention IDs only need to be unique within this process: a random
+# per-process prefix plus a counter avoids an os.urandom call per intervention
+_ID_PREFIX = uuid.uuid4().hex[:8]
+_id_counter = count()
+
+
+def _next_intervention_id() -> str:
+    """Return a process-unique intervention ID."""
+    return f"{_ID_PREFIX}-{next(_id_counter):08x}"
+
+
+@dataclass(slots=True)
 class Intervention:
     """An AI intervention to be delivered to participants.
 
@@ -73,20 +89,27 @@ class Intervention:
     message: str
     target_participant: Optional[str] = None
     priority: InterventionPriority = InterventionPriority.MEDIUM
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_next_intervention_id)
     created_at: datetime = field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # created_at never changes, so its ISO string is built once on first use
+    _created_at_iso: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        created_at_iso = self._created_at_iso
+        if created_at_iso is None:
+            created_at_iso = self._created_at_iso = self.created_at.isoformat()
         return {
             "id": self.id,
-            "type": self.type.value,
-            "modality": self.modality.value,
+            "type": self.type,
+            "modality": self.modality,
             "message": self.message,
             "target_participant": self.target_participant,
-            "priority": self.priority.value,
-            "created_at": self.created_at.isoformat(),
+            "priority": self.priority,
+            "created_at": created_at_iso,
             "metadata": self.metadata,
         }
 
@@ -158,6 +181,75 @@ class InterventionTemplates:
     )
 
 
+def _compile_template(template: str) -> Callable[..., str]:
+    """Turn a template into a renderer that only concatenates.
+
+    The template is parsed once here; rendering skips str.format's parser.
+    Only bare "{field}" placeholders are supported, and unused keyword
+    arguments are ignored, so any template can be rendered with the same
+    keywords.
+    """
+    parts = []
+    for literal, field_name, spec, conversion in Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"Unsupported placeholder in template: {template!r}")
+        parts.append((literal, field_name))
+
+    field_names = [field_name for _, field_name in parts if field_name is not None]
+    if not field_names:
+        return lambda **_: template
+
+    if len(field_names) == 1:
+        # Parsed as [(prefix, field)] or [(prefix, field), (suffix, None)]
+        prefix, field_name = parts[0]
+        suffix = parts[1][0] if len(parts) == 2 else ""
+        return lambda **kwargs: prefix + str(kwargs[field_name]) + suffix
+
+    def render(**kwargs: Any) -> str:
+        return "".join(
+            literal if field_name is None else literal + str(kwargs[field_name])
+            for literal, field_name in parts
+        )
+
+    return render
+
+
+# Renderer per InterventionTemplates constant, compiled at import
+COMPILED_TEMPLATES: Dict[str, Callable[..., str]] = {
+    name: _compile_template(value)
+    for name, value in vars(InterventionTemplates).items()
+    if name.isupper() and isinstance(value, str)
+}
+
+# Templates without placeholders, returned as-is rather than memoized
+STATIC_TEMPLATES: Dict[str, str] = {
+    name: value
+    for name, value in vars(InterventionTemplates).items()
+    if name in COMPILED_TEMPLATES and "{" not in value
+}
+
+
+@lru_cache(maxsize=128)
+def _render_cached(template_name: str, name: str, topic: str, minutes: int) -> str:
+    """Memoized body of _render for templates with placeholders."""
+    return COMPILED_TEMPLATES[template_name](name=name, topic=topic, minutes=minutes)
+
+
+def _render(
+    template_name: str, name: str = "", topic: str = "", minutes: int = 0
+) -> str:
+    """Render an InterventionTemplates constant by name.
+
+    A session repeats the same few templates with the same names and topic,
+    so renders are memoized; minutes are truncated to whole minutes to keep
+    the key space small.
+    """
+    static = STATIC_TEMPLATES.get(template_name)
+    if static is not None:
+        return static
+    return _render_cached(template_name, name, topic, int(minutes))
+
+
 # =============================================================================
 # Intervention Engine
 # =============================================================================
@@ -187,6 +279,36 @@ class InterventionEngine:
         - Grief or crisis expression
     """
 
+    # One engine lives per active session; slots keep instances small and
+    # make the attribute reads in evaluate() direct
+    __slots__ = (
+        "session_id",
+        "session_start",
+        "session_duration",
+        "_start_mono",
+        "_duration_s",
+        "interrupt_authority",
+        "direct_inquiry",
+        "silence_detection",
+        "last_intervention",
+        "last_intervention_by_type",
+        "intervention_count",
+        "intervention_history",
+        "_history_dicts",
+        "_type_counts",
+        "_modality_counts",
+        "is_mid_sentence",
+        "emotional_disclosure",
+        "repair_in_progress",
+        "crisis_detected",
+        "is_paused",
+        "tension_start",
+        "goal_drift_start",
+        "silence_start",
+        "_warnings_sent_mask",
+        "participant_names",
+    )
+
     # Configurable thresholds
     MIN_INTERVENTION_INTERVAL = timedelta(seconds=30)
     COOLDOWN_PERIOD = timedelta(minutes=2)
@@ -203,6 +325,32 @@ class InterventionEngine:
     TENSION_THRESHOLD = 0.7
     TENSION_DURATION = timedelta(seconds=30)
 
+    # Most recent interventions kept in the history
+    HISTORY_LIMIT = 1024
+
+    # The thresholds above in float seconds, for checks against
+    # time.monotonic() readings
+    _MIN_INTERVENTION_INTERVAL_S = MIN_INTERVENTION_INTERVAL.total_seconds()
+    _COOLDOWN_PERIOD_S = COOLDOWN_PERIOD.total_seconds()
+    _SILENCE_THRESHOLD_S = SILENCE_THRESHOLD.total_seconds()
+    _FIRST_MINUTES_QUIET_S = FIRST_MINUTES_QUIET.total_seconds()
+    _GOAL_DRIFT_THRESHOLD_S = GOAL_DRIFT_THRESHOLD.total_seconds()
+    _TENSION_DURATION_S = TENSION_DURATION.total_seconds()
+    # (threshold seconds, bit in _warnings_sent_mask, template name)
+    _TIME_WARNINGS_S = (
+        (TIME_WARNING_5_MIN.total_seconds(), 0b001, "TIME_5_MIN_TOPIC"),
+        (TIME_WARNING_2_MIN.total_seconds(), 0b010, "TIME_2_MIN"),
+        (TIME_WARNING_1_MIN.total_seconds(), 0b100, "TIME_1_MIN"),
+    )
+
+    # set_blocker name -> blocker attribute
+    _BLOCKER_ATTRS = {
+        "mid_sentence": "is_mid_sentence",
+        "emotional_disclosure": "emotional_disclosure",
+        "repair_in_progress": "repair_in_progress",
+        "crisis_detected": "crisis_detected",
+    }
+
     def __init__(
         self,
         session_id: str,
@@ -225,17 +373,32 @@ class InterventionEngine:
         self.session_start = session_start
         self.session_duration = timedelta(minutes=session_duration_minutes)
 
+        # Internal timing runs on time.monotonic() seconds; session_start is
+        # mapped onto that clock once here
+        self._start_mono = (
+            time.monotonic() - (datetime.utcnow() - session_start).total_seconds()
+        )
+        self._duration_s = self.session_duration.total_seconds()
+
         # Facilitator configuration
         config = facilitator_config or {}
         self.interrupt_authority = config.get("interrupt_authority", True)
         self.direct_inquiry = config.get("direct_inquiry", True)
         self.silence_detection = config.get("silence_detection", False)
 
-        # Intervention tracking
-        self.last_intervention: Optional[datetime] = None
-        self.last_intervention_by_type: Dict[InterventionType, datetime] = {}
+        # Intervention tracking (monotonic seconds)
+        self.last_intervention: Optional[float] = None
+        self.last_intervention_by_type: Dict[InterventionType, float] = {}
         self.intervention_count = 0
-        self.intervention_history: List[Intervention] = []
+        self.intervention_history: Deque[Intervention] = deque(
+            maxlen=self.HISTORY_LIMIT
+        )
+        # Serialized form of each history entry, built once at creation
+        self._history_dicts: Deque[Dict[str, Any]] = deque(maxlen=self.HISTORY_LIMIT)
+
+        # Running tallies keyed by enum value, kept in step with the history
+        self._type_counts: Counter = Counter()
+        self._modality_counts: Counter = Counter()
 
         # Blocker states
         self.is_mid_sentence = False
@@ -244,13 +407,13 @@ class InterventionEngine:
         self.crisis_detected = False
         self.is_paused = False
 
-        # Tracking state for duration-based triggers
-        self.tension_start: Optional[datetime] = None
-        self.goal_drift_start: Optional[datetime] = None
-        self.silence_start: Optional[datetime] = None
+        # Tracking state for duration-based triggers (monotonic seconds)
+        self.tension_start: Optional[float] = None
+        self.goal_drift_start: Optional[float] = None
+        self.silence_start: Optional[float] = None
 
-        # Time warning tracking (only trigger once per threshold)
-        self.time_warnings_sent: List[timedelta] = []
+        # Time warnings already sent, one bit per threshold (once each)
+        self._warnings_sent_mask = 0
 
         # Participant names for templates
         self.participant_names: Dict[str, str] = {}
@@ -271,14 +434,9 @@ class InterventionEngine:
                      "repair_in_progress", "crisis_detected".
             active: Whether the blocker is currently active.
         """
-        if blocker == "mid_sentence":
-            self.is_mid_sentence = active
-        elif blocker == "emotional_disclosure":
-            self.emotional_disclosure = active
-        elif blocker == "repair_in_progress":
-            self.repair_in_progress = active
-        elif blocker == "crisis_detected":
-            self.crisis_detected = active
+        attr = self._BLOCKER_ATTRS.get(blocker)
+        if attr:
+            setattr(self, attr, active)
 
     def pause(self) -> None:
         """Pause the intervention engine (kill switch activated)."""
@@ -292,18 +450,26 @@ class InterventionEngine:
         self.goal_drift_start = None
         self.silence_start = None
 
-    def get_session_elapsed(self) -> timedelta:
-        """Get time elapsed since session start."""
-        return datetime.utcnow() - self.session_start
+    def get_session_elapsed(self, now: Optional[float] = None) -> timedelta:
+        """Get time elapsed since session start.
+
+        Internal callers subtract self._start_mono from their own
+        time.monotonic() reading instead of calling this.
+        """
+        if now is None:
+            now = time.monotonic()
+        return timedelta(seconds=now - self._start_mono)
 
-    def get_time_remaining(self) -> timedelta:
+    def get_time_remaining(self, now: Optional[float] = None) -> timedelta:
         """Get time remaining in the session."""
-        elapsed = self.get_session_elapsed()
-        remaining = self.session_duration - elapsed
-        return max(remaining, timedelta(0))
+        if now is None:
+            now = time.monotonic()
+        return timedelta(seconds=max(self._duration_s - (now - self._start_mono), 0.0))
 
     def can_intervene(
-        self, intervention_type: Optional[InterventionType] = None
+        self,
+        intervention_type: Optional[InterventionType] = None,
+        now: Optional[float] = None,
     ) -> bool:
         """Check if intervention is allowed right now.
 
@@ -311,47 +477,65 @@ class InterventionEngine:
 
         Args:
             intervention_type: Optional type to check type-specific cooldown.
+            now: Current time.monotonic() reading, if the caller has one.
 
         Returns:
             True if intervention is allowed, False otherwise.
         """
-        # Kill switch active
-        if self.is_paused:
-            return False
+        if now is None:
+            now = time.monotonic()
 
-        now = datetime.utcnow()
+        if self._is_blocked(now):
+            return False
 
         # First 3 minutes: no interventions (except icebreaker)
         if intervention_type != InterventionType.ICEBREAKER:
-            if self.get_session_elapsed() < self.FIRST_MINUTES_QUIET:
+            if now - self._start_mono < self._FIRST_MINUTES_QUIET_S:
                 return False
 
-        # Global cooldown since last intervention
-        if self.last_intervention:
-            if (now - self.last_intervention) < self.MIN_INTERVENTION_INTERVAL:
+        # Type-specific cooldown (enum keys: StrEnum members hash faster
+        # than a .value lookup would)
+        if intervention_type:
+            last_of_type = self.last_intervention_by_type.get(intervention_type)
+            if (
+                last_of_type is not None
+                and now - last_of_type < self._COOLDOWN_PERIOD_S
+            ):
                 return False
 
-        # Type-specific cooldown
-        if intervention_type and intervention_type in self.last_intervention_by_type:
-            last_of_type = self.last_intervention_by_type[intervention_type]
-            if (now - last_of_type) < self.COOLDOWN_PERIOD:
-                return False
+        return True
+
+    def _is_blocked(self, now: float) -> bool:
+        """Return True if no intervention of any type may be delivered now.
+
+        Covers the kill switch, the global cooldown and the blocker
+        conditions; the quiet start and per-type cooldowns are left to
+        can_intervene.
+        """
+        # Kill switch active
+        if self.is_paused:
+            return True
+
+        # Global cooldown since last intervention
+        if self.last_intervention is not None:
+            if now - self.last_intervention < self._MIN_INTERVENTION_INTERVAL_S:
+                return True
 
         # Blocker conditions
         if self.is_mid_sentence and self.interrupt_authority is False:
-            return False
+            return True
 
         if self.emotional_disclosure:
-            return False
+            return True
 
         if self.repair_in_progress:
-            return False
+            return True
 
         if self.crisis_detected:
             # Crisis = escalate to human support, not AI intervention
-            return False
+            return True
 
-        return True
+        return False
 
     def evaluate(
         self,
@@ -361,6 +545,7 @@ class InterventionEngine:
         tension_score: float = 0.0,
         is_on_goal: bool = True,
         session_goal: str = "",
+        now: Optional[float] = None,
     ) -> Optional[Intervention]:
         """Evaluate current conditions and return intervention if needed.
 
@@ -374,62 +559,125 @@ class InterventionEngine:
             tension_score: 0.0-1.0 tension level from sentiment analysis.
             is_on_goal: Whether conversation is on topic.
             session_goal: The session goal for context in messages.
+            now: Current time.monotonic() reading; taken once here if omitted
+                and shared by every check.
 
         Returns:
             Intervention object if one should trigger, None otherwise.
         """
+        if now is None:
+            now = time.monotonic()
+
+        # Fast gate: most ticks can't produce an intervention, and then only
+        # the duration timers need updating
+        if self._can_skip_checks(
+            balance_status, silence_duration, tension_score, is_on_goal, now
+        ):
+            self._update_duration_timers(tension_score, is_on_goal, now)
+            return None
+
         # Priority order evaluation
         # 1. Escalation (highest priority)
-        intervention = self._check_escalation(tension_score)
+        intervention = self._check_escalation(tension_score, now)
         if intervention:
             return intervention
 
         # 2. Severe balance (voice intervention)
-        intervention = self._check_severe_balance(balance_status, balance_result)
+        intervention = self._check_severe_balance(balance_status, balance_result, now)
         if intervention:
             return intervention
 
         # 3. Time warnings
-        intervention = self._check_time_warning(session_goal)
+        intervention = self._check_time_warning(session_goal, now)
         if intervention:
             return intervention
 
         # 4. Silence detection
         if self.silence_detection and silence_duration:
-            intervention = self._check_silence(silence_duration)
+            intervention = self._check_silence(silence_duration, now)
             if intervention:
                 return intervention
 
         # 5. Mild balance (visual intervention)
-        intervention = self._check_mild_balance(balance_status, balance_result)
+        intervention = self._check_mild_balance(balance_status, balance_result, now)
         if intervention:
             return intervention
 
         # 6. Goal drift
-        intervention = self._check_goal_drift(is_on_goal, session_goal)
+        intervention = self._check_goal_drift(is_on_goal, session_goal, now)
         if intervention:
             return intervention
 
         return None
 
-    def _check_escalation(self, tension_score: float) -> Optional[Intervention]:
+    def _can_skip_checks(
+        self,
+        balance_status: str,
+        silence_duration: Optional[timedelta],
+        tension_score: float,
+        is_on_goal: bool,
+        now: float,
+    ) -> bool:
+        """Return True if no check in evaluate() can produce an intervention.
+
+        That is the case when every check is vetoed, or when none of their
+        trigger conditions hold.
+        """
+        if now - self._start_mono < self._FIRST_MINUTES_QUIET_S:
+            return True
+        if self._is_blocked(now):
+            return True
+        return (
+            balance_status not in ("mild_imbalance", "severe_imbalance")
+            and tension_score <= self.TENSION_THRESHOLD
+            and is_on_goal
+            and not (self.silence_detection and silence_duration)
+            and not self._time_warning_due(now)
+        )
+
+    def _update_duration_timers(
+        self, tension_score: float, is_on_goal: bool, now: float
+    ) -> None:
+        """Start or reset the tension and goal-drift timers, as the checks do."""
+        if tension_score > self.TENSION_THRESHOLD:
+            if self.tension_start is None:
+                self.tension_start = now
+        else:
+            self.tension_start = None
+
+        if not is_on_goal:
+            if self.goal_drift_start is None:
+                self.goal_drift_start = now
+        else:
+            self.goal_drift_start = None
+
+    def _time_warning_due(self, now: float) -> bool:
+        """Return True if a time-warning threshold has passed unsent."""
+        remaining = max(self._duration_s - (now - self._start_mono), 0.0)
+        for threshold, bit, _ in self._TIME_WARNINGS_S:
+            if remaining <= threshold and not self._warnings_sent_mask & bit:
+                return True
+        return False
+
+    def _check_escalation(
+        self, tension_score: float, now: float
+    ) -> Optional[Intervention]:
         """Check for escalation condition.
 
         Triggers voice intervention when tension > 0.7 for 30+ seconds.
         """
-        now = datetime.utcnow()
-
         if tension_score > self.TENSION_THRESHOLD:
             if self.tension_start is None:
                 self.tension_start = now
-            elif (now - self.tension_start) >= self.TENSION_DURATION:
-                if self.can_intervene(InterventionType.ESCALATION):
+            elif now - self.tension_start >= self._TENSION_DURATION_S:
+                if self.can_intervene(InterventionType.ESCALATION, now):
                     return self._create_intervention(
                         InterventionType.ESCALATION,
                         InterventionModality.VOICE,
                         InterventionTemplates.ESCALATION_PAUSE,
                         priority=InterventionPriority.CRITICAL,
                         metadata={"tension_score": tension_score},
+                        now=now,
                     )
         else:
             # Reset tension timer when below threshold
@@ -438,7 +686,10 @@ class InterventionEngine:
         return None
 
     def _check_severe_balance(
-        self, balance_status: str, balance_result: Optional[Dict[str, Any]]
+        self,
+        balance_status: str,
+        balance_result: Optional[Dict[str, Any]],
+        now: float,
     ) -> Optional[Intervention]:
         """Check for severe balance imbalance.
 
@@ -448,12 +699,12 @@ class InterventionEngine:
         if balance_status != "severe_imbalance":
             return None
 
-        if not self.can_intervene(InterventionType.BALANCE):
+        if not self.can_intervene(InterventionType.BALANCE, now):
             return None
 
         # Get quiet participant name for personalized message
         quiet_name = self._get_quiet_participant_name(balance_result)
-        message = InterventionTemplates.BALANCE_VOICE.format(name=quiet_name)
+        message = _render("BALANCE_VOICE", quiet_name)
 
         return self._create_intervention(
             InterventionType.BALANCE,
@@ -467,50 +718,50 @@ class InterventionEngine:
                 "balance_status": balance_status,
                 "balance_result": balance_result,
             },
+            now=now,
         )
 
-    def _check_time_warning(self, session_goal: str) -> Optional[Intervention]:
+    def _check_time_warning(
+        self, session_goal: str, now: float
+    ) -> Optional[Intervention]:
         """Check if time warning should be shown.
 
         Triggers at 5 min, 2 min, and 1 min remaining (once each).
         """
-        if not self.can_intervene(InterventionType.TIME_WARNING):
+        if not self.can_intervene(InterventionType.TIME_WARNING, now):
             return None
 
-        remaining = self.get_time_remaining()
+        remaining = max(self._duration_s - (now - self._start_mono), 0.0)
 
         # Check thresholds in order (only one per threshold)
-        for threshold, template in [
-            (self.TIME_WARNING_5_MIN, InterventionTemplates.TIME_5_MIN_TOPIC),
-            (self.TIME_WARNING_2_MIN, InterventionTemplates.TIME_2_MIN),
-            (self.TIME_WARNING_1_MIN, InterventionTemplates.TIME_1_MIN),
-        ]:
-            if remaining <= threshold and threshold not in self.time_warnings_sent:
-                self.time_warnings_sent.append(threshold)
-                message = template
-                if "{topic}" in message:
-                    message = message.format(topic=session_goal or "your goal")
+        for threshold, bit, template_name in self._TIME_WARNINGS_S:
+            if remaining <= threshold and not self._warnings_sent_mask & bit:
+                self._warnings_sent_mask |= bit
+                message = _render(template_name, topic=session_goal or "your goal")
 
                 return self._create_intervention(
                     InterventionType.TIME_WARNING,
                     InterventionModality.VISUAL,
                     message,
                     priority=InterventionPriority.MEDIUM,
-                    metadata={"time_remaining_seconds": remaining.total_seconds()},
+                    metadata={"time_remaining_seconds": remaining},
+                    now=now,
                 )
 
         return None
 
-    def _check_silence(self, silence_duration: timedelta) -> Optional[Intervention]:
+    def _check_silence(
+        self, silence_duration: timedelta, now: float
+    ) -> Optional[Intervention]:
         """Check for extended silence.
 
         Triggers visual prompt when silence > 15 seconds.
         """
-        if silence_duration < self.SILENCE_THRESHOLD:
+        if silence_duration.total_seconds() < self._SILENCE_THRESHOLD_S:
             self.silence_start = None
             return None
 
-        if not self.can_intervene(InterventionType.SILENCE):
+        if not self.can_intervene(InterventionType.SILENCE, now):
             return None
 
         return self._create_intervention(
@@ -519,10 +770,14 @@ class InterventionEngine:
             InterventionTemplates.SILENCE_VISUAL,
             priority=InterventionPriority.LOW,
             metadata={"silence_seconds": silence_duration.total_seconds()},
+            now=now,
         )
 
     def _check_mild_balance(
-        self, balance_status: str, balance_result: Optional[Dict[str, Any]]
+        self,
+        balance_status: str,
+        balance_result: Optional[Dict[str, Any]],
+        now: float,
     ) -> Optional[Intervention]:
         """Check for mild balance imbalance.
 
@@ -531,11 +786,11 @@ class InterventionEngine:
         if balance_status != "mild_imbalance":
             return None
 
-        if not self.can_intervene(InterventionType.BALANCE):
+        if not self.can_intervene(InterventionType.BALANCE, now):
             return None
 
         quiet_name = self._get_quiet_participant_name(balance_result)
-        message = InterventionTemplates.BALANCE_VISUAL.format(name=quiet_name)
+        message = _render("BALANCE_VISUAL", quiet_name)
 
         return self._create_intervention(
             InterventionType.BALANCE,
@@ -546,28 +801,28 @@ class InterventionEngine:
             else None,
             priority=InterventionPriority.MEDIUM,
             metadata={"balance_status": balance_status},
+            now=now,
         )
 
     def _check_goal_drift(
-        self, is_on_goal: bool, session_goal: str
+        self, is_on_goal: bool, session_goal: str, now: float
     ) -> Optional[Intervention]:
         """Check for goal drift.
 
         Triggers visual prompt when off-goal for > 2 minutes.
         """
-        now = datetime.utcnow()
-
         if not is_on_goal:
             if self.goal_drift_start is None:
                 self.goal_drift_start = now
-            elif (now - self.goal_drift_start) >= self.GOAL_DRIFT_THRESHOLD:
-                if self.can_intervene(InterventionType.GOAL_DRIFT):
+            elif now - self.goal_drift_start >= self._GOAL_DRIFT_THRESHOLD_S:
+                if self.can_intervene(InterventionType.GOAL_DRIFT, now):
                     return self._create_intervention(
                         InterventionType.GOAL_DRIFT,
                         InterventionModality.VISUAL,
                         InterventionTemplates.GOAL_DRIFT_VISUAL,
                         priority=InterventionPriority.LOW,
                         metadata={"session_goal": session_goal},
+                        now=now,
                     )
         else:
             # Reset goal drift timer when back on topic
@@ -587,13 +842,15 @@ class InterventionEngine:
             Icebreaker intervention or None if not appropriate.
         """
         # Icebreakers can happen in the first 3 minutes
-        if self.can_intervene(InterventionType.ICEBREAKER):
+        now = time.monotonic()
+        if self.can_intervene(InterventionType.ICEBREAKER, now):
             return self._create_intervention(
                 InterventionType.ICEBREAKER,
                 InterventionModality.VOICE,
                 InterventionTemplates.ICEBREAKER_GOAL,
                 priority=InterventionPriority.MEDIUM,
                 metadata={"session_goal": session_goal},
+                now=now,
             )
         return None
 
@@ -605,11 +862,14 @@ class InterventionEngine:
         target_participant: Optional[str] = None,
         priority: InterventionPriority = InterventionPriority.MEDIUM,
         metadata: Optional[Dict[str, Any]] = None,
+        now: Optional[float] = None,
     ) -> Intervention:
         """Create and record an intervention.
 
         Updates tracking state and returns the new intervention.
         """
+        if now is None:
+            now = time.monotonic()
         intervention = Intervention(
             type=intervention_type,
             modality=modality,
@@ -620,11 +880,13 @@ class InterventionEngine:
         )
 
         # Update tracking
-        now = datetime.utcnow()
         self.last_intervention = now
         self.last_intervention_by_type[intervention_type] = now
         self.intervention_count += 1
         self.intervention_history.append(intervention)
+        self._history_dicts.append(intervention.to_dict())
+        self._type_counts[intervention_type.value] += 1
+        self._modality_counts[modality.value] += 1
 
         return intervention
 
@@ -666,40 +928,35 @@ class InterventionEngine:
         Returns:
             Dict with intervention counts and history.
         """
+        elapsed_s = time.monotonic() - self._start_mono
         return {
             "session_id": self.session_id,
             "total_interventions": self.intervention_count,
-            "intervention_rate_per_30min": self._calculate_intervention_rate(),
+            "intervention_rate_per_30min": self._calculate_intervention_rate(
+                elapsed_s
+            ),
             "interventions_by_type": self._count_by_type(),
             "interventions_by_modality": self._count_by_modality(),
             "is_paused": self.is_paused,
-            "session_elapsed_seconds": self.get_session_elapsed().total_seconds(),
-            "time_remaining_seconds": self.get_time_remaining().total_seconds(),
+            "session_elapsed_seconds": elapsed_s,
+            "time_remaining_seconds": max(self._duration_s - elapsed_s, 0.0),
         }
 
-    def _calculate_intervention_rate(self) -> float:
+    def _calculate_intervention_rate(self, elapsed_s: float) -> float:
         """Calculate interventions per 30 minutes."""
-        elapsed_minutes = self.get_session_elapsed().total_seconds() / 60
+        elapsed_minutes = elapsed_s / 60
         if elapsed_minutes < 1:
             return 0.0
         return (self.intervention_count / elapsed_minutes) * 30
 
     def _count_by_type(self) -> Dict[str, int]:
         """Count interventions by type."""
-        counts: Dict[str, int] = {}
-        for intervention in self.intervention_history:
-            type_name = intervention.type.value
-            counts[type_name] = counts.get(type_name, 0) + 1
-        return counts
+        return dict(self._type_counts)
 
     def _count_by_modality(self) -> Dict[str, int]:
         """Count interventions by modality."""
-        counts: Dict[str, int] = {}
-        for intervention in self.intervention_history:
-            modality_name = intervention.modality.value
-            counts[modality_name] = counts.get(modality_name, 0) + 1
-        return counts
+        return dict(self._modality_counts)
 
     def get_history(self) -> List[Dict[str, Any]]:
         """Get intervention history as serializable dicts."""
-        return [intervention.to_dict() for intervention in self.intervention_history]
+        return list(self._history_dicts)
@@ -1,21 +1,123 @@
 """Process management for Pipecat processes."""
 
+import asyncio
 import os
+import selectors
 import subprocess
 import sys
-import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Set
 import json
 import threading
 
+import orjson
+
 from meetingbaas_pipecat.utils.logger import logger
 
 PIPECAT_PROCESSES: Dict[str, subprocess.Popen] = {}
 
+# Local WebSocket URL Pipecat processes connect back to, by client ID
+PIPECAT_WS_TEMPLATE = "ws://localhost:7014/pipecat/{}"
+
+# Background terminations, referenced so they aren't garbage collected mid-run
+_TERMINATION_TASKS: Set[asyncio.Task] = set()
+
+# Project root (parent of core/) and the meetingbaas.py script; absolute
+# paths avoid issues with spaces in directory names
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SCRIPT_PATH = os.path.join(_PROJECT_ROOT, "scripts", "meetingbaas.py")
+
+# Interpreter, unbuffered stdout/stderr flag and script for every spawn
+_COMMAND_PREFIX = (sys.executable, "-u", _SCRIPT_PATH)
+
+# Subprocess environment, built on first spawn so .env has been loaded
+_SPAWN_ENV: Optional[Dict[str, str]] = None
+
+
+def _forward_line(prefix: bytes, line: bytes) -> None:
+    """Write one prefixed output line to our stdout without a decode."""
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # stdout has been replaced by a text-only stream
+        print(f"{prefix.decode()} {line.decode(errors='replace')}", flush=True)
+        return
+    out.write(prefix + b" " + line + b"\n")
+    out.flush()
+
 
 def stream_output(pipe, prefix):
-    for line in iter(pipe.readline, ""):
-        print(f"{prefix} {line.strip()}", flush=True)
+    prefix = prefix.encode()
+    for line in iter(pipe.readline, b""):
+        _forward_line(prefix, line.strip())
+
+
+class _LogPump:
+    """Forwards the output pipes of every Pipecat process from one thread.
+
+    Pipes are registered with a selector and read without blocking, so N
+    processes cost one thread instead of 2N. Windows selectors can't wait
+    on pipes, so there each pipe still gets a stream_output thread.
+    """
+
+    # Seconds select() waits, so pipes registered mid-wait are picked up
+    # by selectors that don't see registrations made during a wait
+    SELECT_TIMEOUT = 0.5
+
+    def __init__(self):
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._lock = threading.Lock()
+
+    def add(self, pipe, prefix: str) -> None:
+        """Start forwarding a pipe's lines to stdout under a prefix."""
+        if sys.platform == "win32":
+            threading.Thread(
+                target=stream_output, args=(pipe, prefix), daemon=True
+            ).start()
+            return
+
+        os.set_blocking(pipe.fileno(), False)
+        with self._lock:
+            if self._selector is None:
+                self._selector = selectors.DefaultSelector()
+                threading.Thread(
+                    target=self._run, name="pipecat-log-pump", daemon=True
+                ).start()
+            self._selector.register(
+                pipe, selectors.EVENT_READ, (prefix.encode(), bytearray())
+            )
+
+    def _run(self) -> None:
+        while True:
+            for key, _ in self._selector.select(timeout=self.SELECT_TIMEOUT):
+                try:
+                    self._drain(key)
+                except Exception as e:
+                    logger.error(f"Error forwarding Pipecat output: {e}")
+
+    def _drain(self, key: selectors.SelectorKey) -> None:
+        """Print the complete lines waiting on a pipe; close it at EOF."""
+        prefix, pending = key.data
+        try:
+            chunk = os.read(key.fd, 65536)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b""
+
+        if chunk:
+            pending += chunk
+            *lines, rest = pending.split(b"\n")
+            pending[:] = rest
+        else:
+            # EOF: flush any unterminated last line and stop watching
+            lines = [bytes(pending)] if pending else []
+            self._selector.unregister(key.fileobj)
+            key.fileobj.close()
+
+        for line in lines:
+            _forward_line(prefix, line.strip())
+
+
+_log_pump = _LogPump()
 
 
 def start_pipecat_process(
@@ -47,24 +149,10 @@ def start_pipecat_process(
     logger.info(f"Starting Pipecat process for client {client_id}")
 
     # Convert persona_data to JSON string
-    persona_data_json = json.dumps(persona_data)
-
-    # Construct the command to run the meetingbaas.py script
-    # Use absolute path to avoid issues with spaces in directory names
-    script_path = os.path.join(
-        os.path.dirname(__file__), "..", "scripts", "meetingbaas.py"
-    )
-    script_path = os.path.abspath(script_path)
-
-    # Use the persona's display name directly from persona_data
-    display_name = persona_data.get("name", "Unknown Bot")
+    persona_data_json = orjson.dumps(persona_data).decode()
 
-    # Build command with all parameters
-    # Use -u flag for unbuffered output to ensure logs are captured immediately
-    command = [
-        sys.executable,
-        "-u",  # Unbuffered stdout/stderr
-        script_path,
+    # Build the script arguments with all parameters
+    script_args = [
         "--client-id",
         client_id,
         "--websocket-url",
@@ -79,24 +167,51 @@ def start_pipecat_process(
 
     # Add optional flags
     if enable_tools:
-        command.append("--enable-tools")
+        script_args.append("--enable-tools")
 
     if api_key:
-        command.extend(["--api-key", api_key])
+        script_args.extend(["--api-key", api_key])
 
     if meetingbaas_bot_id:
-        command.extend(["--meetingbaas-bot-id", meetingbaas_bot_id])
+        script_args.extend(["--meetingbaas-bot-id", meetingbaas_bot_id])
 
-    # Get project root directory (parent of core/)
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # Hand the configuration to a prewarmed worker when one is idle
+    process = pipecat_pool.acquire(script_args)
+    if process is not None:
+        logger.info(
+            f"Assigned pooled Pipecat process with PID {process.pid} to client {client_id}"
+        )
+        return process
 
-    # Create environment with PYTHONPATH set to project root
-    env = os.environ.copy()
-    existing_pythonpath = env.get("PYTHONPATH", "")
-    if existing_pythonpath:
-        env["PYTHONPATH"] = f"{project_root}{os.pathsep}{existing_pythonpath}"
-    else:
-        env["PYTHONPATH"] = project_root
+    process = _spawn_pipecat(script_args)
+    logger.info(f"Started Pipecat process with PID {process.pid}")
+    return process
+
+
+def _spawn_env() -> Dict[str, str]:
+    """Return the environment for Pipecat processes.
+
+    Built once from os.environ with the project root prepended to PYTHONPATH.
+    """
+    global _SPAWN_ENV
+    if _SPAWN_ENV is None:
+        env = os.environ.copy()
+        existing_pythonpath = env.get("PYTHONPATH", "")
+        if existing_pythonpath:
+            env["PYTHONPATH"] = f"{_PROJECT_ROOT}{os.pathsep}{existing_pythonpath}"
+        else:
+            env["PYTHONPATH"] = _PROJECT_ROOT
+        _SPAWN_ENV = env
+    return _SPAWN_ENV
+
+
+def _spawn_pipecat(script_args: List[str]) -> subprocess.Popen:
+    """Launch the meetingbaas.py script with its output streamed to our stdout."""
+    # Use -u flag for unbuffered output to ensure logs are captured immediately
+    command = [*_COMMAND_PREFIX, *script_args]
+    env = _spawn_env()
+    # Only pooled workers read their config from stdin; others get no pipe
+    awaits_config = "--await-config" in script_args
 
     logger.info(f"Subprocess PYTHONPATH: {env['PYTHONPATH']}")
     logger.info(f"Subprocess command: {' '.join(command[:3])}...")  # Log first 3 args
@@ -105,24 +220,98 @@ def start_pipecat_process(
     process = subprocess.Popen(
         command,
         env=env,  # Use modified environment with PYTHONPATH
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,  # Capture output as text
-        cwd=project_root,  # Set working directory to project root
+        stdin=subprocess.PIPE if awaits_config else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,  # Binary pipes: output is forwarded
+        stderr=subprocess.PIPE,  # as bytes and never decoded
+        cwd=_PROJECT_ROOT,  # Set working directory to project root
     )
 
-    # Start threads to print output
-    threading.Thread(
-        target=stream_output, args=(process.stdout, "[Pipecat STDOUT]"), daemon=True
-    ).start()
-    threading.Thread(
-        target=stream_output, args=(process.stderr, "[Pipecat STDERR]"), daemon=True
-    ).start()
+    # Forward output to our stdout
+    _log_pump.add(process.stdout, "[Pipecat STDOUT]")
+    _log_pump.add(process.stderr, "[Pipecat STDERR]")
 
-    logger.info(f"Started Pipecat process with PID {process.pid}")
     return process
 
 
+class PipecatPool:
+    """Keeps prewarmed Pipecat workers ready to take a client.
+
+    Each worker is started with ``--await-config`` so it pays the interpreter
+    and Pipecat import cost up front, then blocks reading one line of JSON
+    script arguments from stdin. Workers run a single meeting and exit, so a
+    worker handed out by ``acquire`` is replaced in the background rather
+    than returned to the pool.
+    """
+
+    def __init__(self, size: int = 0):
+        self.size = size
+        self._idle: List[subprocess.Popen] = []
+        self._lock = threading.Lock()
+        # Held by the one thread refilling the pool, so a burst of acquires
+        # can't race several refills into spawning past the pool size
+        self._warming = threading.Lock()
+
+    def warm(self) -> None:
+        """Start idle workers until the pool is full.
+
+        Returns immediately if another thread is already refilling the pool;
+        that thread rechecks the pool size before every spawn.
+        """
+        if not self._warming.acquire(blocking=False):
+            return
+        while True:
+            with self._lock:
+                self._idle = [p for p in self._idle if p.poll() is None]
+                if len(self._idle) >= self.size:
+                    # Released under _lock so an acquire can't pop a worker
+                    # between this check and the release unnoticed
+                    self._warming.release()
+                    return
+            try:
+                process = _spawn_pipecat(["--await-config"])
+            except Exception as e:
+                logger.error(f"Error prewarming Pipecat process: {e}")
+                self._warming.release()
+                return
+            with self._lock:
+                self._idle.append(process)
+            logger.info(f"Prewarmed Pipecat process with PID {process.pid}")
+
+    def acquire(self, script_args: List[str]) -> Optional[subprocess.Popen]:
+        """Hand script arguments to an idle worker and return it.
+
+        Returns None when no live worker is idle, in which case the caller
+        should spawn a process directly.
+        """
+        while True:
+            with self._lock:
+                if not self._idle:
+                    return None
+                process = self._idle.pop()
+            if process.poll() is not None:
+                continue
+            try:
+                process.stdin.write(json.dumps(script_args).encode() + b"\n")
+                process.stdin.close()
+            except (BrokenPipeError, OSError, ValueError) as e:
+                logger.debug(f"Discarding pooled Pipecat process {process.pid}: {e}")
+                continue
+            threading.Thread(target=self.warm, daemon=True).start()
+            return process
+
+    def shutdown(self) -> None:
+        """Terminate every idle worker."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for process in idle:
+            terminate_process_gracefully(process)
+
+
+# Prewarming is opt-in: each idle worker holds a full Pipecat interpreter in
+# memory, so PIPECAT_POOL_SIZE defaults to 0 (spawn on demand)
+pipecat_pool = PipecatPool(size=int(os.getenv("PIPECAT_POOL_SIZE", "0")))
+
+
 def terminate_process_gracefully(
     process: subprocess.Popen, timeout: float = 2.0
 ) -> bool:
@@ -146,10 +335,11 @@ def terminate_process_gracefully(
         process.terminate()
 
         # Wait for process to exit
-        for _ in range(int(timeout * 10)):  # Check 10 times per second
-            if process.poll() is not None:
-                return True
-            time.sleep(0.1)
+        try:
+            process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            pass
 
         # Process didn't exit gracefully, force kill it
         process.kill()
@@ -163,3 +353,109 @@ def terminate_process_gracefully(
         except:
             pass
         return False
+
+
+async def async_terminate(process: subprocess.Popen, timeout: float = 2.0) -> bool:
+    """
+    Terminate a process without blocking the event loop: SIGTERM, then
+    SIGKILL if it hasn't exited within the timeout.
+
+    Args:
+        process: The process to terminate
+        timeout: How long to wait for graceful termination before force killing
+
+    Returns:
+        True if process was terminated gracefully, False if it had to be force-killed
+    """
+    if process.poll() is not None:
+        return True
+
+    try:
+        process.terminate()
+        for _ in range(int(timeout * 10)):  # Check 10 times per second
+            await asyncio.sleep(0.1)
+            if process.poll() is not None:
+                return True
+
+        process.kill()
+        await asyncio.to_thread(process.wait, 1.0)
+        return False
+    except Exception as e:
+        logger.error(f"Error terminating process: {e}")
+        try:
+            process.kill()
+        except Exception:
+            pass
+        return False
+
+
+async def _terminate_and_log(client_id: str, process: subprocess.Popen) -> None:
+    if await async_terminate(process, timeout=3.0):
+        logger.info(f"Gracefully terminated Pipecat process for client {client_id}")
+    else:
+        logger.warning(f"Had to forcefully kill Pipecat process for client {client_id}")
+
+
+def stop_pipecat_process(client_id: str) -> None:
+    """Stop tracking a client's Pipecat process and terminate it in the background.
+
+    Must be called from the event loop. Returns immediately; the process is
+    sent SIGTERM and reaped (or killed) by a background task.
+    """
+    from core.connection import pop_pipecat_process
+
+    process = pop_pipecat_process(client_id)
+    if process is None or process.poll() is not None:
+        return
+
+    task = asyncio.create_task(_terminate_and_log(client_id, process))
+    _TERMINATION_TASKS.add(task)
+    task.add_done_callback(_TERMINATION_TASKS.discard)
+
+
+class PipecatSession:
+    """Owns a client's Pipecat process for the duration of a WebSocket handler.
+
+    Entering starts the process unless one is already running for the client.
+    Exiting terminates it when ``terminate_on_exit`` is set; handlers that
+    share the process without owning it pass False.
+    """
+
+    def __init__(self, client_id: str, details, terminate_on_exit: bool = True):
+        self.client_id = client_id
+        self.details = details
+        self.terminate_on_exit = terminate_on_exit
+
+    async def __aenter__(self) -> "PipecatSession":
+        from core.connection import PIPECAT_ALIVE, register_pipecat_process
+
+        client_id = self.client_id
+        if client_id in PIPECAT_ALIVE:
+            logger.info(f"Pipecat process already running for client {client_id}")
+            return self
+
+        details = self.details
+        pipecat_websocket_url = PIPECAT_WS_TEMPLATE.format(client_id)
+        logger.info(
+            f"Starting new Pipecat process for client {client_id} (previous process not running)"
+        )
+        process = start_pipecat_process(
+            client_id=client_id,
+            websocket_url=pipecat_websocket_url,
+            meeting_url=details.meeting_url,
+            persona_data=details.persona_data
+            or {"name": details.persona_name},  # Use full persona data
+            streaming_audio_frequency=details.streaming_audio_frequency,
+            enable_tools=details.enable_tools,
+            api_key="",
+            meetingbaas_bot_id=details.meetingbaas_bot_id or "",
+        )
+
+        # Store the process for cleanup
+        register_pipecat_process(client_id, process)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self.terminate_on_exit:
+            stop_pipecat_process(self.client_id)
+        return False
@@ -1,5 +1,7 @@
 """Routes messages between clients and Pipecat."""
 
+from typing import List
+
 from core.connection import registry
 from core.converter import converter
 from meetingbaas_pipecat.utils.logger import logger
@@ -67,14 +69,14 @@ class MessageRouter:
     async def send_binary(self, message: bytes, client_id: str):
         """Send binary data to a client."""
         if client_id in self.closing_clients:
-            self.logger.debug(f"Skipping send to closing client {client_id}")
+            self.logger.debug("Skipping send to closing client {}", client_id)
             return
 
         client = self._get_outbound_client(client_id)
         if client:
             try:
                 await client.send_bytes(message)
-                self.logger.debug(f"Sent {len(message)} bytes to client {client_id}")
+                self.logger.debug("Sent {} bytes to client {}", len(message), client_id)
             except Exception as e:
                 self.logger.debug(f"Error sending binary to client {client_id}: {e}")
 
@@ -96,10 +98,7 @@ class MessageRouter:
 
     async def broadcast(self, message: str):
         """Broadcast text message to all clients."""
-        client_ids = set(self.registry.client_input_connections.keys()) | set(
-            self.registry.client_output_connections.keys()
-        )
-        for client_id in client_ids:
+        for client_id in self.registry.client_ids():
             connection = self._get_outbound_client(client_id)
             if client_id not in self.closing_clients:
                 try:
@@ -115,20 +114,19 @@ class MessageRouter:
         """Convert raw audio to Protobuf frame and send to Pipecat."""
         if client_id in self.closing_clients:
             self.logger.debug(
-                f"Skipping send to Pipecat for closing client {client_id}"
+                "Skipping send to Pipecat for closing client {}", client_id
             )
             return
 
         pipecat = self.registry.get_pipecat(client_id)
         if pipecat:
-            self.logger.info(
-                f"[AUDIO ROUTING] Forwarding {len(message)} bytes to Pipecat for {client_id[:8]}..."
-            )
             try:
                 serialized_frame = self.converter.raw_to_protobuf(message)
                 await pipecat.send_bytes(serialized_frame)
                 self.logger.debug(
-                    f"Forwarded audio frame ({len(message)} bytes) to Pipecat for client {client_id}"
+                    "[AUDIO ROUTING] Forwarded audio frame ({} bytes) to Pipecat for client {}",
+                    len(message),
+                    client_id,
                 )
             except Exception as e:
                 # Check for connection closed errors specifically
@@ -144,27 +142,43 @@ class MessageRouter:
                 f"[AUDIO ROUTING] No Pipecat connection found for {client_id[:8]}..."
             )
 
+    async def send_to_pipecat_batch(self, chunks: List[bytes], client_id: str):
+        """Send a burst of raw audio chunks to Pipecat as a single frame."""
+        if not chunks:
+            return
+        message = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        await self.send_to_pipecat(message, client_id)
+
     async def send_from_pipecat(self, message: bytes, client_id: str):
         """Extract audio from Protobuf frame and send to client."""
         if client_id in self.closing_clients:
             self.logger.debug(
-                f"Skipping send from Pipecat for closing client {client_id}"
+                "Skipping send from Pipecat for closing client {}", client_id
+            )
+            return
+
+        audio_data = self.converter.protobuf_to_raw(message)
+        if audio_data:
+            await self.send_audio_from_pipecat(audio_data, client_id)
+
+    async def send_audio_from_pipecat(self, audio_data: bytes, client_id: str):
+        """Send raw audio already extracted from a Pipecat frame to the client."""
+        if client_id in self.closing_clients:
+            self.logger.debug(
+                "Skipping send from Pipecat for closing client {}", client_id
             )
             return
 
         targets = self._get_outbound_targets(client_id)
         if targets:
-            self.logger.info(
-                f"[AUDIO ROUTING] Received {len(message)} bytes from Pipecat for {client_id[:8]}..."
-            )
             try:
-                audio_data = self.converter.protobuf_to_raw(message)
-                if audio_data:
-                    for target in targets:
-                        await target.send_bytes(audio_data)
-                    self.logger.debug(
-                        f"Forwarded audio ({len(audio_data)} bytes) from Pipecat to client {client_id}"
-                    )
+                for target in targets:
+                    await target.send_bytes(audio_data)
+                self.logger.debug(
+                    "[AUDIO ROUTING] Forwarded audio ({} bytes) from Pipecat to client {}",
+                    len(audio_data),
+                    client_id,
+                )
             except Exception as e:
                 # Check for connection closed errors specifically
                 if "close" in str(e).lower() or "closed" in str(e).lower():
@@ -2,26 +2,68 @@
 
 In-memory session storage for the Alpha release.
 Future: Replace with database (PostgreSQL, Redis).
+
+Sessions are held as live model objects, so store reads and writes do no
+serialisation. A persistent backend should encode with Session.model_dump_json()
+and decode with Session.model_validate_json(), which run in pydantic-core,
+rather than going through dicts and the stdlib json module.
 """
 
 import asyncio
+import sys
+from bisect import bisect_left, insort
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+import orjson
 from fastapi import WebSocket
 
-from app.models import Session, SessionSummary
+from app.models import Session, SessionStatus, SessionSummary
 from core.balance_tracker import BalanceTracker
 from core.intervention_engine import InterventionEngine, InterventionType
+from meetingbaas_pipecat.utils.logger import logger
 
 # In-memory session storage (Alpha)
 # Maps session_id -> Session object
 SESSION_STORE: Dict[str, Session] = {}
 
+# Keyset index for paginated listing, kept sorted ascending
+# Maps to (created_at, session_id) pairs; newest sessions sit at the end
+SESSION_INDEX: List[Tuple[str, str]] = []
+
+# Per-status keyset index: status -> sorted (created_at, session_id) pairs
+SESSION_STATUS_INDEX: Dict[str, List[Tuple[str, str]]] = {}
+
+# Status each session is currently filed under in SESSION_STATUS_INDEX
+SESSION_INDEXED_STATUS: Dict[str, str] = {}
+
+# Invite token lookup index
+# Maps invite_token -> session_id (tokens never change for a session)
+INVITE_TOKEN_INDEX: Dict[str, str] = {}
+
 # Session events for WebSocket broadcast
-# Maps session_id -> list of connected WebSockets
-SESSION_EVENTS: Dict[str, List[WebSocket]] = {}
+# Maps session_id -> connected WebSockets; entries are removed by
+# unregister_event_connection when the handler exits or hits its idle timeout
+SESSION_EVENTS: Dict[str, Set[WebSocket]] = {}
+
+# Outbound event queue per session-events connection, drained by a writer task
+EVENT_OUTBOXES: Dict[WebSocket, asyncio.Queue] = {}
+_EVENT_WRITERS: Dict[WebSocket, "asyncio.Task[None]"] = {}
+
+# Closes of stalled event sockets, referenced so they aren't garbage collected
+_EVENT_CLOSE_TASKS: Set["asyncio.Task[None]"] = set()
+
+# How long an event waits for others to share its WebSocket frame
+EVENT_COALESCE_SECONDS = 0.005
+
+# Most encoded events an outbox holds; a client that falls this far behind
+# is disconnected and recovers by reconnecting for a fresh session_state
+EVENT_OUTBOX_LIMIT = 256
+
+# Encoded "data" of the initial session_state event, reused across connects
+# Maps session_id -> (Session it was built from, JSON bytes); dropped on update
+SESSION_STATE_CACHE: Dict[str, Tuple[Session, bytes]] = {}
 
 # Session summaries storage (Alpha)
 # Maps session_id -> SessionSummary object
@@ -85,10 +127,10 @@ def get_session_by_invite_token(invite_token: str) -> Optional[Session]:
     Returns:
         The Session object if found, None otherwise.
     """
-    for session in SESSION_STORE.values():
-        if session.invite_token == invite_token:
-            return session
-    return None
+    session_id = INVITE_TOKEN_INDEX.get(invite_token)
+    if session_id is None:
+        return None
+    return SESSION_STORE.get(session_id)
 
 
 def get_session_by_client_id(client_id: str) -> Optional[Session]:
@@ -108,7 +150,12 @@ def create_session(session: Session) -> Session:
     Returns:
         The stored Session object.
     """
+    previous = SESSION_STORE.get(session.id)
+    if previous is not None:
+        _unindex_session(previous)
     SESSION_STORE[session.id] = session
+    SESSION_STATE_CACHE.pop(session.id, None)
+    _index_session(session)
     return session
 
 
@@ -125,6 +172,8 @@ def update_session(session_id: str, session: Session) -> Optional[Session]:
     if session_id not in SESSION_STORE:
         return None
     SESSION_STORE[session_id] = session
+    SESSION_STATE_CACHE.pop(session_id, None)
+    _reindex_session_status(session)
     return session
 
 
@@ -138,10 +187,11 @@ def delete_session(session_id: str) -> bool:
         True if the session was deleted, False if not found.
     """
     if session_id in SESSION_STORE:
-        del SESSION_STORE[session_id]
+        _unindex_session(SESSION_STORE.pop(session_id))
         stop_session_timer(session_id)
         stop_balance_tracker(session_id)
         SESSION_BALANCE_METRICS.pop(session_id, None)
+        SESSION_STATE_CACHE.pop(session_id, None)
         # Also cleanup any associated WebSocket connections
         if session_id in SESSION_EVENTS:
             del SESSION_EVENTS[session_id]
@@ -152,21 +202,116 @@ def delete_session(session_id: str) -> bool:
     return False
 
 
-def list_sessions(status: Optional[str] = None) -> List[Session]:
-    """List all sessions, optionally filtered by status.
+def list_sessions(
+    status: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[Session]:
+    """List sessions, optionally filtered by status and paginated by offset.
+
+    The skip phase walks only the (created_at, id) index keys; full Session
+    objects are fetched for the requested window alone.
 
     Args:
         status: Optional status filter (e.g., "draft", "in_progress").
+        limit: Optional maximum number of sessions to return.
+        offset: Number of sessions to skip.
 
     Returns:
         List of Session objects matching the filter, sorted by created_at descending.
     """
-    sessions = list(SESSION_STORE.values())
+    index = SESSION_STATUS_INDEX.get(status, []) if status else SESSION_INDEX
+    # Index is ascending; map the newest-first window onto it
+    end = max(len(index) - offset, 0)
+    start = 0 if limit is None else max(end - limit, 0)
+    ids = [session_id for _, session_id in reversed(index[start:end])]
+    return [SESSION_STORE[session_id] for session_id in ids]
+
+
+def count_sessions(status: Optional[str] = None) -> int:
+    """Count sessions, optionally filtered by status.
+
+    Args:
+        status: Optional status filter (e.g., "draft", "in_progress").
+
+    Returns:
+        Number of sessions matching the filter.
+    """
     if status:
-        sessions = [s for s in sessions if s.status.value == status]
-    # Sort by created_at descending (newest first)
-    sessions.sort(key=lambda s: s.created_at, reverse=True)
-    return sessions
+        return len(SESSION_STATUS_INDEX.get(status, []))
+    return len(SESSION_INDEX)
+
+
+def list_sessions_page(
+    status: Optional[str] = None,
+    limit: int = 20,
+    before: Optional[Tuple[str, str]] = None,
+) -> Tuple[List[Session], bool]:
+    """List one page of sessions using keyset pagination.
+
+    Pages are ordered by (created_at, id) descending. Only the index slice
+    for the requested page is touched, so deep pages cost the same as the
+    first one and no total count is computed.
+
+    Args:
+        status: Optional status filter (e.g., "draft", "in_progress").
+        limit: Maximum number of sessions to return.
+        before: Exclusive (created_at, id) key to resume after, taken from
+            the last session of the previous page.
+
+    Returns:
+        Tuple of (sessions, has_more).
+    """
+    index = SESSION_STATUS_INDEX.get(status, []) if status else SESSION_INDEX
+    end = bisect_left(index, before) if before else len(index)
+    # Fetch one extra key to learn whether another page exists
+    start = max(end - (limit + 1), 0)
+    keys = index[start:end]
+    keys.reverse()
+
+    has_more = len(keys) > limit
+    sessions = [SESSION_STORE[session_id] for _, session_id in keys[:limit]]
+    return sessions, has_more
+
+
+def _index_key(session: Session) -> Tuple[str, str]:
+    return (session.created_at, session.id)
+
+
+def _index_session(session: Session) -> None:
+    INVITE_TOKEN_INDEX[session.invite_token] = session.id
+    key = _index_key(session)
+    insort(SESSION_INDEX, key)
+    status = session.status.value
+    insort(SESSION_STATUS_INDEX.setdefault(status, []), key)
+    SESSION_INDEXED_STATUS[session.id] = status
+
+
+def _unindex_session(session: Session) -> None:
+    INVITE_TOKEN_INDEX.pop(session.invite_token, None)
+    key = _index_key(session)
+    _remove_key(SESSION_INDEX, key)
+    status = SESSION_INDEXED_STATUS.pop(session.id, None)
+    if status is not None:
+        _remove_key(SESSION_STATUS_INDEX.get(status, []), key)
+
+
+def _reindex_session_status(session: Session) -> None:
+    status = session.status.value
+    previous = SESSION_INDEXED_STATUS.get(session.id)
+    if previous == status:
+        return
+    key = _index_key(session)
+    if previous is not None:
+        _remove_key(SESSION_STATUS_INDEX.get(previous, []), key)
+    insort(SESSION_STATUS_INDEX.setdefault(status, []), key)
+    SESSION_INDEXED_STATUS[session.id] = status
+
+
+def _remove_key(index: List[Tuple[str, str]], key: Tuple[str, str]) -> None:
+    position = bisect_left(index, key)
+    if position < len(index) and index[position] == key:
+        del index[position]
 
 
 # =============================================================================
@@ -354,9 +499,14 @@ def get_last_speech_at(session_id: str) -> Optional[datetime]:
 
 
 def _resolve_speaker_id(session_id: str, speaker_label: str) -> Optional[str]:
+    # Labels arrive as fresh strings from Pipecat payloads; interning them and
+    # the mapped participant IDs lets the speaker map and the balance tracker
+    # match keys by identity
+    speaker_label = sys.intern(speaker_label)
     mapping = SESSION_SPEAKER_MAPS.setdefault(session_id, {})
-    if speaker_label in mapping:
-        return mapping[speaker_label]
+    participant_id = mapping.get(speaker_label)
+    if participant_id is not None:
+        return participant_id
 
     session = get_session(session_id)
     if not session:
@@ -365,12 +515,14 @@ def _resolve_speaker_id(session_id: str, speaker_label: str) -> Optional[str]:
     assigned = set(mapping.values())
     for participant in session.participants:
         if participant.id not in assigned:
-            mapping[speaker_label] = participant.id
-            return participant.id
+            participant_id = sys.intern(participant.id)
+            mapping[speaker_label] = participant_id
+            return participant_id
 
     if session.participants:
-        mapping[speaker_label] = session.participants[0].id
-        return mapping[speaker_label]
+        participant_id = sys.intern(session.participants[0].id)
+        mapping[speaker_label] = participant_id
+        return participant_id
 
     return None
 
@@ -391,9 +543,7 @@ def record_speaker_activity(
     if is_speaking:
         SESSION_LAST_SPEECH_AT[session_id] = datetime.utcnow()
 
-    SESSION_IS_SPEAKING[session_id] = any(
-        metrics.is_speaking for metrics in tracker.speakers.values()
-    )
+    SESSION_IS_SPEAKING[session_id] = tracker.is_anyone_speaking()
 
     return tracker
 
@@ -413,15 +563,15 @@ def record_speaker_durations(
     if not tracker:
         return None
 
-    updated = False
+    resolved: Dict[str, int] = {}
     for speaker_label, duration_ms in durations_ms.items():
         participant_id = _resolve_speaker_id(session_id, str(speaker_label))
         if not participant_id:
             continue
-        tracker.add_speaking_duration(participant_id, duration_ms)
-        updated = True
+        resolved[participant_id] = resolved.get(participant_id, 0) + duration_ms
 
-    if updated:
+    if resolved:
+        tracker.add_speaking_durations(resolved)
         SESSION_LAST_SPEECH_AT[session_id] = datetime.utcnow()
 
     return tracker
@@ -472,13 +622,20 @@ def get_balance_metrics(session_id: str) -> Optional[Dict[str, Any]]:
 def register_event_connection(session_id: str, websocket: WebSocket) -> None:
     """Register a WebSocket connection for session events.
 
+    Also starts the connection's outbox writer, so this must be called from
+    the event loop.
+
     Args:
         session_id: The session identifier.
         websocket: The WebSocket connection to register.
     """
     if session_id not in SESSION_EVENTS:
-        SESSION_EVENTS[session_id] = []
-    SESSION_EVENTS[session_id].append(websocket)
+        SESSION_EVENTS[session_id] = set()
+    SESSION_EVENTS[session_id].add(websocket)
+
+    outbox: asyncio.Queue = asyncio.Queue(maxsize=EVENT_OUTBOX_LIMIT)
+    EVENT_OUTBOXES[websocket] = outbox
+    _EVENT_WRITERS[websocket] = asyncio.create_task(_flush_events(websocket, outbox))
 
 
 def unregister_event_connection(session_id: str, websocket: WebSocket) -> None:
@@ -489,10 +646,155 @@ def unregister_event_connection(session_id: str, websocket: WebSocket) -> None:
         websocket: The WebSocket connection to unregister.
     """
     if session_id in SESSION_EVENTS:
+        SESSION_EVENTS[session_id].discard(websocket)
+
+    EVENT_OUTBOXES.pop(websocket, None)
+    writer = _EVENT_WRITERS.pop(websocket, None)
+    if writer is not None:
+        writer.cancel()
+
+
+def encode_event(payload: Any) -> bytes:
+    """Serialize an event (or list of events) to UTF-8 JSON for the wire.
+
+    Naive datetimes are treated as UTC and rendered with a "Z" suffix, so
+    callers can put datetime.utcnow() straight into event payloads.
+    """
+    return orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+
+
+def queue_event(websocket: WebSocket, event: Union[dict, bytes]) -> None:
+    """Queue an event for a registered connection's next outbound frame.
+
+    The event is encoded here rather than in the writer task, so a payload
+    that can't be serialized raises at the call site.
+
+    Args:
+        websocket: A connection registered with register_event_connection.
+        event: The event payload to send, or its already-encoded JSON.
+
+    Raises:
+        TypeError: If the payload can't be serialized to JSON.
+    """
+    if not isinstance(event, bytes):
+        event = encode_event(event)
+
+    outbox = EVENT_OUTBOXES.get(websocket)
+    if outbox is None:
+        return
+
+    try:
+        outbox.put_nowait(event)
+    except asyncio.QueueFull:
+        _drop_stalled_connection(websocket)
+
+
+def _drop_stalled_connection(websocket: WebSocket) -> None:
+    """Stop queueing to a client whose outbox is full and close its socket.
+
+    The handler's receive loop then sees the disconnect and unregisters it.
+    """
+    logger.warning("Session events outbox full; closing stalled connection")
+    EVENT_OUTBOXES.pop(websocket, None)
+    writer = _EVENT_WRITERS.pop(websocket, None)
+    if writer is not None:
+        writer.cancel()
+
+    async def close() -> None:
+        try:
+            await websocket.close(code=1013, reason="Event backlog")
+        except Exception:
+            pass
+
+    task = asyncio.create_task(close())
+    _EVENT_CLOSE_TASKS.add(task)
+    task.add_done_callback(_EVENT_CLOSE_TASKS.discard)
+
+
+async def _flush_events(websocket: WebSocket, outbox: asyncio.Queue) -> None:
+    """Send queued events, coalescing those queued close together.
+
+    A lone event is sent as a JSON object; several events queued within
+    EVENT_COALESCE_SECONDS of each other go out as one JSON array frame.
+    Frames are binary: the UTF-8 JSON from orjson goes out as-is, without
+    a round trip through str. queue_event only enqueues encoded bytes, so
+    nothing here can fail on a bad payload.
+    """
+    while True:
+        parts = [await outbox.get()]
+        await asyncio.sleep(EVENT_COALESCE_SECONDS)
+        while not outbox.empty():
+            parts.append(outbox.get_nowait())
+
         try:
-            SESSION_EVENTS[session_id].remove(websocket)
-        except ValueError:
-            pass  # WebSocket not in list
+            await websocket.send_bytes(
+                parts[0] if len(parts) == 1 else b"[" + b",".join(parts) + b"]"
+            )
+        except Exception:
+            # Connection closed, will be cleaned up on disconnect
+            return
+
+
+def session_state_event(session: Session) -> bytes:
+    """Build the encoded session_state event sent to newly connected clients.
+
+    The event data is cached per session until the session is next written
+    through create_session/update_session; only the timestamp is fresh.
+
+    Args:
+        session: The session to describe.
+
+    Returns:
+        The session_state event as UTF-8 JSON.
+    """
+    cached = SESSION_STATE_CACHE.get(session.id)
+    if cached is not None and cached[0] is session:
+        data = cached[1]
+    else:
+        facilitator_paused = session.status == SessionStatus.PAUSED
+        if facilitator_paused:
+            ai_status = "paused"
+        elif session.status == SessionStatus.IN_PROGRESS:
+            ai_status = "listening"
+        else:
+            ai_status = "idle"
+
+        data = encode_event(
+            {
+                "status": session.status.value,
+                "goal": session.goal,
+                "durationMinutes": session.duration_minutes,
+                "participants": [
+                    {
+                        "id": p.id,
+                        "name": p.name,
+                        "role": p.role,
+                        "consented": p.consented,
+                    }
+                    for p in session.participants
+                ],
+                "facilitatorConfig": {
+                    "persona": session.facilitator.persona.value,
+                    "interruptAuthority": session.facilitator.interrupt_authority,
+                    "directInquiry": session.facilitator.direct_inquiry,
+                    "silenceDetection": session.facilitator.silence_detection,
+                },
+                "botId": session.bot_id,
+                "clientId": session.client_id,
+                "facilitatorPaused": facilitator_paused,
+                "aiStatus": ai_status,
+            }
+        )
+        SESSION_STATE_CACHE[session.id] = (session, data)
+
+    timestamp = encode_event(datetime.utcnow())
+    return (
+        b'{"type":"session_state","data":'
+        + data
+        + b',"timestamp":'
+        + timestamp
+        + b"}"
+    )
 
 
 def get_event_connections(session_id: str) -> List[WebSocket]:
@@ -504,7 +806,7 @@ def get_event_connections(session_id: str) -> List[WebSocket]:
     Returns:
         List of WebSocket connections for the session.
     """
-    return SESSION_EVENTS.get(session_id, [])
+    return list(SESSION_EVENTS.get(session_id, ()))
 
 
 async def broadcast_session_event(
@@ -517,20 +819,20 @@ async def broadcast_session_event(
         event_type: The type of event (e.g., "session_state", "balance_update").
         data: The event data to broadcast.
     """
-    from datetime import datetime
-
     connections = get_event_connections(session_id)
-    event = {
-        "type": event_type,
-        "data": data,
-        "timestamp": datetime.utcnow().isoformat(),
-    }
+    if not connections:
+        return
+
+    # Encoded once for every connection; raises here if data can't serialize
+    event = encode_event(
+        {
+            "type": event_type,
+            "data": data,
+            "timestamp": datetime.utcnow(),
+        }
+    )
     for ws in connections:
-        try:
-            await ws.send_json(event)
-        except Exception:
-            # Connection closed, will be cleaned up on disconnect
-            pass
+        queue_event(ws, event)
 
 
 # =============================================================================
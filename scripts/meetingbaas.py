@@ -620,8 +620,19 @@ if __name__ == "__main__":
     parser.add_argument("--persona-data-json", help="Persona data as JSON string")
     parser.add_argument("--api-key", help="API key for authentication")
     parser.add_argument("--meetingbaas-bot-id", help="MeetingBaas bot ID")
+    parser.add_argument(
+        "--await-config",
+        action="store_true",
+        help="Prewarm, then read the remaining arguments as a JSON list from stdin",
+    )
 
     args = parser.parse_args()
+    if args.await_config:
+        # Pooled worker: imports are done, wait for a client to be assigned
+        config_line = sys.stdin.readline()
+        if not config_line:
+            sys.exit(0)
+        args = parser.parse_args(json.loads(config_line))
 
     # Parse persona data JSON if provided
     persona_name = args.persona_name
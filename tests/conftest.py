@@ -13,20 +13,48 @@ def reset_session_store():
     """Reset session store before each test."""
     # Import and clear the session store
     try:
-        from core.session_store import SESSION_STORE, SESSION_EVENTS, SESSION_SUMMARIES
+        from core.session_store import (
+            SESSION_STORE,
+            SESSION_EVENTS,
+            SESSION_SUMMARIES,
+            SESSION_INDEX,
+            SESSION_STATUS_INDEX,
+            SESSION_INDEXED_STATUS,
+            INVITE_TOKEN_INDEX,
+            SESSION_STATE_CACHE,
+        )
 
         SESSION_STORE.clear()
         SESSION_EVENTS.clear()
         SESSION_SUMMARIES.clear()
+        SESSION_INDEX.clear()
+        SESSION_STATUS_INDEX.clear()
+        SESSION_INDEXED_STATUS.clear()
+        INVITE_TOKEN_INDEX.clear()
+        SESSION_STATE_CACHE.clear()
     except ImportError:
         pass
     yield
     # Cleanup after test
     try:
-        from core.session_store import SESSION_STORE, SESSION_EVENTS, SESSION_SUMMARIES
+        from core.session_store import (
+            SESSION_STORE,
+            SESSION_EVENTS,
+            SESSION_SUMMARIES,
+            SESSION_INDEX,
+            SESSION_STATUS_INDEX,
+            SESSION_INDEXED_STATUS,
+            INVITE_TOKEN_INDEX,
+            SESSION_STATE_CACHE,
+        )
 
         SESSION_STORE.clear()
         SESSION_EVENTS.clear()
         SESSION_SUMMARIES.clear()
+        SESSION_INDEX.clear()
+        SESSION_STATUS_INDEX.clear()
+        SESSION_INDEXED_STATUS.clear()
+        INVITE_TOKEN_INDEX.clear()
+        SESSION_STATE_CACHE.clear()
     except ImportError:
         pass
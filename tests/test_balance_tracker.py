@@ -0,0 +1,84 @@
+"""Unit tests for the conversation balance tracker.
+
+Tests the cached decision in BalanceTracker.check_intervention_trigger:
+- Reuse within a tick and invalidation on speaker changes
+- Imbalance thresholds crossed inside a tick
+- Agreement with evaluating on every call
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+import core.balance_tracker as balance_tracker
+from core.balance_tracker import BalanceTracker
+
+START_MS = 1_000_000
+
+
+@pytest.fixture
+def clock():
+    """Patch the tracker's millisecond clock with a settable value."""
+    now = [START_MS]
+    with patch.object(balance_tracker, "_now_ms", lambda: now[0]):
+        yield now
+
+
+def _imbalanced_tracker() -> BalanceTracker:
+    """Create a tracker at 90/10 whose imbalance timers start now."""
+    tracker = BalanceTracker("cache-session")
+    tracker.add_speaking_duration("a", 9000)
+    tracker.add_speaking_duration("b", 1000)
+    assert tracker.check_intervention_trigger() is None
+    assert tracker.imbalance_start == START_MS
+    return tracker
+
+
+class TestBalanceTriggerCache:
+    """Tests for the cached decision in BalanceTracker.check_intervention_trigger."""
+
+    def test_decision_reused_within_tick(self, clock):
+        """Away from a threshold, the decision is reused for the whole tick."""
+        tracker = _imbalanced_tracker()
+        clock[0] += 60_000
+        assert tracker.check_intervention_trigger() is None
+
+        # A reused decision doesn't recompute the balance
+        with patch.object(tracker, "get_balance", side_effect=AssertionError):
+            clock[0] += tracker.TRIGGER_CHECK_TICK_MS - 1
+            assert tracker.check_intervention_trigger() is None
+
+    def test_speaker_change_invalidates_decision(self, clock):
+        """A speaker state change re-evaluates within the same tick."""
+        tracker = _imbalanced_tracker()
+        tracker.check_intervention_trigger()
+
+        tracker.add_speaking_duration("b", 8000)
+        assert tracker.check_intervention_trigger() is None
+        assert tracker.imbalance_start is None
+
+    def test_threshold_crossed_mid_tick(self, clock):
+        """Crossing a threshold inside a tick isn't hidden by the cache."""
+        tracker = _imbalanced_tracker()
+        boundary = START_MS + tracker.MILD_IMBALANCE_DURATION_MS
+
+        clock[0] = boundary
+        assert tracker.check_intervention_trigger() is None
+
+        clock[0] = boundary + tracker.TRIGGER_CHECK_TICK_MS // 2
+        assert tracker.check_intervention_trigger() == "balance"
+
+    def test_matches_uncached_evaluation(self, clock):
+        """Cached checks agree with evaluating on every call."""
+        cached = _imbalanced_tracker()
+        uncached = _imbalanced_tracker()
+
+        # Steps shorter than a tick, past both thresholds; passing a balance
+        # in always evaluates
+        for _ in range(2500):
+            clock[0] += 137
+            assert cached.check_intervention_trigger() == (
+                uncached.check_intervention_trigger(uncached.get_balance())
+            ), clock[0]
+            assert cached.imbalance_start == uncached.imbalance_start
+            assert cached.severe_imbalance_start == uncached.severe_imbalance_start
@@ -0,0 +1,172 @@
+"""Unit tests for the intervention engine.
+
+Tests the fast gate at the top of InterventionEngine.evaluate:
+- Quiet start and blocker vetoes
+- Time warnings and silence prompts that must pass the gate
+- Duration timer state compared with evaluating every check
+"""
+
+import itertools
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from core.intervention_engine import InterventionEngine, InterventionType
+
+
+def _engine(**config):
+    """Create a 30 minute engine and return it with its start on the monotonic clock."""
+    start = time.monotonic()
+    engine = InterventionEngine(
+        "gate-session",
+        datetime.utcnow(),
+        session_duration_minutes=30,
+        facilitator_config=config,
+    )
+    return engine, start
+
+
+class TestInterventionEvaluateGate:
+    """Tests for the fast gate at the top of InterventionEngine.evaluate."""
+
+    def test_quiet_start_returns_none_and_starts_timers(self):
+        """Nothing fires in the first minutes, but duration timers still run."""
+        engine, start = _engine()
+        now = start + 60
+
+        result = engine.evaluate(
+            "severe_imbalance", tension_score=0.9, is_on_goal=False, now=now
+        )
+
+        assert result is None
+        assert engine.tension_start == now
+        assert engine.goal_drift_start == now
+
+    def test_blocked_returns_none_and_resets_timers(self):
+        """A paused engine returns None and clears timers whose cause is gone."""
+        engine, start = _engine()
+        now = start + 600
+        engine.tension_start = now - 40
+        engine.goal_drift_start = now - 200
+        engine.pause()
+
+        result = engine.evaluate("severe_imbalance", now=now)
+
+        assert result is None
+        assert engine.tension_start is None
+        assert engine.goal_drift_start is None
+
+    def test_due_time_warning_passes_gate(self):
+        """A balanced, quiet tick still sends a time warning that is due."""
+        engine, start = _engine()
+        now = start + 30 * 60 - 250
+
+        result = engine.evaluate("balanced", now=now)
+
+        assert result is not None
+        assert result.type == InterventionType.TIME_WARNING
+
+        # Sent once: with cooldowns cleared, the next tick is gated out
+        engine.last_intervention = None
+        engine.last_intervention_by_type.clear()
+        assert engine.evaluate("balanced", now=now + 1) is None
+
+    def test_silence_passes_gate_only_with_detection(self):
+        """Long silence triggers a prompt only when silence detection is on."""
+        silence = timedelta(seconds=20)
+
+        engine, start = _engine(silence_detection=True)
+        result = engine.evaluate(
+            "balanced", silence_duration=silence, now=start + 600
+        )
+        assert result is not None
+        assert result.type == InterventionType.SILENCE
+
+        engine, start = _engine(silence_detection=False)
+        assert (
+            engine.evaluate("balanced", silence_duration=silence, now=start + 600)
+            is None
+        )
+
+    def test_tension_timer_near_boundary(self):
+        """Escalation fires exactly when tension has lasted TENSION_DURATION."""
+        engine, start = _engine()
+        now = start + 600
+        tension_s = engine.TENSION_DURATION.total_seconds()
+        engine.tension_start = now - tension_s + 0.01
+
+        assert engine.evaluate("balanced", tension_score=0.9, now=now) is None
+        assert engine.tension_start == now - tension_s + 0.01
+
+        result = engine.evaluate("balanced", tension_score=0.9, now=now + 0.01)
+        assert result is not None
+        assert result.type == InterventionType.ESCALATION
+
+    def test_gate_matches_ungated_evaluation(self):
+        """Gated and ungated evaluation agree on result and timer state."""
+        cases = itertools.product(
+            (60, 600, 30 * 60 - 250),  # quiet start, mid-session, warning due
+            (False, True),  # paused
+            (None, 10),  # seconds since last intervention (inside cooldown)
+            ("balanced", "mild_imbalance", "severe_imbalance"),
+            (0.0, 0.9),  # tension score
+            (None, 29.99, 40),  # seconds since tension_start
+            (True, False),  # on goal
+            (None, 200),  # seconds since goal_drift_start
+            (None, timedelta(seconds=5), timedelta(seconds=20)),  # silence
+            (False, True),  # silence detection
+        )
+        for case in cases:
+            (
+                elapsed,
+                paused,
+                since_last,
+                status,
+                tension,
+                since_tension,
+                on_goal,
+                since_drift,
+                silence,
+                detection,
+            ) = case
+
+            # Both engines start within microseconds of each other, far from
+            # any threshold, so they share one reading of the clock
+            (gated, _), (ungated, _) = engines = [
+                _engine(silence_detection=detection) for _ in range(2)
+            ]
+            now = engines[0][1] + elapsed
+            for engine, _ in engines:
+                if paused:
+                    engine.pause()
+                if since_last is not None:
+                    engine.last_intervention = now - since_last
+                if since_tension is not None:
+                    engine.tension_start = now - since_tension
+                if since_drift is not None:
+                    engine.goal_drift_start = now - since_drift
+
+            kwargs = dict(
+                silence_duration=silence,
+                tension_score=tension,
+                is_on_goal=on_goal,
+                now=now,
+            )
+            results = [gated.evaluate(status, **kwargs)]
+            with patch.object(
+                InterventionEngine, "_can_skip_checks", return_value=False
+            ):
+                results.append(ungated.evaluate(status, **kwargs))
+
+            states = [
+                (
+                    result.type if result else None,
+                    engine.tension_start,
+                    engine.goal_drift_start,
+                    engine.silence_start,
+                    engine.last_intervention,
+                    engine.intervention_count,
+                )
+                for engine, result in zip((gated, ungated), results)
+            ]
+            assert states[0] == states[1], case
@@ -170,6 +170,46 @@ class TestSessionCRUD:
         for session in data["sessions"]:
             assert session["status"] == "pending_consent"
 
+    @pytest.mark.asyncio
+    async def test_list_sessions_cursor_pagination(self, client):
+        """Test walking session pages with nextCursor."""
+        created_ids = []
+        for i in range(3):
+            create_response = await client.post(
+                "/sessions",
+                json={
+                    "partner_name": f"Partner {i}",
+                    "goal": "Test goal",
+                    "relationship_context": "Test context",
+                    "facilitator": {"persona": "neutral_mediator"},
+                    "duration_minutes": 30,
+                    "platform": "diadi",
+                },
+                headers=HEADERS,
+            )
+            assert create_response.status_code == 201
+            created_ids.append(create_response.json()["id"])
+
+        first = (await client.get("/sessions?limit=2", headers=HEADERS)).json()
+        assert len(first["sessions"]) == 2
+        assert first["hasMore"] is True
+        assert first["nextCursor"]
+
+        second = (
+            await client.get(
+                f"/sessions?limit=2&cursor={first['nextCursor']}", headers=HEADERS
+            )
+        ).json()
+        assert len(second["sessions"]) == 1
+        assert second["hasMore"] is False
+        assert second["nextCursor"] is None
+
+        seen = [s["id"] for s in first["sessions"] + second["sessions"]]
+        assert sorted(seen) == sorted(created_ids)
+
+        bad = await client.get("/sessions?cursor=not-a-cursor", headers=HEADERS)
+        assert bad.status_code == 400
+
     @pytest.mark.asyncio
     async def test_get_session_by_id(self, client):
         """Test getting a session by ID."""
@@ -320,6 +360,51 @@ class TestInviteAndConsent:
         consent_data = consent_response.json()
         assert consent_data["status"] == "archived"
 
+    @pytest.mark.asyncio
+    async def test_create_and_consent_write_store_once(self, client):
+        """Test that create and consent each persist the session at most once."""
+        from app.services import session_service as service_module
+
+        with patch.object(
+            service_module,
+            "store_create_session",
+            wraps=service_module.store_create_session,
+        ) as create_write, patch.object(
+            service_module,
+            "store_update_session",
+            wraps=service_module.store_update_session,
+        ) as update_write:
+            create_response = await client.post(
+                "/sessions",
+                json={
+                    "partner_name": "Test Partner",
+                    "goal": "Test goal",
+                    "relationship_context": "Test context",
+                    "facilitator": {"persona": "neutral_mediator"},
+                    "duration_minutes": 30,
+                    "platform": "diadi",
+                },
+                headers=HEADERS,
+            )
+            assert create_response.status_code == 201
+            assert create_write.call_count + update_write.call_count <= 1
+
+            data = create_response.json()
+            create_write.reset_mock()
+            update_write.reset_mock()
+
+            consent_response = await client.post(
+                f"/sessions/{data['id']}/consent",
+                json={
+                    "invite_token": data["invite_token"],
+                    "invitee_name": "Partner Name",
+                    "consented": True,
+                },
+                headers=HEADERS,
+            )
+            assert consent_response.status_code == 200
+            assert create_write.call_count + update_write.call_count <= 1
+
     @pytest.mark.asyncio
     async def test_record_consent_invalid_token(self, client):
         """Test recording consent with invalid invite token."""
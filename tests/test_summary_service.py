@@ -0,0 +1,59 @@
+"""Unit tests for the summary service.
+
+Tests the scanner that surfaces summary fields while the LLM reply streams:
+- Keys are matched only at the top level of the reply object
+- Values are reported once, as soon as they complete
+"""
+
+import json
+
+from app.services.summary_service import (
+    STREAMED_SUMMARY_FIELDS,
+    _TopLevelFieldScanner,
+)
+
+
+def _stream(text: str, chunk_size: int):
+    """Feed text to a scanner in chunks and collect what it reports."""
+    scanner = _TopLevelFieldScanner(STREAMED_SUMMARY_FIELDS)
+    buffer = ""
+    reported = []
+    for start in range(0, len(text), chunk_size):
+        buffer += text[start : start + chunk_size]
+        reported.extend(scanner.scan(buffer))
+    return reported
+
+
+class TestTopLevelFieldScanner:
+    """Tests for _TopLevelFieldScanner."""
+
+    def test_key_inside_string_value_is_ignored(self):
+        """A key name quoted inside an earlier value doesn't match."""
+        summary = {
+            "consensus_summary": 'They agreed on "action_items": ["nothing"]',
+            "action_items": ["Send the draft", "Book a follow-up"],
+        }
+        text = json.dumps(summary)
+
+        for chunk_size in (1, 3, len(text)):
+            assert _stream(text, chunk_size) == list(summary.items())
+
+    def test_nested_key_is_ignored(self):
+        """A wanted key inside a nested object isn't reported."""
+        summary = {
+            "key_agreements": [{"action_items": "nested", "title": "Budget"}],
+            "action_items": [],
+        }
+
+        assert _stream(json.dumps(summary, indent=2), 5) == list(summary.items())
+
+    def test_value_reported_once_as_soon_as_complete(self):
+        """A finished value is reported before the object closes, and only once."""
+        scanner = _TopLevelFieldScanner(STREAMED_SUMMARY_FIELDS)
+        buffer = '{"action_items": ["a", "b"'
+
+        assert scanner.scan(buffer) == []
+        buffer += "]"
+        assert scanner.scan(buffer) == [("action_items", ["a", "b"])]
+        buffer += ', "action_items": ["c"]}'
+        assert scanner.scan(buffer) == []
@@ -84,7 +84,9 @@ class TestWebSocketSessionEvents:
                 app,
             ) as ws:
                 # Should receive initial session state
-                message = await asyncio.wait_for(ws.receive_json(), timeout=5.0)
+                message = await asyncio.wait_for(
+                    ws.receive_json(mode="binary"), timeout=5.0
+                )
 
                 assert message["type"] == "session_state"
                 assert "data" in message
@@ -108,13 +110,15 @@ class TestWebSocketSessionEvents:
                 app,
             ) as ws:
                 # Receive initial state
-                await ws.receive_json()
+                await ws.receive_json(mode="binary")
 
                 # Send ping
                 await ws.send_json({"type": "ping"})
 
                 # Should receive pong
-                message = await asyncio.wait_for(ws.receive_json(), timeout=5.0)
+                message = await asyncio.wait_for(
+                    ws.receive_json(mode="binary"), timeout=5.0
+                )
                 assert message["type"] == "pong"
 
     @pytest.mark.asyncio
@@ -131,7 +135,7 @@ class TestWebSocketSessionEvents:
                 app,
             ) as ws:
                 # Receive initial state
-                await ws.receive_json()
+                await ws.receive_json(mode="binary")
 
                 # Send settings update with data envelope
                 settings_payload = {"silence_detection": False}
@@ -142,7 +146,9 @@ class TestWebSocketSessionEvents:
                     }
                 )
 
-                message = await asyncio.wait_for(ws.receive_json(), timeout=5.0)
+                message = await asyncio.wait_for(
+                    ws.receive_json(mode="binary"), timeout=5.0
+                )
                 assert message["type"] == "settings_updated"
                 assert message["data"] == settings_payload
 
@@ -162,7 +168,7 @@ class TestWebSocketSessionEvents:
                     "http://test/sessions/nonexistent/events",
                     app,
                 ) as ws:
-                    await ws.receive_json()
+                    await ws.receive_json(mode="binary")
 
             assert exc_info.value.code == 4004
 
@@ -177,6 +183,7 @@ class TestBalanceUpdateEvents:
             create_session,
             register_event_connection,
             broadcast_session_event,
+            EVENT_COALESCE_SECONDS,
             SESSION_EVENTS,
         )
         from app.models import (
@@ -213,7 +220,7 @@ class TestBalanceUpdateEvents:
 
         # Create mock WebSocket
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_bytes = AsyncMock()
 
         # Register the mock connection
         register_event_connection(session.id, mock_ws)
@@ -229,9 +236,12 @@ class TestBalanceUpdateEvents:
             },
         )
 
+        # Events are flushed after the coalescing window
+        await asyncio.sleep(EVENT_COALESCE_SECONDS * 4)
+
         # Verify broadcast was called
-        mock_ws.send_json.assert_called_once()
-        call_args = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_bytes.assert_called_once()
+        call_args = json.loads(mock_ws.send_bytes.call_args[0][0])
         assert call_args["type"] == "balance_update"
         assert call_args["data"]["status"] == "mild_imbalance"
 
@@ -246,6 +256,7 @@ class TestInterventionEvents:
             create_session,
             register_event_connection,
             broadcast_session_event,
+            EVENT_COALESCE_SECONDS,
         )
         from app.models import (
             Session,
@@ -281,7 +292,7 @@ class TestInterventionEvents:
 
         # Create mock WebSocket
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_bytes = AsyncMock()
 
         # Register connection
         register_event_connection(session.id, mock_ws)
@@ -299,9 +310,12 @@ class TestInterventionEvents:
             },
         )
 
+        # Events are flushed after the coalescing window
+        await asyncio.sleep(EVENT_COALESCE_SECONDS * 4)
+
         # Verify
-        mock_ws.send_json.assert_called_once()
-        call_args = mock_ws.send_json.call_args[0][0]
+        mock_ws.send_bytes.assert_called_once()
+        call_args = json.loads(mock_ws.send_bytes.call_args[0][0])
         assert call_args["type"] == "intervention"
         assert call_args["data"]["type"] == "balance"
         assert call_args["data"]["priority"] == "medium"
@@ -317,6 +331,7 @@ class TestSessionStateEvents:
             create_session,
             register_event_connection,
             broadcast_session_event,
+            EVENT_COALESCE_SECONDS,
         )
         from app.models import (
             Session,
@@ -347,7 +362,7 @@ class TestSessionStateEvents:
         create_session(session)
 
         mock_ws = AsyncMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_bytes = AsyncMock()
         register_event_connection(session.id, mock_ws)
 
         # Broadcast pause event
@@ -357,12 +372,84 @@ class TestSessionStateEvents:
             {"facilitatorPaused": True},
         )
 
-        mock_ws.send_json.assert_called_once()
-        call_args = mock_ws.send_json.call_args[0][0]
+        # Events are flushed after the coalescing window
+        await asyncio.sleep(EVENT_COALESCE_SECONDS * 4)
+        mock_ws.send_bytes.assert_called_once()
+        call_args = json.loads(mock_ws.send_bytes.call_args[0][0])
         assert call_args["type"] == "session_state"
         assert call_args["data"]["facilitatorPaused"] is True
 
 
+class TestEventOutbox:
+    """Tests for the per-connection event outbox and writer."""
+
+    @pytest.mark.asyncio
+    async def test_events_coalesce_into_binary_array_frame(self):
+        """Events queued together go out as one binary JSON array frame."""
+        from core.session_store import (
+            register_event_connection,
+            unregister_event_connection,
+            broadcast_session_event,
+            queue_event,
+            EVENT_COALESCE_SECONDS,
+        )
+        from unittest.mock import AsyncMock
+
+        mock_ws = AsyncMock()
+        register_event_connection("outbox-session", mock_ws)
+        try:
+            await broadcast_session_event(
+                "outbox-session", "balance_update", {"status": "balanced"}
+            )
+            queue_event(mock_ws, {"type": "pong"})
+            await asyncio.sleep(EVENT_COALESCE_SECONDS * 4)
+
+            mock_ws.send_bytes.assert_called_once()
+            mock_ws.send_text.assert_not_called()
+            frame = mock_ws.send_bytes.call_args[0][0]
+            assert isinstance(frame, bytes)
+            events = json.loads(frame)
+            assert [event["type"] for event in events] == ["balance_update", "pong"]
+            assert events[0]["data"] == {"status": "balanced"}
+            assert events[0]["timestamp"].endswith("Z")
+
+            # A lone event is sent as a single object
+            queue_event(mock_ws, {"type": "pong"})
+            await asyncio.sleep(EVENT_COALESCE_SECONDS * 4)
+            assert json.loads(mock_ws.send_bytes.call_args[0][0]) == {"type": "pong"}
+        finally:
+            unregister_event_connection("outbox-session", mock_ws)
+
+    @pytest.mark.asyncio
+    async def test_unserializable_event_raises_at_call_site(self):
+        """A bad payload raises when queued and doesn't stall later events."""
+        from core.session_store import (
+            register_event_connection,
+            unregister_event_connection,
+            broadcast_session_event,
+            EVENT_COALESCE_SECONDS,
+        )
+        from unittest.mock import AsyncMock
+
+        mock_ws = AsyncMock()
+        register_event_connection("outbox-session", mock_ws)
+        try:
+            with pytest.raises(TypeError):
+                await broadcast_session_event(
+                    "outbox-session", "balance_update", {"n": 2**70}
+                )
+
+            await broadcast_session_event(
+                "outbox-session", "balance_update", {"n": 2}
+            )
+            await asyncio.sleep(EVENT_COALESCE_SECONDS * 4)
+
+            mock_ws.send_bytes.assert_called_once()
+            assert json.loads(mock_ws.send_bytes.call_args[0][0])["data"] == {"n": 2}
+        finally:
+            unregister_event_connection("outbox-session", mock_ws)
+
+
 # Run tests if executed directly
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--asyncio-mode=auto"])
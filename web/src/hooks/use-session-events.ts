@@ -32,6 +32,9 @@ const MAX_RECONNECT_ATTEMPTS = 5;
 /** Heartbeat interval (30 seconds) to keep connection alive */
 const HEARTBEAT_INTERVAL = 30000;
 
+/** Events arrive as UTF-8 JSON in binary frames */
+const eventDecoder = new TextDecoder();
+
 // =============================================================================
 // Types
 // =============================================================================
@@ -218,6 +221,7 @@ export function useSessionEvents(
 
     try {
       const ws = new WebSocket(wsUrl);
+      ws.binaryType = 'arraybuffer';
       wsRef.current = ws;
 
       ws.onopen = () => {
@@ -265,14 +269,20 @@ export function useSessionEvents(
 
       ws.onmessage = (event) => {
         try {
-          const data = JSON.parse(event.data) as SessionEvent;
-
-          // Handle pong response (ignore, just for keepalive)
-          if (data.type === 'pong' as SessionEvent['type']) {
-            return;
+          // Events queued close together arrive batched in a single array frame
+          const text =
+            typeof event.data === 'string' ? event.data : eventDecoder.decode(event.data);
+          const parsed = JSON.parse(text) as SessionEvent | SessionEvent[];
+          const events = Array.isArray(parsed) ? parsed : [parsed];
+
+          for (const data of events) {
+            // Handle pong response (ignore, just for keepalive)
+            if (data.type === 'pong' as SessionEvent['type']) {
+              continue;
+            }
+
+            routeEvent(data);
           }
-
-          routeEvent(data);
         } catch (err) {
           console.error('[useSessionEvents] Failed to parse message:', err, event.data);
         }
@@ -19,6 +19,7 @@ export type SessionEventType =
   | 'goal_drift'
   | 'participant_status'
   | 'ai_status'
+  | 'summary_partial'
   | 'error';
 
 // =============================================================================
@@ -82,6 +83,11 @@ export interface GoalDriftData {
   originalGoal: string;
 }
 
+export interface SummaryPartialData {
+  field: 'consensus_summary' | 'action_items' | 'key_agreements';
+  value: unknown;
+}
+
 export interface ErrorData {
   code: string;
   message: string;
@@ -124,6 +130,10 @@ export interface GoalDriftEvent extends SessionEvent<GoalDriftData> {
   type: 'goal_drift';
 }
 
+export interface SummaryPartialEvent extends SessionEvent<SummaryPartialData> {
+  type: 'summary_partial';
+}
+
 export interface ErrorEvent extends SessionEvent<ErrorData> {
   type: 'error';
 }
@@ -141,6 +151,7 @@ export type AnySessionEvent =
   | ParticipantStatusEvent
   | AIStatusEvent
   | GoalDriftEvent
+  | SummaryPartialEvent
   | ErrorEvent;
 
 // =============================================================================